@@ -0,0 +1,70 @@
+"""
+Benchmark: BPlusTree vs BinarySearchTree on memory footprint, lookup latency and range scans.
+
+Memory is the traced allocation of building each structure (tracemalloc), reported as bytes per key.
+The BST is bulk loaded with from_sorted (its fastest build), the B+ tree gets the keys in random order.
+
+Run: python -m benchmarks.bPlusTree --sizes 1000000 10000000 50000000
+"""
+import argparse
+import random
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from templates.bPlusTree import BPlusTree
+from templates.binarySearchTree import BinarySearchTree
+from utils.timing_utils import measure_time
+
+
+def traced_build(build: Callable[[], Any]) -> tuple[Any, int]:
+    """Returns the built structure and the bytes allocated while building it"""
+    tracemalloc.start()
+    structure: Any = build()
+    allocated: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return structure, allocated
+
+
+def lookups(tree: BinarySearchTree | BPlusTree, queries: list[int]) -> int:
+    search = tree.search
+    return sum(1 for q in queries if search(q))
+
+
+def range_scan(tree: BinarySearchTree | BPlusTree, lo: int, hi: int) -> int:
+    return sum(1 for _ in tree.iter_range(lo, hi))
+
+
+def run(sizes: list[int], order: int, queries: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for n in sizes:
+        keys: list[int] = rng.sample(range(n * 4), n)
+        ascending: list[int] = sorted(keys)
+        probes: list[int] = [rng.randrange(n * 4) for _ in range(queries)]
+        print(f"n = {n}, B+ tree order = {order}")
+
+        bst, bst_bytes = traced_build(lambda: BinarySearchTree.from_sorted(ascending))
+        bplus, bplus_bytes = traced_build(lambda: BPlusTree(keys, order=order))
+        print(f"memory: BST = {bst_bytes / n:.1f} bytes/key, B+ tree = {bplus_bytes / n:.1f} bytes/key")
+        assert lookups(bst, probes) == lookups(bplus, probes)
+
+        bst_time: float = measure_time(lookups, bst, probes)
+        bplus_time: float = measure_time(lookups, bplus, probes)
+        print(f"lookups: {bst_time / queries * 1e9:.0f} ns vs {bplus_time / queries * 1e9:.0f} ns per lookup "
+              f"({bst_time / bplus_time:.2f}x)")
+
+        lo, hi = n, n * 3 # half of the key space
+        bst_time = measure_time(range_scan, bst, lo, hi)
+        bplus_time = measure_time(range_scan, bplus, lo, hi)
+        print(f"range scan over half the keys: B+ tree speedup = {bst_time / bplus_time:.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--order", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.order, args.queries, args.seed)
@@ -0,0 +1,54 @@
+"""
+Benchmark: BinarySearchTree(balanced=True) (AVL) vs the plain unbalanced tree on sorted, reversed and random input.
+
+Workload: insert n keys, search every key, delete half of them.
+The plain tree degrades to a linked list on sorted/reversed input (O(n) per operation, O(n^2) overall)
+so it is only run on those orders while n is small enough to finish (see --plain-limit).
+
+Run: python -m benchmarks.balancedBst --sizes 1000 100000 1000000 10000000
+"""
+import argparse
+import random
+
+from templates.binarySearchTree import BinarySearchTree
+from utils.timing_utils import measure_time
+
+
+def bst_workload(keys: list[int], balanced: bool) -> int:
+    tree = BinarySearchTree(keys, balanced=balanced)
+    for k in keys:
+        tree.search(k)
+    for k in keys[::2]:
+        tree.delete(k)
+    return tree.height()
+
+
+def run(sizes: list[int], plain_limit: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for n in sizes:
+        shuffled: list[int] = list(range(n))
+        rng.shuffle(shuffled)
+        orders: dict[str, list[int]] = {
+            "sorted": list(range(n)),
+            "reversed": list(range(n - 1, -1, -1)),
+            "random": shuffled,
+        }
+        for order, keys in orders.items():
+            print(f"n = {n}, {order} input")
+            balanced_time: float = measure_time(bst_workload, keys, True)
+            if order != "random" and n > plain_limit:
+                print(f"plain tree skipped (n > {plain_limit}, O(n^2) on {order} input)")
+                continue
+            plain_time: float = measure_time(bst_workload, keys, False)
+            print(f"balanced speedup = {plain_time / balanced_time:.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--plain-limit", type=int, default=5_000,
+                        help="largest n the plain tree is run on for sorted/reversed input")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.plain_limit, args.seed)
@@ -0,0 +1,98 @@
+"""
+Benchmark: bidirectional vs plain BFS for s-t shortest paths, and multi-source BFS vs one BFS per source.
+
+For the s-t queries the number of nodes each search visited is reported next to the time. The reduction in visited
+nodes is the point of the bidirectional search, its time follows from it. On a random graph the number of nodes
+within d steps grows exponentially and the gain is large; on a grid it only grows like d^2, so the two balls of
+radius D/2 together cover about half of the ball of radius D, and the gain stays below 2x.
+
+Run: python -m benchmarks.bidirectionalBfs --nodes 10000 1000000 --queries 50 --sources 16
+"""
+import argparse
+import random
+
+from templates.bfs import PathResult, bfs_shortest_path, bfs_shortest_path_on_grid, multi_source_bfs
+from templates.csrGraph import CSRGraph
+from utils.timing_utils import measure_time
+
+
+def random_edges(n: int, degree: int, rng: random.Random) -> list[tuple[int, int]]:
+    edges: list[tuple[int, int]] = []
+    for _ in range(degree * n // 2):
+        u, v = rng.randrange(n), rng.randrange(n)
+        edges.append((u, v))
+    return edges
+
+
+def answer_queries(graph: CSRGraph, pairs: list[tuple[int, int]], bidirectional: bool) -> list[PathResult]:
+    return [bfs_shortest_path(graph, s, t, bidirectional=bidirectional) for s, t in pairs]
+
+
+def answer_grid_queries(grid: list[list[int]], pairs: list[tuple[tuple[int, int], tuple[int, int]]],
+                        bidirectional: bool) -> list[PathResult]:
+    return [bfs_shortest_path_on_grid(grid, s, t, bidirectional=bidirectional) for s, t in pairs]
+
+
+def one_bfs_per_source(graph: CSRGraph, sources: list[int]) -> list[int]:
+    """nearest source distance the slow way: a full BFS from every source, keeping the minimum per node"""
+    best: list[int] = [-1] * graph.num_nodes
+    for source in sources:
+        distance, _ = multi_source_bfs(graph, [source])
+        for node, d in enumerate(distance):
+            if d != -1 and (best[node] == -1 or d < best[node]):
+                best[node] = d
+    return best
+
+
+def report(name: str, plain: list[PathResult], bidirectional: list[PathResult], plain_time: float,
+           bidirectional_time: float) -> None:
+    assert [r.distance for r in plain] == [r.distance for r in bidirectional], f"{name}: distances differ"
+    plain_visited: float = sum(r.visited for r in plain) / len(plain)
+    bidirectional_visited: float = sum(r.visited for r in bidirectional) / len(bidirectional)
+    print(f"{name}: visited per query plain = {plain_visited:.0f}, bidirectional = {bidirectional_visited:.0f} "
+          f"({plain_visited / max(bidirectional_visited, 1):.1f}x fewer), speedup = {plain_time / bidirectional_time:.2f}x")
+
+
+def run(sizes: list[int], degree: int, queries: int, num_sources: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for n in sizes:
+        graph: CSRGraph = CSRGraph.from_edges(random_edges(n, degree, rng), n, undirected=True)
+        pairs: list[tuple[int, int]] = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+        print(f"n = {n} nodes, average degree {degree}, {queries} random s-t queries")
+        plain: list[PathResult] = answer_queries(graph, pairs, bidirectional=False)
+        both: list[PathResult] = answer_queries(graph, pairs, bidirectional=True)
+        plain_time: float = measure_time(answer_queries, graph, pairs, False)
+        bidirectional_time: float = measure_time(answer_queries, graph, pairs, True)
+        report("graph", plain, both, plain_time, bidirectional_time)
+
+        # open grid with 20% walls, about n cells
+        side: int = max(2, int(n ** 0.5))
+        grid: list[list[int]] = [[1 if rng.random() < 0.2 else 0 for _ in range(side)] for _ in range(side)]
+        cells: list[tuple[tuple[int, int], tuple[int, int]]] = [
+            ((rng.randrange(side), rng.randrange(side)), (rng.randrange(side), rng.randrange(side)))
+            for _ in range(queries)]
+        plain = answer_grid_queries(grid, cells, bidirectional=False)
+        both = answer_grid_queries(grid, cells, bidirectional=True)
+        plain_time = measure_time(answer_grid_queries, grid, cells, False)
+        bidirectional_time = measure_time(answer_grid_queries, grid, cells, True)
+        report(f"{side}x{side} grid", plain, both, plain_time, bidirectional_time)
+
+        sources: list[int] = rng.sample(range(n), min(num_sources, n))
+        distance, _ = multi_source_bfs(graph, sources)
+        assert list(distance) == one_bfs_per_source(graph, sources)
+        separate_time: float = measure_time(one_bfs_per_source, graph, sources)
+        multi_time: float = measure_time(multi_source_bfs, graph, sources)
+        print(f"{len(sources)} sources: one multi-source BFS vs {len(sources)} BFS, "
+              f"speedup = {separate_time / multi_time:.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--degree", type=int, default=4, help="average number of neighbors per node")
+    parser.add_argument("--queries", type=int, default=20, help="s-t queries per size")
+    parser.add_argument("--sources", type=int, default=16, help="sources of the multi-source BFS")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.nodes, args.degree, args.queries, args.sources, args.seed)
@@ -0,0 +1,44 @@
+"""
+Benchmark: binary_search_many vs calling binary_search once per query, for sorted and shuffled query batches.
+
+Run: python -m benchmarks.binarySearchMany --size 1000000 --queries 10000 1000000
+"""
+import argparse
+import random
+
+from templates.binarySearch import binary_search, binary_search_many, np
+from utils.timing_utils import measure_time
+
+
+def loop_binary_search(arr: list[int], queries: list[int]) -> list[int]:
+    return [binary_search(arr, q) for q in queries]
+
+
+def run(size: int, query_counts: list[int], seed: int = 0) -> None:
+    rng = random.Random(seed)
+    arr: list[int] = sorted(rng.sample(range(size * 2), size)) # distinct values, so every strategy agrees with the loop
+    for m in query_counts:
+        shuffled: list[int] = [rng.randrange(size * 2) for _ in range(m)]
+        for order, queries in (("shuffled", shuffled), ("sorted", sorted(shuffled))):
+            print(f"n = {size}, m = {m}, {order} queries")
+            expected: list[int] = loop_binary_search(arr, queries)
+            loop: float = measure_time(loop_binary_search, arr, queries)
+            for strategy in ("merge", "bounds"):
+                assert list(binary_search_many(arr, queries, strategy)) == expected
+                batched: float = measure_time(binary_search_many, arr, queries, strategy)
+                print(f"{strategy}: {loop / batched:.2f}x faster than the loop")
+            if np is not None:
+                np_arr, np_queries = np.asarray(arr), np.asarray(queries)
+                assert binary_search_many(np_arr, np_queries).tolist() == expected
+                batched = measure_time(binary_search_many, np_arr, np_queries)
+                print(f"numpy: {loop / batched:.2f}x faster than the loop")
+            print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.size, args.queries, args.seed)
@@ -0,0 +1,81 @@
+"""
+Benchmark: aggregates kept on the nodes (O(1) sum/height/find_min/find_max/is_balanced, O(height) range_sum)
+vs computing them with a walk over the tree, the way they were computed before.
+
+Workload: a dashboard loop that asks for every aggregate `queries` times on the same tree.
+
+Run: python -m benchmarks.bstAggregates --sizes 10000 100000 --queries 100
+"""
+import argparse
+import random
+from typing import Optional
+
+from templates.binarySearchTree import BinarySearchTree, BSTNode
+from utils.timing_utils import measure_time
+
+
+def walk_aggregates(root: Optional[BSTNode]) -> tuple[int, int, int, int, bool]:
+    """sum, height, min, max and balance computed from scratch in one post-order walk"""
+    total: int = 0
+    heights: dict[int, int] = {} # id(node) -> height
+    balanced: bool = True
+    stack: list[tuple[BSTNode, bool]] = [(root, False)] if root is not None else []
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            stack.append((node, True))
+            for child in (node.left, node.right):
+                if child is not None:
+                    stack.append((child, False))
+            continue
+        total += node.value
+        left_height: int = heights.pop(id(node.left), 0)
+        right_height: int = heights.pop(id(node.right), 0)
+        balanced = balanced and abs(left_height - right_height) <= 1
+        heights[id(node)] = 1 + max(left_height, right_height)
+
+    min_node, max_node = root, root
+    while min_node is not None and min_node.left is not None:
+        min_node = min_node.left
+    while max_node is not None and max_node.right is not None:
+        max_node = max_node.right
+    return total, heights.get(id(root), 0), min_node.value, max_node.value, balanced # type: ignore[union-attr]
+
+
+def dashboard_walk(tree: BinarySearchTree, queries: int) -> int:
+    checksum: int = 0
+    for _ in range(queries):
+        total, height, low, high, _balanced = walk_aggregates(tree.root)
+        checksum += total + height + low + high
+    return checksum
+
+
+def dashboard_cached(tree: BinarySearchTree, queries: int) -> int:
+    checksum: int = 0
+    for _ in range(queries):
+        tree.is_balanced()
+        checksum += tree.sum() + tree.height() + tree.find_min() + tree.find_max()
+    return checksum
+
+
+def run(sizes: list[int], queries: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for n in sizes:
+        tree = BinarySearchTree([rng.randrange(n * 10) for _ in range(n)])
+        assert dashboard_walk(tree, 1) == dashboard_cached(tree, 1)
+        assert walk_aggregates(tree.root)[4] == tree.is_balanced()
+        print(f"n = {n}, queries = {queries}")
+
+        slow: float = measure_time(dashboard_walk, tree, queries)
+        fast: float = measure_time(dashboard_cached, tree, queries)
+        print(f"augmented aggregates speedup = {slow / fast:.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.queries, args.seed)
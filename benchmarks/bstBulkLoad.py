@@ -0,0 +1,73 @@
+"""
+Benchmark: building and merging BinarySearchTrees from sorted data.
+    - from_sorted (O(n), index bounds) vs one insert per key into a balanced tree (O(n log n))
+    - the index bound builder used by balance() vs the previous slicing rebuild that copied O(n log n) elements
+    - merge (linear merge of two in-order streams, O(n + m)) vs inserting the other tree's values one by one
+
+Run: python -m benchmarks.bstBulkLoad --sizes 100000 1000000
+"""
+import argparse
+import random
+
+from templates.binarySearchTree import BinarySearchTree, BSTNode
+from utils.timing_utils import measure_time
+
+
+def insert_one_by_one(keys: list[int]) -> BinarySearchTree:
+    return BinarySearchTree(keys, balanced=True)
+
+
+def bulk_load(keys: list[int]) -> BinarySearchTree:
+    return BinarySearchTree.from_sorted(keys, balanced=True)
+
+
+def slicing_rebuild(ascending_values: list[int]) -> BSTNode:
+    """The previous balance() builder: every level copies its half with a slice"""
+    if len(ascending_values) == 1:
+        return BSTNode(value=ascending_values[0])
+    elif len(ascending_values) == 2:
+        return BSTNode(value=ascending_values[1], left=BSTNode(value=ascending_values[0]))
+    mid: int = len(ascending_values) // 2
+    return BSTNode(value=ascending_values[mid], left=slicing_rebuild(ascending_values[0:mid]),
+                   right=slicing_rebuild(ascending_values[mid + 1:]))
+
+
+def merge_by_insert(first: list[int], second: list[int]) -> int:
+    tree = BinarySearchTree.from_sorted(first, balanced=True)
+    for v in BinarySearchTree.from_sorted(second):
+        tree.insert(v)
+    return tree.num_nodes
+
+
+def merge_linear(first: list[int], second: list[int]) -> int:
+    tree = BinarySearchTree.from_sorted(first, balanced=True)
+    tree.merge(BinarySearchTree.from_sorted(second))
+    return tree.num_nodes
+
+
+def run(sizes: list[int], seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for n in sizes:
+        keys: list[int] = sorted(rng.randrange(n * 10) for _ in range(n))
+        other: list[int] = sorted(rng.randrange(n * 10) for _ in range(n))
+        print(f"n = {n}")
+
+        slow: float = measure_time(insert_one_by_one, keys)
+        fast: float = measure_time(bulk_load, keys)
+        print(f"from_sorted speedup over inserts = {slow / fast:.2f}x")
+
+        slow = measure_time(slicing_rebuild, keys)
+        print(f"index bound build (which also fills every augmented field) vs slicing rebuild = {slow / fast:.2f}x")
+
+        slow = measure_time(merge_by_insert, keys, other)
+        fast = measure_time(merge_linear, keys, other)
+        print(f"merge speedup over inserts = {slow / fast:.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.seed)
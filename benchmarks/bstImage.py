@@ -0,0 +1,76 @@
+"""
+Benchmark: worker cold start with a BinarySearchTree rebuilt in memory vs a MappedBST opened from a saved image.
+
+    - startup: inserting every key / from_sorted vs mapping the image (O(1))
+    - lookups: BinarySearchTree.search on node objects vs MappedBST.search on the mapped arrays
+    - range scan: iter_range on both
+
+Run: python -m benchmarks.bstImage --sizes 100000 1000000
+"""
+import argparse
+import os
+import random
+import tempfile
+
+from templates.binarySearchTree import BinarySearchTree
+from templates.bstImage import MappedBST, save_bst_image
+from utils.timing_utils import measure_time
+
+
+def startup_insert(keys: list[int]) -> BinarySearchTree:
+    return BinarySearchTree(keys, balanced=True)
+
+
+def startup_from_sorted(ascending: list[int]) -> BinarySearchTree:
+    return BinarySearchTree.from_sorted(ascending)
+
+
+def startup_mapped(path: str) -> int:
+    with MappedBST(path) as image:
+        return len(image)
+
+
+def lookups(tree: BinarySearchTree | MappedBST, probes: list[int]) -> int:
+    search = tree.search
+    return sum(1 for p in probes if search(p) not in (None, -1))
+
+
+def range_scan(tree: BinarySearchTree | MappedBST, lo: int, hi: int) -> int:
+    return sum(1 for _ in tree.iter_range(lo, hi))
+
+
+def run(sizes: list[int], queries: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        for n in sizes:
+            keys: list[int] = rng.sample(range(n * 4), n)
+            ascending: list[int] = sorted(keys)
+            probes: list[int] = [rng.randrange(n * 4) for _ in range(queries)]
+            path: str = os.path.join(directory, f"bst_{n}.img")
+            tree: BinarySearchTree = startup_from_sorted(ascending)
+            written: int = save_bst_image(tree, path)
+            print(f"n = {n}, image = {written / n:.1f} bytes/key")
+
+            measure_time(startup_insert, keys)
+            rebuild: float = measure_time(startup_from_sorted, ascending)
+            mapped: float = measure_time(startup_mapped, path)
+            print(f"startup speedup of the mapped image over from_sorted = {rebuild / mapped:.0f}x")
+
+            with MappedBST(path) as image:
+                assert lookups(tree, probes) == lookups(image, probes)
+                objects: float = measure_time(lookups, tree, probes)
+                flat: float = measure_time(lookups, image, probes)
+                print(f"lookup cost of the mapped image relative to node objects = {flat / objects:.2f}x")
+                objects = measure_time(range_scan, tree, n, n * 2)
+                flat = measure_time(range_scan, image, n, n * 2)
+                print(f"range scan cost of the mapped image relative to node objects = {flat / objects:.2f}x")
+            print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.queries, args.seed)
@@ -0,0 +1,315 @@
+"""
+Baseline comparison: every template against its standard library counterpart on the same randomized workload.
+
+    Heap                       vs heapq
+    binary_search/lower_bound  vs bisect
+    Stack                      vs list
+    Queue, LinkedList          vs collections.deque
+    BinarySearchTree           vs sorted list + bisect.insort
+
+Both sides of a pair run exactly the same operations and return what they observed (popped items, search
+answers, final contents). Those outputs are compared first (differential check), then both are timed with
+measure_stats and the median throughput of each is printed with the ratio baseline / template.
+A ratio of 5.0x means the standard library is 5 times faster on that workload.
+
+Run:
+    python -m benchmarks.compare
+    python -m benchmarks.compare --sizes 1000 100000 --seed 7 -k "heap|bst"
+
+Exits with status 1 if any differential check fails.
+"""
+import argparse
+import heapq
+import random
+import re
+import sys
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from templates.binarySearch import binary_search, lower_bound
+from templates.binarySearchTree import BinarySearchTree
+from templates.heap import Heap
+from templates.linkedList import LinkedList
+from templates.queue import Queue
+from templates.stacks import Stack
+from utils.timing_utils import TimingStats, measure_stats
+
+POP: int = -1 # in a push/pop workload every other number is pushed (they are all >= 0)
+INSERT, SEARCH, DELETE = 0, 1, 2 # operations of the ordered set workload
+
+
+@dataclass
+class Matchup:
+    name: str
+    template_label: str
+    baseline_label: str
+    make_workload: Callable[[int, random.Random], Any] # (n, rng) -> workload, shared by both sides
+    template: Callable[[Any], list[Any]]               # workload -> observed outputs
+    baseline: Callable[[Any], list[Any]]
+    count_ops: Callable[[Any], int] = len              # operations in a workload, for the throughput
+
+
+### Workloads
+def push_pop_workload(n: int, rng: random.Random) -> list[int]:
+    """n pushes of random numbers with pops mixed in while the structure is not empty, then pops until it is"""
+    ops: list[int] = []
+    size: int = 0
+    pushes: int = 0
+    while pushes < n:
+        if size == 0 or rng.random() < 0.6:
+            ops.append(rng.randrange(n * 4))
+            pushes += 1
+            size += 1
+        else:
+            ops.append(POP)
+            size -= 1
+    ops.extend([POP] * size)
+    return ops
+
+
+def search_workload(n: int, rng: random.Random) -> tuple[list[int], list[int]]:
+    """sorted array of n distinct numbers and n queries, about half of them hits"""
+    arr: list[int] = sorted(rng.sample(range(n * 2), n))
+    return arr, [rng.randrange(n * 2) for _ in range(n)]
+
+
+def duplicates_workload(n: int, rng: random.Random) -> tuple[list[int], list[int]]:
+    """sorted array of n numbers with many repeats and n queries, for the first-occurrence searches"""
+    arr: list[int] = sorted(rng.randrange(n // 4 + 1) for _ in range(n))
+    return arr, [rng.randrange(n // 4 + 2) for _ in range(n)]
+
+
+def ordered_set_workload(n: int, rng: random.Random) -> list[tuple[int, int]]:
+    """n random inserts mixed with searches and deletes (half of the deletes hit a value that was inserted)"""
+    ops: list[tuple[int, int]] = []
+    inserted: list[int] = []
+    for _ in range(n):
+        value: int = rng.randrange(n * 2)
+        inserted.append(value)
+        ops.append((INSERT, value))
+        roll: float = rng.random()
+        if roll < 0.5:
+            ops.append((SEARCH, rng.randrange(n * 2)))
+        elif roll < 0.7:
+            ops.append((DELETE, rng.choice(inserted) if rng.random() < 0.5 else rng.randrange(n * 2)))
+    return ops
+
+
+### Heap vs heapq
+def run_heap(ops: list[int]) -> list[Any]:
+    heap: Heap = Heap()
+    out: list[Any] = []
+    for op in ops:
+        if op == POP:
+            out.append(heap.extract_min())
+        else:
+            heap.insert(op)
+    return out
+
+
+def run_heapq(ops: list[int]) -> list[Any]:
+    heap: list[int] = []
+    out: list[Any] = []
+    for op in ops:
+        if op == POP:
+            out.append(heapq.heappop(heap))
+        else:
+            heapq.heappush(heap, op)
+    return out
+
+
+### binary_search vs bisect
+def run_binary_search(workload: tuple[list[int], list[int]]) -> list[Any]:
+    arr, queries = workload
+    return [binary_search(arr, q) for q in queries]
+
+
+def run_bisect_search(workload: tuple[list[int], list[int]]) -> list[Any]:
+    arr, queries = workload
+    n: int = len(arr)
+    out: list[Any] = []
+    for q in queries:
+        i: int = bisect_left(arr, q)
+        out.append(i if i < n and arr[i] == q else -1)
+    return out
+
+
+def run_lower_bound(workload: tuple[list[int], list[int]]) -> list[Any]:
+    arr, queries = workload
+    return [lower_bound(arr, q) for q in queries]
+
+
+def run_bisect_left(workload: tuple[list[int], list[int]]) -> list[Any]:
+    arr, queries = workload
+    return [bisect_left(arr, q) for q in queries]
+
+
+### Stack vs list
+def run_stack(ops: list[int]) -> list[Any]:
+    stack: Stack = Stack()
+    out: list[Any] = []
+    for op in ops:
+        if op == POP:
+            out.append(stack.pop())
+        else:
+            stack.push(op)
+    return out
+
+
+def run_list_stack(ops: list[int]) -> list[Any]:
+    stack: list[int] = []
+    out: list[Any] = []
+    for op in ops:
+        if op == POP:
+            out.append(stack.pop())
+        else:
+            stack.append(op)
+    return out
+
+
+### Queue / LinkedList vs deque
+def run_queue(ops: list[int]) -> list[Any]:
+    queue: Queue = Queue()
+    out: list[Any] = []
+    for op in ops:
+        if op == POP:
+            out.append(queue.dequeue())
+        else:
+            queue.enqueue(op)
+    return out
+
+
+def run_linked_list(ops: list[int]) -> list[Any]:
+    linked: LinkedList = LinkedList()
+    out: list[Any] = []
+    for op in ops:
+        if op == POP:
+            out.append(linked.get_head())
+            linked.remove_head()
+        else:
+            linked.append(op)
+    return out
+
+
+def run_deque(ops: list[int]) -> list[Any]:
+    queue: deque[int] = deque()
+    out: list[Any] = []
+    for op in ops:
+        if op == POP:
+            out.append(queue.popleft())
+        else:
+            queue.append(op)
+    return out
+
+
+### BinarySearchTree vs sorted list + insort
+def run_bst(ops: list[tuple[int, int]], balanced: bool = False) -> list[Any]:
+    tree: BinarySearchTree = BinarySearchTree(balanced=balanced)
+    out: list[Any] = []
+    for op, value in ops:
+        if op == INSERT:
+            tree.insert(value)
+        elif op == SEARCH:
+            out.append(tree.search(value) is not None)
+        else:
+            tree.delete(value)
+    out.append(tree.inorder_traversal())
+    return out
+
+
+def run_balanced_bst(ops: list[tuple[int, int]]) -> list[Any]:
+    return run_bst(ops, balanced=True)
+
+
+def run_sorted_list(ops: list[tuple[int, int]]) -> list[Any]:
+    arr: list[int] = []
+    out: list[Any] = []
+    for op, value in ops:
+        if op == INSERT:
+            insort(arr, value)
+            continue
+        i: int = bisect_left(arr, value)
+        found: bool = i < len(arr) and arr[i] == value
+        if op == SEARCH:
+            out.append(found)
+        elif found:
+            del arr[i] # O(n) shift, the price the sorted list pays for its cache friendly layout
+    out.append(list(arr))
+    return out
+
+
+def _queries(workload: tuple[list[int], list[int]]) -> int:
+    return len(workload[1])
+
+
+MATCHUPS: list[Matchup] = [
+    Matchup("heap", "Heap", "heapq", push_pop_workload, run_heap, run_heapq),
+    Matchup("binary_search", "binary_search", "bisect", search_workload, run_binary_search, run_bisect_search,
+            _queries),
+    Matchup("lower_bound", "lower_bound", "bisect_left", duplicates_workload, run_lower_bound, run_bisect_left,
+            _queries),
+    Matchup("stack", "Stack", "list", push_pop_workload, run_stack, run_list_stack),
+    Matchup("queue", "Queue", "deque", push_pop_workload, run_queue, run_deque),
+    Matchup("linked_list", "LinkedList", "deque", push_pop_workload, run_linked_list, run_deque),
+    Matchup("bst", "BinarySearchTree", "insort", ordered_set_workload, run_bst, run_sorted_list),
+    Matchup("bst_balanced", "BinarySearchTree(balanced)", "insort", ordered_set_workload, run_balanced_bst,
+            run_sorted_list),
+]
+
+
+def _throughput(ops: int, stats: TimingStats) -> str:
+    per_second: float = ops / stats.median
+    if per_second >= 1e6:
+        return f"{per_second / 1e6:.2f}M ops/s"
+    return f"{per_second / 1e3:.1f}k ops/s"
+
+
+def run(matchups: list[Matchup], sizes: list[int], seed: int = 0, repeat: int = 5, min_time: float = 0.05) -> int:
+    """Checks and times every matchup at every size, returns the number of failed differential checks"""
+    failures: int = 0
+    for matchup in matchups:
+        for n in sizes:
+            # seeded per matchup and size, so filtering with -k or changing sizes doesn't change a workload
+            workload: Any = matchup.make_workload(n, random.Random(f"{seed}:{matchup.name}:{n}"))
+            ops: int = matchup.count_ops(workload)
+            label: str = f"{matchup.name:<14} n={n:<9}"
+
+            if matchup.template(workload) != matchup.baseline(workload):
+                failures += 1
+                print(f"{label} differential check failed ❌ ({matchup.template_label} and "
+                      f"{matchup.baseline_label} disagree, seed={seed})")
+                continue
+
+            template: TimingStats = measure_stats(matchup.template, workload, repeat=repeat, min_time=min_time)
+            baseline: TimingStats = measure_stats(matchup.baseline, workload, repeat=repeat, min_time=min_time)
+            print(f"{label} {matchup.template_label} {_throughput(ops, template)}, "
+                  f"{matchup.baseline_label} {_throughput(ops, baseline)}, "
+                  f"ratio = {template.median / baseline.median:.2f}x ✅")
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000], help="workload sizes")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random workloads")
+    parser.add_argument("-k", dest="pattern", default="", help="regex matched against the matchup names")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per timed repeat")
+    args = parser.parse_args(argv)
+
+    pattern: re.Pattern[str] = re.compile(args.pattern)
+    matchups: list[Matchup] = [m for m in MATCHUPS if pattern.search(m.name)]
+    if not matchups:
+        print(f"No matchup matches {args.pattern!r}, choose from: {', '.join(m.name for m in MATCHUPS)}")
+        return 1
+    failures: int = run(matchups, args.sizes, args.seed, args.repeat, args.min_time)
+    if failures:
+        print(f"{failures} differential check(s) failed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
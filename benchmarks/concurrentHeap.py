@@ -0,0 +1,111 @@
+"""
+Benchmark: throughput of ConcurrentHeap (threads) and AsyncHeap (asyncio) with N producers and M consumers,
+comparing one item per get() against batched get_many().
+
+Every producer puts `items` random priorities, then one sentinel per consumer is put with the biggest priority,
+so the sentinels come out only after all real work is done.
+
+Run: python -m benchmarks.concurrentHeap --producers 4 --consumers 4 --items 50000 --batch 64
+"""
+import argparse
+import asyncio
+import random
+import sys
+import threading
+import time
+
+from templates.concurrentHeap import AsyncHeap, ConcurrentHeap
+
+SENTINEL: int = sys.maxsize
+
+
+def thread_throughput(producers: int, consumers: int, items: int, batch: int, maxsize: int) -> float:
+    """Returns processed items per second"""
+    heap = ConcurrentHeap(maxsize=maxsize)
+    consumed: list[int] = [0] * consumers
+
+    def produce(seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(items):
+            heap.put(rng.randrange(10**9))
+
+    def consume(worker: int) -> None:
+        while True:
+            taken: list[int] = heap.get_many(batch) if batch > 1 else [heap.get()]
+            sentinels: int = taken.count(SENTINEL)
+            consumed[worker] += len(taken) - sentinels
+            if sentinels:
+                for _ in range(sentinels - 1): # give back the sentinels that belong to other consumers
+                    heap.put(SENTINEL)
+                return
+
+    start: float = time.perf_counter()
+    consumer_threads = [threading.Thread(target=consume, args=(w,)) for w in range(consumers)]
+    producer_threads = [threading.Thread(target=produce, args=(p,)) for p in range(producers)]
+    for t in consumer_threads + producer_threads:
+        t.start()
+    for t in producer_threads:
+        t.join()
+    for _ in range(consumers):
+        heap.put(SENTINEL)
+    for t in consumer_threads:
+        t.join()
+    elapsed: float = time.perf_counter() - start
+
+    assert sum(consumed) == producers * items
+    return producers * items / elapsed
+
+
+async def _async_run(producers: int, consumers: int, items: int, batch: int, maxsize: int) -> int:
+    heap = AsyncHeap(maxsize=maxsize)
+
+    async def produce(seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(items):
+            await heap.put(rng.randrange(10**9))
+
+    async def consume() -> int:
+        count: int = 0
+        while True:
+            taken: list[int] = await heap.get_many(batch) if batch > 1 else [await heap.get()]
+            sentinels: int = taken.count(SENTINEL)
+            count += len(taken) - sentinels
+            if sentinels:
+                for _ in range(sentinels - 1):
+                    await heap.put(SENTINEL)
+                return count
+
+    consumer_tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+    await asyncio.gather(*(produce(p) for p in range(producers)))
+    for _ in range(consumers):
+        await heap.put(SENTINEL)
+    return sum(await asyncio.gather(*consumer_tasks))
+
+
+def async_throughput(producers: int, consumers: int, items: int, batch: int, maxsize: int) -> float:
+    """Returns processed items per second"""
+    start: float = time.perf_counter()
+    processed: int = asyncio.run(_async_run(producers, consumers, items, batch, maxsize))
+    elapsed: float = time.perf_counter() - start
+    assert processed == producers * items
+    return processed / elapsed
+
+
+def run(producers: int, consumers: int, items: int, batch: int, maxsize: int) -> None:
+    print(f"producers = {producers}, consumers = {consumers}, items per producer = {items}, maxsize = {maxsize}")
+    for name, throughput in (("ConcurrentHeap", thread_throughput), ("AsyncHeap", async_throughput)):
+        single: float = throughput(producers, consumers, items, 1, maxsize)
+        batched: float = throughput(producers, consumers, items, batch, maxsize)
+        print(f"{name}: get() = {single:,.0f} items/s, get_many({batch}) = {batched:,.0f} items/s "
+              f"({batched / single:.2f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--consumers", type=int, default=4)
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=64)
+    parser.add_argument("--maxsize", type=int, default=1_000, help="0 for an unbounded heap")
+    args = parser.parse_args()
+    run(args.producers, args.consumers, args.items, args.batch, args.maxsize)
@@ -0,0 +1,72 @@
+"""
+Benchmark: CSRGraph vs the adjacency dict on the same random graph, memory and traversal time.
+
+Memory is measured with tracemalloc while building each representation from an edge list that already exists,
+so it is the cost of the graph structure alone. The traversals are checked to return the same result first.
+
+Run: python -m benchmarks.csrGraph --nodes 100000 1000000 --degree 8
+"""
+import argparse
+import random
+
+from templates.bfs import bfs_levels, bfs_traversal
+from templates.csrGraph import CSRGraph
+from templates.dfs import dfs_traversal, dfs_trees
+from templates.topological import topological_sort
+from utils.timing_utils import MemoryStats, measure_memory, measure_time
+
+
+def build_dict(edges: list[tuple[int, int]], n: int) -> dict[int, list[int]]:
+    graph: dict[int, list[int]] = {node: [] for node in range(n)}
+    for u, v in edges:
+        graph[u].append(v)
+    return graph
+
+
+def run(sizes: list[int], degree: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for n in sizes:
+        # undirected random graph for the traversals, DAG (small -> big node) for the topological sort
+        edges: list[tuple[int, int]] = []
+        for _ in range(degree * n // 2):
+            u, v = rng.randrange(n), rng.randrange(n)
+            edges.append((u, v))
+            edges.append((v, u))
+        dag_edges: list[tuple[int, int]] = []
+        for _ in range(degree * n // 2):
+            u, v = sorted(rng.sample(range(n), 2))
+            dag_edges.append((u, v))
+        print(f"n = {n} nodes, {len(edges)} edges")
+
+        dict_memory: MemoryStats = measure_memory(build_dict, edges, n, elements=len(edges))
+        csr_memory: MemoryStats = measure_memory(CSRGraph.from_edges, edges, n, elements=len(edges))
+        print(f"memory per edge: dict = {dict_memory.bytes_per_element:.1f} B, "
+              f"CSR = {csr_memory.bytes_per_element:.1f} B "
+              f"({dict_memory.retained_bytes / csr_memory.retained_bytes:.1f}x smaller)")
+        measure_time(CSRGraph.from_edges, edges, n)
+
+        graph: dict[int, list[int]] = build_dict(edges, n)
+        csr: CSRGraph = CSRGraph.from_edges(edges, n)
+        dag: dict[int, list[int]] = build_dict(dag_edges, n)
+        csr_dag: CSRGraph = CSRGraph.from_edges(dag_edges, n)
+        for name, func, dict_args, csr_args in [
+            ("bfs_traversal", bfs_traversal, (graph, 0), (csr, 0)),
+            ("bfs_levels", bfs_levels, (graph, 0), (csr, 0)),
+            ("dfs_traversal", dfs_traversal, (graph, 0), (csr, 0)),
+            ("dfs_trees", dfs_trees, (graph,), (csr,)),
+            ("topological_sort", topological_sort, (dag,), (csr_dag,)),
+        ]:
+            assert func(*dict_args) == func(*csr_args), f"{name} differs between dict and CSR"
+            dict_time: float = measure_time(func, *dict_args)
+            csr_time: float = measure_time(func, *csr_args)
+            print(f"{name}: speedup of CSR over dict = {dict_time / csr_time:.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--degree", type=int, default=8, help="average number of neighbors per node")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.nodes, args.degree, args.seed)
@@ -0,0 +1,60 @@
+"""
+Benchmark: binary Heap (heap.py) vs DaryHeap with arity 2, 4, 8 and list vs typed array storage.
+
+Workload: build_heap from n random ints, then n/2 inserts, then drain everything with extract_min.
+
+Run: python -m benchmarks.daryHeap --sizes 100000 1000000 10000000
+"""
+import argparse
+import random
+
+from templates.daryHeap import DaryHeap
+from templates.heap import Heap
+from utils.timing_utils import measure_time
+
+
+def heap_workload(values: list[int], extra: list[int]) -> int:
+    heap = Heap(values)
+    for v in extra:
+        heap.insert(v)
+    count: int = 0
+    while not heap.is_empty():
+        heap.extract_min()
+        count += 1
+    return count
+
+
+def dary_workload(values: list[int], extra: list[int], arity: int, typecode: str | None) -> int:
+    heap = DaryHeap(values, arity=arity, typecode=typecode)
+    for v in extra:
+        heap.insert(v)
+    count: int = 0
+    while not heap.is_empty():
+        heap.extract_min()
+        count += 1
+    return count
+
+
+def run(sizes: list[int], seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for n in sizes:
+        values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+        extra: list[int] = [rng.randrange(n * 10) for _ in range(n // 2)]
+        print(f"n = {n}")
+
+        baseline: float = measure_time(heap_workload, values, extra)
+        for arity in (2, 4, 8):
+            for typecode in ('q', None):
+                storage: str = "array('q')" if typecode else "list"
+                print(f"DaryHeap arity={arity} storage={storage}")
+                elapsed: float = measure_time(dary_workload, values, extra, arity, typecode)
+                print(f"speedup over Heap = {baseline / elapsed:.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.seed)
@@ -0,0 +1,59 @@
+"""
+Benchmark: GridBFS (flat bytearray, integer cell ids, parent array) vs bfs_shortest_distance_on_grid,
+corner to corner on a square grid with 20% blocked cells (first row and last column kept open so the far corner
+is reachable and the search covers most of the grid).
+
+The speedup is reported for the search alone (engine built once, the usual case for many queries on one map) and
+including the flattening of the grid (one-off query).
+
+Run: python -m benchmarks.gridBfs --sides 1000 4000
+(a 4000 x 4000 grid needs a few GB of RAM for the list based search)
+"""
+import argparse
+import random
+
+from templates.bfs import bfs_shortest_distance_on_grid
+from templates.gridBfs import GridBFS
+from utils.timing_utils import measure_time
+
+
+def make_grid(side: int, rng: random.Random, blocked: float = 0.2) -> list[list[int]]:
+    grid: list[list[int]] = [[1 if rng.random() < blocked else 0 for _ in range(side)] for _ in range(side)]
+    for i in range(side):
+        grid[0][i] = 0
+        grid[i][side - 1] = 0
+    return grid
+
+
+def one_off_search(grid: list[list[int]], start: tuple[int, int], end: tuple[int, int]) -> int:
+    return GridBFS(grid).distance(start, end)
+
+
+def run(sides: list[int], seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for side in sides:
+        grid: list[list[int]] = make_grid(side, rng)
+        start: tuple[int, int] = (0, 0)
+        end: tuple[int, int] = (side - 1, side - 1)
+        engine: GridBFS = GridBFS(grid)
+        diagonal: GridBFS = GridBFS(grid, diagonal=True)
+        print(f"{side} x {side} grid, distance = {engine.distance(start, end)}")
+
+        assert bfs_shortest_distance_on_grid(grid, start, end) == engine.distance(start, end)
+        baseline: float = measure_time(bfs_shortest_distance_on_grid, grid, start, end)
+        search: float = measure_time(engine.distance, start, end)
+        with_build: float = measure_time(one_off_search, grid, start, end)
+        with_path: float = measure_time(engine.shortest_path, start, end, True)
+        eight: float = measure_time(diagonal.distance, start, end)
+        print(f"speedup over bfs_shortest_distance_on_grid: search = {baseline / search:.2f}x, "
+              f"build + search = {baseline / with_build:.2f}x, search + path = {baseline / with_path:.2f}x, "
+              f"8-connected search = {baseline / eight:.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sides", type=int, nargs="+", default=[500, 2000], help="grid side lengths")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sides, args.seed)
@@ -0,0 +1,89 @@
+"""
+Benchmark: Heap bulk operations against doing the same work one element at a time.
+    - sliding bounded top-k: pushpop vs insert + extract_min
+    - insert_many of a large batch (random and descending order) vs a loop of insert
+    - nlargest streaming over a generator vs building a full heap and draining k elements
+
+Run: python -m benchmarks.heapBulk --sizes 100000 1000000 --k 100
+"""
+import argparse
+import random
+from collections.abc import Iterator
+
+from templates.heap import Heap, nlargest
+from utils.timing_utils import measure_time
+
+
+def top_k_insert_extract(values: list[int], k: int) -> list[int]:
+    heap = Heap(values[:k])
+    for v in values[k:]:
+        heap.insert(v)
+        heap.extract_min()
+    return heap.heap
+
+
+def top_k_pushpop(values: list[int], k: int) -> list[int]:
+    heap = Heap(values[:k])
+    for v in values[k:]:
+        heap.pushpop(v)
+    return heap.heap
+
+
+def insert_loop(base: list[int], batch: list[int]) -> int:
+    heap = Heap(base)
+    for v in batch:
+        heap.insert(v)
+    return heap.heapSize()
+
+
+def insert_batch(base: list[int], batch: list[int]) -> int:
+    heap = Heap(base)
+    heap.insert_many(batch)
+    return heap.heapSize()
+
+
+def stream(values: list[int]) -> Iterator[int]:
+    yield from values
+
+
+def full_heap_top_k(values: list[int], k: int) -> list[int]:
+    heap = Heap(list(stream(values)))
+    return [-heap.extract_min() for _ in range(k)] # type: ignore[operator]
+
+
+def streaming_top_k(values: list[int], k: int) -> list[int]:
+    return nlargest(stream(values), k)
+
+
+def run(sizes: list[int], k: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for n in sizes:
+        values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+        negated: list[int] = [-v for v in values]
+        assert sorted(top_k_pushpop(values, k)) == sorted(top_k_insert_extract(values, k))
+        assert streaming_top_k(values, k) == full_heap_top_k(negated, k)
+        print(f"n = {n}, k = {k}")
+
+        slow: float = measure_time(top_k_insert_extract, values, k)
+        fast: float = measure_time(top_k_pushpop, values, k)
+        print(f"pushpop speedup = {slow / fast:.2f}x")
+
+        descending: list[int] = sorted(values, reverse=True) # worst case, every insert bubbles to the root
+        for name, batch in (("random", values), ("descending", descending)):
+            slow = measure_time(insert_loop, values[: n // 8], batch)
+            fast = measure_time(insert_batch, values[: n // 8], batch)
+            print(f"insert_many speedup ({name} batch) = {slow / fast:.2f}x")
+
+        slow = measure_time(full_heap_top_k, negated, k)
+        fast = measure_time(streaming_top_k, values, k)
+        print(f"nlargest speedup = {slow / fast:.2f}x (and O(k) instead of O(n) memory)")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--k", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.k, args.seed)
@@ -0,0 +1,79 @@
+"""
+Benchmark: IndexedHeap.decrease_key vs the "push duplicates and skip stale entries" pattern.
+
+Workload (heavy key churn, like Dijkstra / schedulers):
+    1. insert n handles with random priorities
+    2. lower the priority of a random handle `churn * n` times
+    3. drain the heap
+The lazy version never updates in place, it pushes (priority, handle) again and remembers the latest priority,
+so the heap grows by one entry per update and stale entries are skipped while draining.
+
+Run: python -m benchmarks.indexedHeap --sizes 10000 100000 --churn 10
+"""
+import argparse
+import random
+
+from templates.heap import Heap, IndexedHeap
+from utils.timing_utils import measure_time
+
+
+def make_workload(n: int, churn: int, seed: int = 0) -> tuple[list[int], list[tuple[int, int]]]:
+    """Returns initial priorities and a list of (handle, new_priority) decreases"""
+    rng = random.Random(seed)
+    priorities: list[int] = [rng.randrange(n * churn * 4, n * churn * 8) for _ in range(n)]
+    current: list[int] = priorities[:]
+    updates: list[tuple[int, int]] = []
+    for _ in range(n * churn):
+        handle: int = rng.randrange(n)
+        current[handle] -= rng.randrange(1, 4) # always a decrease
+        updates.append((handle, current[handle]))
+    return priorities, updates
+
+
+def indexed_churn(priorities: list[int], updates: list[tuple[int, int]]) -> int:
+    heap = IndexedHeap(dict(enumerate(priorities)))
+    for handle, new_priority in updates:
+        heap.decrease_key(handle, new_priority)
+    
+    drained: int = 0
+    while heap.extract_min_item() is not None:
+        drained += 1
+    return drained
+
+
+def lazy_churn(priorities: list[int], updates: list[tuple[int, int]]) -> int:
+    heap = Heap([(priority, handle) for handle, priority in enumerate(priorities)]) # type: ignore[misc]
+    latest: list[int] = priorities[:]
+    for handle, new_priority in updates:
+        latest[handle] = new_priority
+        heap.insert((new_priority, handle)) # type: ignore[arg-type]
+    
+    drained: int = 0
+    done: list[bool] = [False] * len(priorities)
+    while not heap.is_empty():
+        priority, handle = heap.extract_min() # type: ignore[misc]
+        if done[handle] or priority != latest[handle]:
+            continue # stale entry, skip it
+        done[handle] = True
+        drained += 1
+    return drained
+
+
+def run(sizes: list[int], churn: int) -> None:
+    for n in sizes:
+        priorities, updates = make_workload(n, churn)
+        assert indexed_churn(priorities, updates) == lazy_churn(priorities, updates) == n
+        
+        print(f"n = {n}, updates = {len(updates)}")
+        indexed_time: float = measure_time(indexed_churn, priorities, updates)
+        lazy_time: float = measure_time(lazy_churn, priorities, updates)
+        print(f"speedup of IndexedHeap over lazy duplicates = {lazy_time / indexed_time:.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--churn", type=int, default=10, help="number of decrease_key calls per handle")
+    args = parser.parse_args()
+    run(args.sizes, args.churn)
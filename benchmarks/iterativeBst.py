@@ -0,0 +1,134 @@
+"""
+Benchmark: the iterative BinarySearchTree core against the previous recursive, closure per call implementation.
+
+The recursive versions below are the old method bodies, kept here only as the "before" side.
+Also compares a range scan that stops early (iter_range) against filtering inorder_traversal().
+
+Run: python -m benchmarks.iterativeBst --sizes 10000 100000
+"""
+import argparse
+import random
+from itertools import islice
+from typing import Optional
+
+from templates.binarySearchTree import BinarySearchTree, BSTNode
+from utils.timing_utils import measure_time
+
+
+### "before": recursive implementations
+def recursive_build(keys: list[int]) -> Optional[BSTNode]:
+    def __insert_recursive(curr: Optional[BSTNode], val: int) -> BSTNode:
+        if curr is None:
+            return BSTNode(value=val, right=None, left=None)
+        if val >= curr.value:
+            curr.right = __insert_recursive(curr.right, val)
+        else:
+            curr.left = __insert_recursive(curr.left, val)
+        return curr
+
+    root: Optional[BSTNode] = None
+    for k in keys:
+        root = __insert_recursive(root, k)
+    return root
+
+
+def recursive_search_all(root: Optional[BSTNode], keys: list[int]) -> int:
+    def __search_recursive(curr: Optional[BSTNode], val: int) -> Optional[BSTNode]:
+        if curr is None:
+            return None
+        elif curr.value == val:
+            return curr
+        elif val >= curr.value:
+            return __search_recursive(curr.right, val)
+        else:
+            return __search_recursive(curr.left, val)
+    return sum(1 for k in keys if __search_recursive(root, k) is not None)
+
+
+def recursive_sum(root: Optional[BSTNode]) -> int:
+    def __sum(curr_node: Optional[BSTNode]) -> int:
+        if curr_node is None:
+            return 0
+        return curr_node.value + __sum(curr_node.left) + __sum(curr_node.right)
+    return __sum(root)
+
+
+def recursive_height(root: Optional[BSTNode]) -> int:
+    def __height(node: Optional[BSTNode]) -> int:
+        if node is None:
+            return 0
+        return 1 + max(__height(node.left), __height(node.right))
+    return __height(root)
+
+
+def recursive_inorder(root: Optional[BSTNode]) -> list[int]:
+    result: list[int] = []
+    def __inorder(node: Optional[BSTNode]) -> None:
+        if node is not None:
+            __inorder(node.left)
+            result.append(node.value)
+            __inorder(node.right)
+    __inorder(root)
+    return result
+
+
+def recursive_postorder(root: Optional[BSTNode]) -> list[int]:
+    result: list[int] = []
+    def __postorder(node: Optional[BSTNode]) -> None:
+        if node is not None:
+            __postorder(node.left)
+            __postorder(node.right)
+            result.append(node.value)
+    __postorder(root)
+    return result
+
+
+### "after": the current tree
+def iterative_build(keys: list[int]) -> BinarySearchTree:
+    return BinarySearchTree(keys)
+
+
+def iterative_search_all(tree: BinarySearchTree, keys: list[int]) -> int:
+    return sum(1 for k in keys if tree.search(k) is not None)
+
+
+def first_matches_from_traversal(tree: BinarySearchTree, lo: int, hi: int, limit: int) -> list[int]:
+    return [v for v in tree.inorder_traversal() if lo <= v <= hi][:limit]
+
+
+def first_matches_from_range(tree: BinarySearchTree, lo: int, hi: int, limit: int) -> list[int]:
+    return list(islice(tree.iter_range(lo, hi), limit))
+
+
+def compare(name: str, before: float, after: float) -> None:
+    print(f"{name}: iterative speedup = {before / after:.2f}x")
+
+
+def run(sizes: list[int], seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for n in sizes:
+        keys: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+        tree: BinarySearchTree = iterative_build(keys)
+        root: Optional[BSTNode] = recursive_build(keys)
+        print(f"n = {n} (random keys)")
+
+        compare("insert", measure_time(recursive_build, keys), measure_time(iterative_build, keys))
+        compare("search", measure_time(recursive_search_all, root, keys), measure_time(iterative_search_all, tree, keys))
+        compare("sum", measure_time(recursive_sum, root), measure_time(tree.sum))
+        compare("height", measure_time(recursive_height, root), measure_time(tree.height))
+        compare("inorder", measure_time(recursive_inorder, root), measure_time(tree.inorder_traversal))
+        compare("postorder", measure_time(recursive_postorder, root), measure_time(tree.postorder_traversal))
+
+        lo: int = n * 5
+        compare("first 10 values >= middle key (iter_range vs full traversal)",
+                measure_time(first_matches_from_traversal, tree, lo, n * 10, 10),
+                measure_time(first_matches_from_range, tree, lo, n * 10, 10))
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.seed)
@@ -0,0 +1,101 @@
+"""
+Benchmark: lookups in a sorted file of fixed-width records (int64 key + int64 payload).
+
+    - startup: reading every key into a list for binary_search vs mapping the file (with / without sparse index)
+    - lookups: MappedRecords.binary_search with and without a sparse index, vs binary_search on the loaded list
+    - pages touched per lookup: distinct 4 KiB pages the key probes land on, i.e. page faults for a cold lookup
+
+Run: python -m benchmarks.mappedRecords --records 10000000 --every 256
+"""
+import argparse
+import mmap
+import os
+import random
+import struct
+import tempfile
+from typing import Any
+
+from templates.binarySearch import binary_search
+from templates.mappedRecords import MappedRecords, write_records
+from utils.timing_utils import measure_time
+
+RECORD_FORMAT: str = "<qq"
+
+
+class PageCountingStruct:
+    """Stands in for the key Struct of a MappedRecords and records which pages every unpack lands on"""
+    def __init__(self, key: struct.Struct) -> None:
+        self.key: struct.Struct = key
+        self.pages: set[int] = set()
+
+    def unpack_from(self, buffer: Any, offset: int) -> tuple[Any, ...]:
+        self.pages.add(offset // mmap.PAGESIZE)
+        return self.key.unpack_from(buffer, offset)
+
+
+def load_keys(path: str) -> list[int]:
+    with open(path, "rb") as f:
+        return [key for key, _ in struct.iter_unpack(RECORD_FORMAT, f.read())]
+
+
+def open_mapped(path: str, every: int) -> int:
+    with MappedRecords(path, RECORD_FORMAT, sparse_every=every) as records:
+        return len(records)
+
+
+def lookups_list(keys: list[int], probes: list[int]) -> int:
+    return sum(1 for p in probes if binary_search(keys, p) != -1)
+
+
+def lookups_mapped(records: MappedRecords, probes: list[int]) -> int:
+    search = records.binary_search
+    return sum(1 for p in probes if search(p) != -1)
+
+
+def pages_per_lookup(records: MappedRecords, probes: list[int]) -> float:
+    counter = PageCountingStruct(records._key)
+    records._key = counter # type: ignore[assignment]
+    touched: int = 0
+    for p in probes:
+        counter.pages.clear()
+        records.binary_search(p)
+        touched += len(counter.pages)
+    records._key = counter.key
+    return touched / len(probes)
+
+
+def run(num_records: int, every: int, queries: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    keys: list[int] = sorted(rng.randrange(num_records * 4) for _ in range(num_records))
+    probes: list[int] = [rng.randrange(num_records * 4) for _ in range(queries)]
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "records.bin")
+        write_records(path, ((key, i) for i, key in enumerate(keys)), RECORD_FORMAT)
+        print(f"{num_records} records, {os.path.getsize(path) / 2**20:.0f} MiB, sparse index every {every} records")
+
+        loading: float = measure_time(load_keys, path)
+        plain_open: float = measure_time(open_mapped, path, 0)
+        sparse_open: float = measure_time(open_mapped, path, every)
+        print(f"startup: mapping is {loading / plain_open:.0f}x faster than loading, "
+              f"{loading / sparse_open:.0f}x with the sparse index")
+
+        with MappedRecords(path, RECORD_FORMAT) as plain, \
+             MappedRecords(path, RECORD_FORMAT, sparse_every=every) as sparse:
+            assert lookups_list(keys, probes) == lookups_mapped(plain, probes) == lookups_mapped(sparse, probes)
+            in_memory: float = measure_time(lookups_list, keys, probes)
+            plain_time: float = measure_time(lookups_mapped, plain, probes)
+            sparse_time: float = measure_time(lookups_mapped, sparse, probes)
+            print(f"lookups relative to binary_search on a list: mapped = {in_memory / plain_time:.2f}x, "
+                  f"mapped + sparse index = {in_memory / sparse_time:.2f}x")
+            print(f"pages touched per lookup: mapped = {pages_per_lookup(plain, probes):.1f}, "
+                  f"mapped + sparse index = {pages_per_lookup(sparse, probes):.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--every", type=int, default=256, help="sparse index stride, 256 * 16 bytes = one page")
+    parser.add_argument("--queries", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.records, args.every, args.queries, args.seed)
@@ -0,0 +1,58 @@
+"""
+Benchmark: order statistic queries answered with subtree sizes (O(height)) vs through a full inorder_traversal (O(n)).
+
+Workload: `queries` random calls each of select(k), rank(value), count_range(lo, hi) and median() on a balanced tree.
+
+Run: python -m benchmarks.orderStatistics --sizes 10000 100000 --queries 1000
+"""
+import argparse
+import bisect
+import random
+
+from templates.binarySearchTree import BinarySearchTree
+from utils.timing_utils import measure_time
+
+
+def with_traversal(tree: BinarySearchTree, ks: list[int], values: list[int]) -> int:
+    checksum: int = 0
+    for k, v in zip(ks, values):
+        ordered: list[int] = tree.inorder_traversal()
+        checksum += ordered[k]
+        checksum += bisect.bisect_left(ordered, v)
+        checksum += bisect.bisect_right(ordered, v + 100) - bisect.bisect_left(ordered, v)
+        checksum += ordered[len(ordered) // 2]
+    return checksum
+
+
+def with_sizes(tree: BinarySearchTree, ks: list[int], values: list[int]) -> int:
+    checksum: int = 0
+    for k, v in zip(ks, values):
+        checksum += tree.select(k)
+        checksum += tree.rank(v)
+        checksum += tree.count_range(v, v + 100)
+        checksum += tree.select(tree.num_nodes // 2)
+    return checksum
+
+
+def run(sizes: list[int], queries: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for n in sizes:
+        tree = BinarySearchTree([rng.randrange(n * 10) for _ in range(n)], balanced=True)
+        ks: list[int] = [rng.randrange(n) for _ in range(queries)]
+        values: list[int] = [rng.randrange(n * 10) for _ in range(queries)]
+        assert with_traversal(tree, ks[:10], values[:10]) == with_sizes(tree, ks[:10], values[:10])
+        print(f"n = {n}, queries = {queries}")
+
+        slow: float = measure_time(with_traversal, tree, ks, values)
+        fast: float = measure_time(with_sizes, tree, ks, values)
+        print(f"subtree size speedup = {slow / fast:.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.queries, args.seed)
@@ -0,0 +1,57 @@
+"""
+Benchmark: merging many per shard priority queues. PairingHeap.meld is O(1), Heap.merge has to move
+every element of the other heap (O(n + m) at best).
+
+Workload: build `shards` heaps of `shard_size` random ints, merge them all into one, then extract 1000 minimums.
+
+Run: python -m benchmarks.pairingHeap --shards 1000 5000 --shard-size 100
+"""
+import argparse
+import random
+
+from templates.heap import Heap
+from templates.pairingHeap import PairingHeap
+from utils.timing_utils import measure_time
+
+
+def merge_array_heaps(shards: list[list[int]], extracts: int) -> int:
+    heaps: list[Heap] = [Heap(shard) for shard in shards]
+    merged: Heap = heaps[0]
+    for heap in heaps[1:]:
+        merged.merge(heap)
+    for _ in range(extracts):
+        merged.extract_min()
+    return merged.heapSize()
+
+
+def meld_pairing_heaps(shards: list[list[int]], extracts: int) -> int:
+    heaps: list[PairingHeap] = [PairingHeap(shard) for shard in shards]
+    merged: PairingHeap = heaps[0]
+    for heap in heaps[1:]:
+        merged.meld(heap)
+    for _ in range(extracts):
+        merged.extract_min()
+    return merged.heapSize()
+
+
+def run(shard_counts: list[int], shard_size: int, extracts: int = 1000, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for count in shard_counts:
+        shards: list[list[int]] = [[rng.randrange(10**9) for _ in range(shard_size)] for _ in range(count)]
+        assert merge_array_heaps(shards, extracts) == meld_pairing_heaps(shards, extracts)
+        print(f"shards = {count}, shard size = {shard_size}, extracts = {extracts}")
+
+        array_time: float = measure_time(merge_array_heaps, shards, extracts)
+        pairing_time: float = measure_time(meld_pairing_heaps, shards, extracts)
+        print(f"PairingHeap speedup = {array_time / pairing_time:.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shards", type=int, nargs="+", default=[100, 1_000])
+    parser.add_argument("--shard-size", type=int, default=100)
+    parser.add_argument("--extracts", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.shards, args.shard_size, args.extracts, args.seed)
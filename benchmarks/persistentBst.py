@@ -0,0 +1,98 @@
+"""
+Benchmark: read-heavy multi-threaded workload on a BinarySearchTree, one writer and N readers.
+
+    - locked: a regular tree, every read and every update takes the same lock (readers would see torn state otherwise)
+    - snapshot: a persistent tree, the writer updates without a lock and every reader query runs on tree.snapshot()
+
+Readers alternate point lookups and short range scans for a fixed duration. Every scan checks that the version
+it saw is consistent (it yields exactly count_range values, in ascending order).
+
+Run: python -m benchmarks.persistentBst --size 100000 --readers 4 --seconds 2
+"""
+import argparse
+import random
+import threading
+import time
+
+from templates.binarySearchTree import BinarySearchTree
+
+SPAN: int = 50 # width of the range scans
+
+
+def reader_query(tree: BinarySearchTree, rng: random.Random, universe: int) -> None:
+    probe: int = rng.randrange(universe)
+    if rng.random() < 0.5:
+        tree.search(probe)
+        return
+    scanned: list[int] = list(tree.iter_range(probe, probe + SPAN))
+    assert scanned == sorted(scanned) and len(scanned) == tree.count_range(probe, probe + SPAN)
+
+
+def run_workload(mode: str, keys: list[int], readers: int, seconds: float, universe: int) -> tuple[int, int]:
+    """Returns (reader queries, writer updates) completed in the given time"""
+    persistent: bool = mode == "snapshot"
+    tree = BinarySearchTree.from_sorted(sorted(keys), balanced=True, persistent=persistent)
+    lock = threading.Lock()
+    stop = threading.Event()
+    queries: list[int] = [0] * readers
+    updates: list[int] = [0]
+
+    def write() -> None:
+        rng = random.Random(-1)
+        live: list[int] = list(keys)
+        while not stop.is_set():
+            value: int = rng.randrange(universe)
+            victim: int = rng.randrange(len(live))
+            live[victim], removed = value, live[victim]
+            if persistent:
+                tree.insert(value)
+                tree.delete(removed)
+            else:
+                with lock:
+                    tree.insert(value)
+                    tree.delete(removed)
+            updates[0] += 2
+
+    def read(worker: int) -> None:
+        rng = random.Random(worker)
+        while not stop.is_set():
+            if persistent:
+                reader_query(tree.snapshot(), rng, universe)
+            else:
+                with lock:
+                    reader_query(tree, rng, universe)
+            queries[worker] += 1
+
+    threads = [threading.Thread(target=write)] + [threading.Thread(target=read, args=(w,)) for w in range(readers)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    return sum(queries), updates[0]
+
+
+def run(size: int, readers: int, seconds: float, seed: int = 0) -> None:
+    universe: int = size * 10
+    keys: list[int] = random.Random(seed).sample(range(universe), size)
+    print(f"n = {size}, readers = {readers}, {seconds}s per mode")
+    results: dict[str, tuple[int, int]] = {}
+    for mode in ("locked", "snapshot"):
+        results[mode] = run_workload(mode, keys, readers, seconds, universe)
+        reads, writes = results[mode]
+        print(f"{mode}: {reads / seconds:,.0f} reads/s, {writes / seconds:,.0f} updates/s")
+    locked_reads, locked_writes = results["locked"]
+    snapshot_reads, snapshot_writes = results["snapshot"]
+    print(f"snapshot vs locked: reads {snapshot_reads / max(locked_reads, 1):.2f}x, "
+          f"updates {snapshot_writes / max(locked_writes, 1):.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.size, args.readers, args.seconds, args.seed)
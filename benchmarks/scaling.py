@@ -0,0 +1,49 @@
+"""
+Scaling suite: runs every benchmark of benchmarks.suite that declares a complexity at geometrically growing sizes,
+fits the log-log slope (the measured exponent) and fails when it is bigger than the declared one allows.
+
+Run:
+    python -m benchmarks.scaling                                   (every benchmark with a declared complexity)
+    python -m benchmarks.scaling -k "topological|grid|linked" --factor 2 --csv scaling.csv
+
+Exits with status 1 when any benchmark scales worse than declared.
+"""
+import argparse
+import sys
+
+import benchmarks.suite # noqa: F401, registers the benchmarks
+from utils.benchmark_utils import select
+from utils.scaling_utils import format_scaling_result, run_scaling, write_scaling_csv
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", "--filter", default="", help="regex, only benchmarks whose name matches")
+    parser.add_argument("--factor", type=float, default=2.0, help="size ratio between consecutive runs")
+    parser.add_argument("--max-size", type=int, help="largest size, defaults to each benchmark's largest size")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="allowed exponent above the declared one")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--csv", help="CSV file to write every (benchmark, size) timing and fit to")
+    args = parser.parse_args(argv)
+
+    skipped: list[str] = []
+
+    def report_skip(name: str, reason: str) -> None:
+        skipped.append(name)
+        print(f"{name:<45} skipped: {reason}", flush=True)
+
+    results = run_scaling(select(args.filter), factor=args.factor, max_size=args.max_size,
+                          tolerance=args.tolerance, seed=args.seed,
+                          report=lambda result: print(format_scaling_result(result), flush=True),
+                          report_skip=report_skip)
+    if args.csv:
+        write_scaling_csv(results, args.csv)
+        print(f"Saved {len(results)} fits to {args.csv}")
+    failed: int = sum(1 for r in results if not r.passed)
+    print(f"{failed} of {len(results)} benchmarks scale worse than declared"
+          + (f", {len(skipped)} skipped (fewer than 2 sizes up to --max-size)" if skipped else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Benchmark: the new boundary searches against what callers did before.
+
+    - first occurrence: binary_search + scanning left while the value repeats vs lower_bound
+    - key lookups: building a projected key list per lookup vs lower_bound(key=...)
+    - cursor lookups (time-series style, each query a little after the previous one):
+      lower_bound over the whole array vs exponential_search starting at the previous answer
+
+Run: python -m benchmarks.searchBounds --size 1000000 --dups 100
+"""
+import argparse
+import random
+
+from templates.binarySearch import binary_search, exponential_search, lower_bound
+from utils.timing_utils import measure_time
+
+
+def first_by_scanning(arr: list[int], queries: list[int]) -> list[int]:
+    result: list[int] = []
+    for q in queries:
+        index: int = binary_search(arr, q)
+        while index > 0 and arr[index - 1] == q:
+            index -= 1
+        result.append(index)
+    return result
+
+
+def first_by_lower_bound(arr: list[int], queries: list[int]) -> list[int]:
+    return [lower_bound(arr, q) for q in queries]
+
+
+def key_by_projection(rows: list[tuple[int, str]], queries: list[int]) -> list[int]:
+    return [lower_bound([row[0] for row in rows], q) for q in queries]
+
+
+def key_by_key_function(rows: list[tuple[int, str]], queries: list[int]) -> list[int]:
+    return [lower_bound(rows, q, key=lambda row: row[0]) for q in queries]
+
+
+def cursor_by_lower_bound(arr: list[int], queries: list[int]) -> list[int]:
+    return [lower_bound(arr, q) for q in queries]
+
+
+def cursor_by_galloping(arr: list[int], queries: list[int]) -> list[int]:
+    result: list[int] = []
+    cursor: int = 0
+    for q in queries:
+        cursor = exponential_search(arr, q, cursor)
+        result.append(cursor)
+    return result
+
+
+def run(size: int, dups: int, lookups: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    arr: list[int] = sorted(rng.randrange(size // dups) for _ in range(size)) # every value repeats ~dups times
+    queries: list[int] = [rng.randrange(size // dups) for _ in range(lookups)]
+    print(f"n = {size}, ~{dups} copies of every value, {lookups} lookups")
+    assert first_by_scanning(arr, queries) == first_by_lower_bound(arr, queries)
+    scanning: float = measure_time(first_by_scanning, arr, queries)
+    bounded: float = measure_time(first_by_lower_bound, arr, queries)
+    print(f"first occurrence: lower_bound is {scanning / bounded:.2f}x faster than scanning left")
+
+    rows: list[tuple[int, str]] = [(value, "payload") for value in arr]
+    few: list[int] = queries[:10] # building the projection is O(n) per lookup, keep this part short
+    assert key_by_projection(rows, few) == key_by_key_function(rows, few)
+    projected: float = measure_time(key_by_projection, rows, few)
+    keyed: float = measure_time(key_by_key_function, rows, few)
+    print(f"key lookups: key= is {projected / keyed:.0f}x faster than projecting a key list")
+
+    walk: list[int] = sorted(queries)
+    assert cursor_by_lower_bound(arr, walk) == cursor_by_galloping(arr, walk)
+    full: float = measure_time(cursor_by_lower_bound, arr, walk)
+    galloping: float = measure_time(cursor_by_galloping, arr, walk)
+    print(f"cursor lookups: exponential_search is {full / galloping:.2f}x faster than lower_bound")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--dups", type=int, default=100)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.size, args.dups, args.lookups, args.seed)
@@ -0,0 +1,59 @@
+"""
+Benchmark: SortedIndex (Eytzinger layout) vs binary_search and bisect on the same sorted data, random lookups.
+
+Memory grows quickly: the sorted list alone is ~36 bytes per value and SortedIndex adds 16 bytes per value,
+so --sizes 100000000 needs well over 5 GB of RAM.
+
+Run: python -m benchmarks.sortedIndex --sizes 1000 100000 10000000
+"""
+import argparse
+import random
+from bisect import bisect_left
+
+from templates.binarySearch import binary_search
+from templates.sortedIndex import SortedIndex
+from utils.timing_utils import measure_time
+
+
+def lookups_binary_search(arr: list[int], queries: list[int]) -> int:
+    return sum(1 for q in queries if binary_search(arr, q) != -1)
+
+
+def lookups_bisect(arr: list[int], queries: list[int]) -> int:
+    n: int = len(arr)
+    found: int = 0
+    for q in queries:
+        i: int = bisect_left(arr, q)
+        if i < n and arr[i] == q:
+            found += 1
+    return found
+
+
+def lookups_sorted_index(index: SortedIndex, queries: list[int]) -> int:
+    find = index.find
+    return sum(1 for q in queries if find(q) != -1)
+
+
+def run(sizes: list[int], queries: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for n in sizes:
+        arr: list[int] = sorted(rng.randrange(n * 4) for _ in range(n))
+        probes: list[int] = [rng.randrange(n * 4) for _ in range(queries)]
+        index: SortedIndex = SortedIndex(arr)
+        print(f"n = {n}, {queries} lookups")
+
+        assert lookups_binary_search(arr, probes) == lookups_bisect(arr, probes) == lookups_sorted_index(index, probes)
+        baseline: float = measure_time(lookups_binary_search, arr, probes)
+        c_bisect: float = measure_time(lookups_bisect, arr, probes)
+        eytzinger: float = measure_time(lookups_sorted_index, index, probes)
+        print(f"speedup over binary_search: bisect = {baseline / c_bisect:.2f}x, SortedIndex = {baseline / eytzinger:.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.queries, args.seed)
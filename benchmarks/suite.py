@@ -0,0 +1,503 @@
+"""
+Benchmark suite: every template registered with utils.benchmark_utils, timed with warmup, calibrated loops
+and statistics, saved to JSON and compared between runs.
+The complexity of every registration is the growth of ONE call of the timed callable, checked by benchmarks.scaling.
+The memory.* benchmarks report the bytes per element of each structure holding n items. The items are created
+before the measurement, so this is the cost of the structure itself (nodes, arrays, dicts), not of the values.
+
+Run:
+    python -m benchmarks.suite list
+    python -m benchmarks.suite run --out before.json                 (all benchmarks at their default sizes)
+    python -m benchmarks.suite run -k "heap|bst" --sizes 1000 100000 --out after.json
+    python -m benchmarks.suite run -k memory                         (memory benchmarks only)
+    python -m benchmarks.suite compare before.json after.json --threshold 0.1
+
+compare exits with status 1 when a primary metric got worse by more than the threshold, so it can gate CI.
+"""
+import argparse
+import random
+import sys
+from collections.abc import Callable
+from typing import Any
+
+from templates.bPlusTree import BPlusTree
+from templates.bfs import (bfs_levels, bfs_shortest_distance_on_grid, bfs_shortest_path, bfs_traversal,
+                          multi_source_bfs)
+from templates.binarySearch import binary_search, binary_search_many, exponential_search, lower_bound
+from templates.binarySearchTree import BinarySearchTree
+from templates.csrGraph import CSRGraph
+from templates.daryHeap import DaryHeap
+from templates.dfs import dfs_traversal, dfs_trees
+from templates.doublyLinkedList import DoublyLinkedList
+from templates.gridBfs import GridBFS
+from templates.heap import Heap, IndexedHeap
+from templates.linkedList import LinkedList
+from templates.pairingHeap import PairingHeap
+from templates.queue import Queue
+from templates.sortedIndex import SortedIndex
+from templates.stacks import Stack
+from templates.topological import topological_sort
+from utils.benchmark_utils import (compare_results, format_result, load_results, register, regressions,
+                                   run_benchmarks, save_results, select)
+
+LOOKUPS: int = 1_000 # queries per call for the search benchmarks
+
+
+### Input generators
+def random_graph(n: int, rng: random.Random, degree: int = 4) -> dict[int, list[int]]:
+    """Undirected graph on nodes 0..n-1 with about degree * n / 2 edges, every node is a key"""
+    graph: dict[int, list[int]] = {node: [] for node in range(n)}
+    for _ in range(degree * n // 2):
+        u, v = rng.randrange(n), rng.randrange(n)
+        graph[u].append(v)
+        graph[v].append(u)
+    return graph
+
+
+def random_dag(n: int, rng: random.Random, degree: int = 4) -> dict[int, list[int]]:
+    """DAG on nodes 0..n-1, every edge goes from a smaller to a bigger node"""
+    graph: dict[int, list[int]] = {node: [] for node in range(n)}
+    for _ in range(degree * n):
+        u, v = sorted(rng.sample(range(n), 2))
+        graph[u].append(v)
+    return graph
+
+
+def random_grid(n: int, rng: random.Random, blocked: float = 0.2) -> list[list[int]]:
+    """About n cells in a square grid, a fraction of them blocked (1). The first row and the last column are open,
+    so the far corner is always reachable and the search from (0, 0) has to cover most of the grid"""
+    side: int = max(2, int(n ** 0.5))
+    grid: list[list[int]] = [[1 if rng.random() < blocked else 0 for _ in range(side)] for _ in range(side)]
+    for i in range(side):
+        grid[0][i] = grid[i][side - 1] = 0
+    return grid
+
+
+### Heaps
+@register("heap.build_heap", sizes=(1_000, 10_000, 100_000), complexity="O(n)")
+def heap_build(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    return lambda: Heap(values)
+
+
+@register("heap.insert_extract", complexity="O(n log n)")
+def heap_insert_extract(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    def run() -> None:
+        heap = Heap()
+        for v in values:
+            heap.insert(v)
+        while not heap.is_empty():
+            heap.extract_min()
+    return run
+
+
+@register("heap.indexed_decrease_key", complexity="O(n log n)")
+def indexed_decrease_key(n: int, rng: random.Random) -> Callable[[], Any]:
+    priorities: dict[int, int] = {handle: rng.randrange(n * 10, n * 20) for handle in range(n)}
+    updates: list[tuple[int, int]] = [(rng.randrange(n), rng.randrange(n * 10)) for _ in range(n)]
+    def run() -> None:
+        heap = IndexedHeap(priorities)
+        for handle, priority in updates:
+            if priority < heap.priority(handle):
+                heap.decrease_key(handle, priority)
+    return run
+
+
+@register("heap.dary_insert_extract", complexity="O(n log n)")
+def dary_insert_extract(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    def run() -> None:
+        heap = DaryHeap(arity=4, typecode='q')
+        for v in values:
+            heap.insert(v)
+        while not heap.is_empty():
+            heap.extract_min()
+    return run
+
+
+@register("heap.pairing_insert_extract", complexity="O(n log n)")
+def pairing_insert_extract(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    def run() -> None:
+        heap = PairingHeap(values)
+        while not heap.is_empty():
+            heap.extract_min()
+    return run
+
+
+### Trees
+@register("bst.insert_random", complexity="O(n log n)")
+def bst_insert_random(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    return lambda: BinarySearchTree(values)
+
+
+@register("bst.insert_sorted", sizes=(500, 4_000), complexity="O(n^2)")
+def bst_insert_sorted(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = list(range(n)) # every insert walks the whole right spine of a plain BST
+    return lambda: BinarySearchTree(values)
+
+
+@register("bst.insert_sorted_balanced", complexity="O(n log n)")
+def bst_insert_sorted_balanced(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = list(range(n))
+    return lambda: BinarySearchTree(values, balanced=True)
+
+
+@register("bst.search", complexity="O(log n)")
+def bst_search(n: int, rng: random.Random) -> Callable[[], Any]:
+    tree = BinarySearchTree([rng.randrange(n * 10) for _ in range(n)], balanced=True)
+    probes: list[int] = [rng.randrange(n * 10) for _ in range(LOOKUPS)]
+    return lambda: [tree.search(p) for p in probes]
+
+
+@register("bst.insert_delete", complexity="O(n log n)")
+def bst_insert_delete(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    def run() -> None:
+        tree = BinarySearchTree(values, balanced=True)
+        for v in values:
+            tree.delete(v)
+    return run
+
+
+@register("bst.from_sorted", complexity="O(n)")
+def bst_from_sorted(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = sorted(rng.randrange(n * 10) for _ in range(n))
+    return lambda: BinarySearchTree.from_sorted(values)
+
+
+@register("bplustree.insert_search", complexity="O(n log n)")
+def bplustree_insert_search(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    def run() -> None:
+        tree = BPlusTree(values)
+        for v in values:
+            tree.search(v)
+    return run
+
+
+### Searches
+@register("search.binary_search", sizes=(1_000, 100_000, 1_000_000), complexity="O(log n)")
+def search_binary_search(n: int, rng: random.Random) -> Callable[[], Any]:
+    arr: list[int] = sorted(rng.randrange(n * 4) for _ in range(n))
+    probes: list[int] = [rng.randrange(n * 4) for _ in range(LOOKUPS)]
+    return lambda: [binary_search(arr, p) for p in probes]
+
+
+@register("search.lower_bound", sizes=(1_000, 100_000, 1_000_000), complexity="O(log n)")
+def search_lower_bound(n: int, rng: random.Random) -> Callable[[], Any]:
+    arr: list[int] = sorted(rng.randrange(n * 4) for _ in range(n))
+    probes: list[int] = [rng.randrange(n * 4) for _ in range(LOOKUPS)]
+    return lambda: [lower_bound(arr, p) for p in probes]
+
+
+@register("search.exponential_cursor", sizes=(1_000, 100_000, 1_000_000), complexity="O(log n)")
+def search_exponential_cursor(n: int, rng: random.Random) -> Callable[[], Any]:
+    arr: list[int] = sorted(rng.randrange(n * 4) for _ in range(n))
+    # time-series style: every query lands a few positions after the previous one
+    positions: list[int] = [0]
+    for _ in range(LOOKUPS - 1):
+        positions.append(min(positions[-1] + rng.randrange(1, 32), n - 1))
+    probes: list[int] = [arr[i] for i in positions]
+    def run() -> None:
+        cursor: int = 0
+        for p in probes:
+            cursor = exponential_search(arr, p, cursor)
+    return run
+
+
+@register("search.binary_search_many", sizes=(1_000, 100_000, 1_000_000), complexity="O(n)")
+def search_binary_search_many(n: int, rng: random.Random) -> Callable[[], Any]:
+    arr: list[int] = sorted(rng.randrange(n * 4) for _ in range(n))
+    probes: list[int] = [rng.randrange(n * 4) for _ in range(LOOKUPS)]
+    return lambda: binary_search_many(arr, probes)
+
+
+@register("search.sorted_index_find", sizes=(1_000, 100_000, 1_000_000), complexity="O(log n)")
+def search_sorted_index(n: int, rng: random.Random) -> Callable[[], Any]:
+    index = SortedIndex(sorted(rng.randrange(n * 4) for _ in range(n)))
+    probes: list[int] = [rng.randrange(n * 4) for _ in range(LOOKUPS)]
+    return lambda: [index.find(p) for p in probes]
+
+
+### Graphs
+@register("graph.bfs_traversal", complexity="O(n)")
+def graph_bfs_traversal(n: int, rng: random.Random) -> Callable[[], Any]:
+    graph: dict[int, list[int]] = random_graph(n, rng)
+    return lambda: bfs_traversal(graph, 0)
+
+
+@register("graph.bfs_levels", complexity="O(n)")
+def graph_bfs_levels(n: int, rng: random.Random) -> Callable[[], Any]:
+    graph: dict[int, list[int]] = random_graph(n, rng)
+    return lambda: bfs_levels(graph, 0)
+
+
+@register("graph.bfs_shortest_distance_on_grid", sizes=(10_000, 100_000), complexity="O(n)")
+def graph_grid(n: int, rng: random.Random) -> Callable[[], Any]:
+    grid: list[list[int]] = random_grid(n, rng)
+    end: tuple[int, int] = (len(grid) - 1, len(grid) - 1)
+    return lambda: bfs_shortest_distance_on_grid(grid, (0, 0), end)
+
+
+@register("graph.grid_bfs", sizes=(10_000, 100_000), complexity="O(n)")
+def graph_grid_bfs(n: int, rng: random.Random) -> Callable[[], Any]:
+    grid: list[list[int]] = random_grid(n, rng)
+    engine: GridBFS = GridBFS(grid)
+    end: tuple[int, int] = (len(grid) - 1, len(grid) - 1)
+    return lambda: engine.shortest_path((0, 0), end, with_path=True)
+
+
+@register("graph.dfs_traversal", complexity="O(n)")
+def graph_dfs_traversal(n: int, rng: random.Random) -> Callable[[], Any]:
+    graph: dict[int, list[int]] = random_graph(n, rng)
+    return lambda: dfs_traversal(graph, 0)
+
+
+@register("graph.dfs_trees", complexity="O(n)")
+def graph_dfs_trees(n: int, rng: random.Random) -> Callable[[], Any]:
+    graph: dict[int, list[int]] = random_graph(n, rng, degree=1) # sparse, so there are many components
+    return lambda: dfs_trees(graph)
+
+
+@register("graph.topological_sort", complexity="O(n)")
+def graph_topological_sort(n: int, rng: random.Random) -> Callable[[], Any]:
+    graph: dict[int, list[int]] = random_dag(n, rng)
+    return lambda: topological_sort(graph)
+
+
+@register("graph.csr_bfs_traversal", complexity="O(n)")
+def graph_csr_bfs_traversal(n: int, rng: random.Random) -> Callable[[], Any]:
+    graph: CSRGraph = CSRGraph.from_adjacency(random_graph(n, rng))
+    start: int = max(range(n), key=graph.out_degree) # inside the giant component, node 0 can be isolated
+    return lambda: bfs_traversal(graph, start)
+
+
+@register("graph.csr_bfs_levels", complexity="O(n)")
+def graph_csr_bfs_levels(n: int, rng: random.Random) -> Callable[[], Any]:
+    graph: CSRGraph = CSRGraph.from_adjacency(random_graph(n, rng))
+    start: int = max(range(n), key=graph.out_degree) # inside the giant component, node 0 can be isolated
+    return lambda: bfs_levels(graph, start)
+
+
+@register("graph.csr_dfs_traversal", complexity="O(n)")
+def graph_csr_dfs_traversal(n: int, rng: random.Random) -> Callable[[], Any]:
+    graph: CSRGraph = CSRGraph.from_adjacency(random_graph(n, rng))
+    start: int = max(range(n), key=graph.out_degree) # inside the giant component, node 0 can be isolated
+    return lambda: dfs_traversal(graph, start)
+
+
+@register("graph.csr_dfs_trees", complexity="O(n)")
+def graph_csr_dfs_trees(n: int, rng: random.Random) -> Callable[[], Any]:
+    graph: CSRGraph = CSRGraph.from_adjacency(random_graph(n, rng, degree=1))
+    return lambda: dfs_trees(graph)
+
+
+@register("graph.csr_topological_sort", complexity="O(n)")
+def graph_csr_topological_sort(n: int, rng: random.Random) -> Callable[[], Any]:
+    graph: CSRGraph = CSRGraph.from_adjacency(random_dag(n, rng))
+    return lambda: topological_sort(graph)
+
+
+@register("graph.bidirectional_bfs", complexity="O(n)")
+def graph_bidirectional_bfs(n: int, rng: random.Random) -> Callable[[], Any]:
+    graph: CSRGraph = CSRGraph.from_adjacency(random_graph(n, rng))
+    pairs: list[tuple[int, int]] = [(rng.randrange(n), rng.randrange(n)) for _ in range(10)]
+    return lambda: [bfs_shortest_path(graph, s, t) for s, t in pairs]
+
+
+@register("graph.multi_source_bfs", complexity="O(n)")
+def graph_multi_source_bfs(n: int, rng: random.Random) -> Callable[[], Any]:
+    graph: CSRGraph = CSRGraph.from_adjacency(random_graph(n, rng))
+    sources: list[int] = [rng.randrange(n) for _ in range(16)]
+    return lambda: multi_source_bfs(graph, sources)
+
+
+@register("graph.csr_from_edges", complexity="O(n)")
+def graph_csr_from_edges(n: int, rng: random.Random) -> Callable[[], Any]:
+    graph: dict[int, list[int]] = random_graph(n, rng)
+    edges: list[tuple[int, int]] = [(u, v) for u in graph for v in graph[u]]
+    return lambda: CSRGraph.from_edges(edges, n)
+
+
+### Lists
+@register("list.linked_list_append", complexity="O(n)")
+def linked_list_append(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n) for _ in range(n)]
+    return lambda: LinkedList(values)
+
+
+@register("list.linked_list_get_value_at_index", complexity="O(n)")
+def linked_list_index(n: int, rng: random.Random) -> Callable[[], Any]:
+    linked = LinkedList(list(range(n)))
+    indices: list[int] = [rng.randrange(n) for _ in range(100)]
+    return lambda: [linked.get_value_at_index(i) for i in indices]
+
+
+@register("list.doubly_linked_list_get_value_at_index", complexity="O(n)")
+def doubly_linked_list_index(n: int, rng: random.Random) -> Callable[[], Any]:
+    linked = DoublyLinkedList(list(range(n)))
+    indices: list[int] = [rng.randrange(n) for _ in range(100)]
+    return lambda: [linked.get_value_at_index(i) for i in indices]
+
+
+@register("list.stack_push_pop", complexity="O(n)")
+def stack_push_pop(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n) for _ in range(n)]
+    def run() -> None:
+        stack = Stack()
+        for v in values:
+            stack.push(v)
+        while not stack.is_empty():
+            stack.pop()
+    return run
+
+
+@register("list.queue_enqueue_dequeue", complexity="O(n)")
+def queue_enqueue_dequeue(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n) for _ in range(n)]
+    def run() -> None:
+        queue = Queue()
+        for v in values:
+            queue.enqueue(v)
+        while not queue.is_empty():
+            queue.dequeue()
+    return run
+
+
+### Memory
+MEMORY_SIZES: tuple[int, ...] = (10_000, 100_000)
+
+
+@register("memory.linked_list", sizes=MEMORY_SIZES, kind="memory")
+def memory_linked_list(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    return lambda: LinkedList(values)
+
+
+@register("memory.doubly_linked_list", sizes=MEMORY_SIZES, kind="memory")
+def memory_doubly_linked_list(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    return lambda: DoublyLinkedList(values)
+
+
+@register("memory.stack", sizes=MEMORY_SIZES, kind="memory")
+def memory_stack(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    return lambda: Stack(values)
+
+
+@register("memory.queue", sizes=MEMORY_SIZES, kind="memory")
+def memory_queue(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    return lambda: Queue(values)
+
+
+@register("memory.bst", sizes=MEMORY_SIZES, kind="memory")
+def memory_bst(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    return lambda: BinarySearchTree(values)
+
+
+@register("memory.bplustree", sizes=MEMORY_SIZES, kind="memory")
+def memory_bplustree(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    return lambda: BPlusTree(values)
+
+
+@register("memory.heap", sizes=MEMORY_SIZES, kind="memory")
+def memory_heap(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    return lambda: Heap(values)
+
+
+@register("memory.indexed_heap", sizes=MEMORY_SIZES, kind="memory")
+def memory_indexed_heap(n: int, rng: random.Random) -> Callable[[], Any]:
+    priorities: dict[int, int] = {handle: rng.randrange(n * 10) for handle in range(n)}
+    return lambda: IndexedHeap(priorities)
+
+
+@register("memory.dary_heap", sizes=MEMORY_SIZES, kind="memory")
+def memory_dary_heap(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    return lambda: DaryHeap(values, typecode='q')
+
+
+@register("memory.pairing_heap", sizes=MEMORY_SIZES, kind="memory")
+def memory_pairing_heap(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = [rng.randrange(n * 10) for _ in range(n)]
+    return lambda: PairingHeap(values)
+
+
+@register("memory.sorted_index", sizes=MEMORY_SIZES, kind="memory")
+def memory_sorted_index(n: int, rng: random.Random) -> Callable[[], Any]:
+    values: list[int] = sorted(rng.randrange(n * 10) for _ in range(n))
+    return lambda: SortedIndex(values)
+
+
+@register("memory.graph_adjacency", sizes=MEMORY_SIZES, kind="memory")
+def memory_graph_adjacency(n: int, rng: random.Random) -> Callable[[], Any]:
+    # bytes per node of the adjacency dict, including the node ids it creates
+    return lambda: random_graph(n, random.Random(n))
+
+
+@register("memory.graph_csr", sizes=MEMORY_SIZES, kind="memory")
+def memory_graph_csr(n: int, rng: random.Random) -> Callable[[], Any]:
+    # same graph as memory.graph_adjacency, so the two are bytes per node of the same edges
+    graph: dict[int, list[int]] = random_graph(n, random.Random(n))
+    return lambda: CSRGraph.from_adjacency(graph, n)
+
+
+### Command line
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list the registered benchmarks and their sizes")
+
+    run_parser = commands.add_parser("run", help="run benchmarks and optionally save the results as JSON")
+    run_parser.add_argument("-k", "--filter", default="", help="regex, only benchmarks whose name matches")
+    run_parser.add_argument("--sizes", type=int, nargs="+", help="override the sizes of every benchmark")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--repeat", type=int, default=7)
+    run_parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per repeat")
+    run_parser.add_argument("--keep-gc", action="store_true", help="leave the garbage collector on while timing")
+    run_parser.add_argument("--out", help="JSON file to write the results to")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files, exit 1 on regressions")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown, 0.1 = 10%%")
+
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        for benchmark in select():
+            print(f"{benchmark.name:<45} sizes = {', '.join(str(n) for n in benchmark.sizes)}")
+        return 0
+
+    if args.command == "run":
+        benchmarks = select(args.filter)
+        if not benchmarks:
+            print(f"No benchmark matches {args.filter!r}")
+            return 1
+        results = run_benchmarks(benchmarks, sizes=args.sizes, seed=args.seed, repeat=args.repeat,
+                                 min_time=args.min_time, disable_gc=not args.keep_gc,
+                                 report=lambda result: print(format_result(result), flush=True))
+        if args.out:
+            save_results(results, args.out)
+            print(f"Saved {len(results)} results to {args.out}")
+        return 0
+
+    comparisons = compare_results(load_results(args.old), load_results(args.new))
+    slower = regressions(comparisons, args.threshold)
+    for c in comparisons:
+        flag: str = "REGRESSION" if c in slower else ""
+        print(f"{c.name:<45} n={c.size:<10} {c.metric}: {c.old:.6g} -> {c.new:.6g} ({c.ratio:.2f}x) {flag}")
+    print(f"{len(slower)} regression(s) above {args.threshold:.0%} out of {len(comparisons)} comparisons")
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+from typing import Any
+"""
+   Shared helper for the templates that keep plain ints/floats in a typed array instead of a list
+   (DaryHeap keys, SortedIndex values, the sparse keys of MappedRecords).
+
+   array('q') only holds ints in the int64 range and array('d') only floats, so the typecode is picked from the
+   values themselves, and anything else (mixed types, bools, ints outside int64) stays in a plain list.
+"""
+
+INT64_MIN: int = -2**63
+INT64_MAX: int = 2**63 - 1
+
+
+def fits_typecode(typecode: str, value: Any) -> bool:
+    """True if value can be stored in an array of typecode ('q' or 'd') and read back unchanged"""
+    if typecode == 'q':
+        return type(value) is int and INT64_MIN <= value <= INT64_MAX
+    if typecode == 'd':
+        return type(value) is float
+    return False
+
+
+def infer_typecode(values: list[Any]) -> str | None:
+    """Returns 'q' for all ints within int64, 'd' for all floats and None if values must be kept in a plain list"""
+    if len(values) == 0:
+        return None
+    value_type: type = type(values[0])
+    if value_type is not int and value_type is not float:
+        return None
+    for v in values:
+        if type(v) is not value_type:
+            return None
+    if value_type is float:
+        return 'd'
+    # one pass each in C instead of a range check per value
+    if min(values) < INT64_MIN or max(values) > INT64_MAX:
+        return None
+    return 'q'
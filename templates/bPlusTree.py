@@ -0,0 +1,312 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from typing import Optional, Union
+"""
+   B+ Tree: a sorted container with high fan-out. Instead of one node (and two pointers) per key,
+   every node holds up to `order` keys in a contiguous Python list that is searched with bisect.
+
+   Internal nodes only route: keys[i] separates children[i] (keys < keys[i]) from children[i+1] (keys >= keys[i]).
+   Leaves hold the actual keys, plus a `next` pointer to the leaf on their right:
+                    [ 30 | 60 ]
+                  /      |      \\
+        [10 20] -> [30 40 50] -> [60 70]      (-> is the leaf chain)
+
+   Why?
+   - Height is log_order(n) instead of log2(n), so a lookup follows ~3-4 pointers for millions of keys.
+   - Inside a node bisect runs in C over a packed list, far less pointer chasing than one BSTNode per level.
+   - Range scans find the first leaf once, then just walk the leaf chain.
+   - Memory per key is a list slot instead of a whole node object.
+
+   Duplicates are stored ONCE with a count next to them (keys and counts are parallel lists in each leaf),
+   so the routing logic only ever deals with distinct keys.
+"""
+
+
+class _Leaf:
+    __slots__ = ("keys", "counts", "next")
+
+    def __init__(self, keys: list[int], counts: list[int], next: Optional['_Leaf'] = None) -> None:
+        self.keys: list[int] = keys
+        self.counts: list[int] = counts # counts[i] = how many times keys[i] was inserted
+        self.next: Optional['_Leaf'] = next
+
+
+class _Internal:
+    __slots__ = ("keys", "children")
+
+    def __init__(self, keys: list[int], children: list[Union['_Internal', _Leaf]]) -> None:
+        self.keys: list[int] = keys
+        self.children: list[Union['_Internal', _Leaf]] = children # always len(keys) + 1 children
+
+
+class BPlusTree:
+    def __init__(self, contents: Iterable[int] | None = None, order: int = 64) -> None:
+        """
+        Args:
+            contents (Iterable[int] | None): Optional values to insert.
+            order (int): Max number of keys per node. Every node except the root keeps at least order // 2 keys.
+
+        Raises:
+            ValueError: if order < 3
+        """
+        if order < 3:
+            raise ValueError("order must be at least 3")
+
+        self.order: int = order
+        self._min_keys: int = order // 2
+        self._head: _Leaf = _Leaf([], []) # leftmost leaf, it stays the leftmost leaf through splits and merges
+        self.root: Union[_Internal, _Leaf] = self._head
+        self.num_values: int = 0
+
+        if contents is not None:
+            for c in contents:
+                self.insert(c)
+
+    def insert(self, val: int) -> None:
+        """Inserts val (duplicates allowed). O(order + log n)
+
+        Raises:
+            TypeError: Can not insert None values
+        """
+        if val is None:
+            raise TypeError("Can not insert None value into B+ Tree")
+
+        path, leaf = self._find_leaf(val)
+        self.num_values += 1
+        i: int = bisect_left(leaf.keys, val)
+        if i < len(leaf.keys) and leaf.keys[i] == val:
+            leaf.counts[i] += 1 # duplicate, nothing moves
+            return
+        leaf.keys.insert(i, val)
+        leaf.counts.insert(i, 1)
+        if len(leaf.keys) <= self.order:
+            return
+
+        # leaf overflow: the right half moves into a new leaf and its first key is pushed up as the separator
+        mid: int = len(leaf.keys) // 2
+        new_leaf: _Leaf = _Leaf(leaf.keys[mid:], leaf.counts[mid:], leaf.next)
+        del leaf.keys[mid:]
+        del leaf.counts[mid:]
+        leaf.next = new_leaf
+        separator: int = new_leaf.keys[0]
+        right: Union[_Internal, _Leaf] = new_leaf
+
+        while path:
+            parent, child_index = path.pop()
+            parent.keys.insert(child_index, separator)
+            parent.children.insert(child_index + 1, right)
+            if len(parent.keys) <= self.order:
+                return
+            # internal overflow: the middle key moves UP (it is not kept in either half)
+            mid = len(parent.keys) // 2
+            separator = parent.keys[mid]
+            right = _Internal(parent.keys[mid + 1:], parent.children[mid + 1:])
+            del parent.keys[mid:]
+            del parent.children[mid + 1:]
+
+        # the root itself was split, the tree grows one level at the top
+        self.root = _Internal([separator], [self.root, right])
+
+    def search(self, val: int) -> bool:
+        """Returns True if val is in the tree. O(log n)"""
+        if val is None:
+            raise TypeError("Can not search for None in B+ Tree")
+        leaf: _Leaf = self._find_leaf(val)[1]
+        i: int = bisect_left(leaf.keys, val)
+        return i < len(leaf.keys) and leaf.keys[i] == val
+
+    def count(self, val: int) -> int:
+        """Returns how many times val was inserted (and not deleted). O(log n)"""
+        leaf: _Leaf = self._find_leaf(val)[1]
+        i: int = bisect_left(leaf.keys, val)
+        return leaf.counts[i] if i < len(leaf.keys) and leaf.keys[i] == val else 0
+
+    def delete(self, val: int) -> bool:
+        """Deletes one occurrence of val. Returns False (and does nothing) if val is not in the tree.
+        A leaf left with fewer than order // 2 keys borrows a key from a sibling, or merges with it
+        when the sibling has none to spare. Merges can cascade up and shrink the tree from the root.
+
+        Raises:
+            TypeError: If the value to be deleted is None.
+        """
+        if val is None:
+            raise TypeError("Can not delete Null values")
+
+        path, leaf = self._find_leaf(val)
+        i: int = bisect_left(leaf.keys, val)
+        if i == len(leaf.keys) or leaf.keys[i] != val:
+            return False
+
+        self.num_values -= 1
+        if leaf.counts[i] > 1:
+            leaf.counts[i] -= 1
+            return True
+        del leaf.keys[i]
+        del leaf.counts[i]
+        # separators equal to val may stay in internal nodes, they still route correctly
+
+        node: Union[_Internal, _Leaf] = leaf
+        while path and len(node.keys) < self._min_keys:
+            parent, child_index = path.pop()
+            if isinstance(node, _Leaf):
+                self._fix_leaf_underflow(parent, child_index, node)
+            else:
+                self._fix_internal_underflow(parent, child_index, node)
+            node = parent
+
+        if isinstance(self.root, _Internal) and len(self.root.keys) == 0:
+            self.root = self.root.children[0] # root lost its last separator, its only child becomes the root
+        return True
+
+    def find_min(self) -> int:
+        """Finds the min value. O(1) through the leftmost leaf
+
+        Raises:
+            ValueError: If tree is empty
+        """
+        if self.num_values == 0:
+            raise ValueError("Empty B+ Tree does not have any min")
+        return self._head.keys[0]
+
+    def find_max(self) -> int:
+        """Finds the max value by following the rightmost child down. O(log n)
+
+        Raises:
+            ValueError: If tree is empty
+        """
+        if self.num_values == 0:
+            raise ValueError("Empty B+ Tree does not have any max")
+        node: Union[_Internal, _Leaf] = self.root
+        while isinstance(node, _Internal):
+            node = node.children[-1]
+        return node.keys[-1]
+
+    def is_empty(self) -> bool:
+        return self.num_values == 0
+
+    def __len__(self) -> int:
+        return self.num_values
+
+    def __contains__(self, val: int) -> bool:
+        return self.search(val)
+
+    def __iter__(self) -> Iterator[int]:
+        """Yields every value in ascending order (duplicates repeated) by walking the leaf chain"""
+        leaf: Optional[_Leaf] = self._head
+        while leaf is not None:
+            yield from self._expand(leaf, 0, len(leaf.keys))
+            leaf = leaf.next
+
+    def iter_range(self, lo: int, hi: int) -> Iterator[int]:
+        """Yields the values v with lo <= v <= hi in ascending order.
+        One descent to the leaf of lo, then a walk along the leaf chain until a key passes hi."""
+        leaf: Optional[_Leaf] = self._find_leaf(lo)[1]
+        i: int = bisect_left(leaf.keys, lo) # type: ignore[union-attr]
+        while leaf is not None:
+            keys: list[int] = leaf.keys
+            if keys and keys[-1] <= hi:
+                end: int = len(keys) # whole rest of the leaf is in range
+            else:
+                end = bisect_right(keys, hi)
+            yield from self._expand(leaf, i, end)
+            if end < len(keys):
+                return
+            leaf = leaf.next
+            i = 0
+
+    def inorder_traversal(self) -> list[int]:
+        """Returns every value in ascending order, same as BinarySearchTree.inorder_traversal
+
+        Raises:
+            ValueError: If the tree is empty.
+        """
+        if self.num_values == 0:
+            raise ValueError("Can not traverse an Empty B+ Tree")
+        return list(self)
+
+    def height(self) -> int:
+        """Number of levels, a tree that is a single leaf has height 1. Returns -1 if empty"""
+        if self.num_values == 0:
+            return -1
+        levels: int = 1
+        node: Union[_Internal, _Leaf] = self.root
+        while isinstance(node, _Internal):
+            node = node.children[0]
+            levels += 1
+        return levels
+
+    ### Internal Methods
+    @staticmethod
+    def _expand(leaf: _Leaf, start: int, end: int) -> Iterable[int]:
+        """Returns leaf.keys[start:end] with every key repeated by its count"""
+        if sum(leaf.counts[start:end]) == end - start:
+            return leaf.keys[start:end] # no duplicates in this slice, one C level copy
+        return [key for key, count in zip(leaf.keys[start:end], leaf.counts[start:end]) for _ in range(count)]
+    
+    def _find_leaf(self, val: int) -> tuple[list[tuple[_Internal, int]], _Leaf]:
+        """Descends to the leaf that holds (or would hold) val.
+        Returns the path as (internal node, index of the child taken) pairs, and the leaf."""
+        path: list[tuple[_Internal, int]] = []
+        node: Union[_Internal, _Leaf] = self.root
+        while isinstance(node, _Internal):
+            child_index: int = bisect_right(node.keys, val) # equal to a separator -> go right
+            path.append((node, child_index))
+            node = node.children[child_index]
+        return path, node
+
+    def _fix_leaf_underflow(self, parent: _Internal, child_index: int, leaf: _Leaf) -> None:
+        """leaf (parent.children[child_index]) has too few keys: borrow from a sibling or merge with it"""
+        left: Optional[_Leaf] = parent.children[child_index - 1] if child_index > 0 else None # type: ignore[assignment]
+        right: Optional[_Leaf] = (parent.children[child_index + 1] # type: ignore[assignment]
+                                  if child_index + 1 < len(parent.children) else None)
+
+        if left is not None and len(left.keys) > self._min_keys:
+            # borrow the biggest key of the left sibling, leaf now starts with it
+            leaf.keys.insert(0, left.keys.pop())
+            leaf.counts.insert(0, left.counts.pop())
+            parent.keys[child_index - 1] = leaf.keys[0]
+        elif right is not None and len(right.keys) > self._min_keys:
+            # borrow the smallest key of the right sibling, right now starts later
+            leaf.keys.append(right.keys.pop(0))
+            leaf.counts.append(right.counts.pop(0))
+            parent.keys[child_index] = right.keys[0]
+        elif left is not None:
+            # merge leaf into left and drop leaf from the chain and from the parent
+            left.keys.extend(leaf.keys)
+            left.counts.extend(leaf.counts)
+            left.next = leaf.next
+            del parent.keys[child_index - 1]
+            del parent.children[child_index]
+        elif right is not None:
+            # merge right into leaf
+            leaf.keys.extend(right.keys)
+            leaf.counts.extend(right.counts)
+            leaf.next = right.next
+            del parent.keys[child_index]
+            del parent.children[child_index + 1]
+
+    def _fix_internal_underflow(self, parent: _Internal, child_index: int, node: _Internal) -> None:
+        """node (parent.children[child_index]) has too few keys: rotate a key through the parent or merge.
+        Unlike leaves, the separator in the parent comes DOWN into the node (and a sibling key goes up)."""
+        left: Optional[_Internal] = parent.children[child_index - 1] if child_index > 0 else None # type: ignore[assignment]
+        right: Optional[_Internal] = (parent.children[child_index + 1] # type: ignore[assignment]
+                                      if child_index + 1 < len(parent.children) else None)
+
+        if left is not None and len(left.keys) > self._min_keys:
+            node.keys.insert(0, parent.keys[child_index - 1])
+            parent.keys[child_index - 1] = left.keys.pop()
+            node.children.insert(0, left.children.pop())
+        elif right is not None and len(right.keys) > self._min_keys:
+            node.keys.append(parent.keys[child_index])
+            parent.keys[child_index] = right.keys.pop(0)
+            node.children.append(right.children.pop(0))
+        elif left is not None:
+            left.keys.append(parent.keys.pop(child_index - 1))
+            left.keys.extend(node.keys)
+            left.children.extend(node.children)
+            del parent.children[child_index]
+        elif right is not None:
+            node.keys.append(parent.keys.pop(child_index))
+            node.keys.extend(right.keys)
+            node.children.extend(right.children)
+            del parent.children[child_index + 1]
@@ -1,11 +1,17 @@
+from array import array
 from collections import deque
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any, Optional
 
-def bfs_traversal(graph: dict[int, list[int]], 
+from templates.csrGraph import CSRGraph
+
+def bfs_traversal(graph: dict[int, list[int]] | CSRGraph, 
                   start: int) -> list[int]:
     """Returns List of nodes traversed in BFS fashion. 
 
     Args:
-        graph (dict[int, list[int]]): undirected graph represented as adjacency list
+        graph (dict[int, list[int]] | CSRGraph): undirected graph represented as adjacency list or CSR
         start (int): start node
 
     Returns:
@@ -14,6 +20,9 @@ def bfs_traversal(graph: dict[int, list[int]],
     Time Complexity: O(V + E) where V is number of vertices and E is number of edges
     Space Complexity: O(V) for queue and visited set
     """
+    if isinstance(graph, CSRGraph):
+        return _bfs_traversal_csr(graph, start)
+    
     Q: deque[int] = deque([start])
     visited: set[int] = {start}
     result: list[int] = []
@@ -32,7 +41,24 @@ def bfs_traversal(graph: dict[int, list[int]],
                 
     return result
 
-def bfs_levels(graph: dict[int, list[int]], 
+def _bfs_traversal_csr(graph: CSRGraph, start: int) -> list[int]:
+    """bfs_traversal over a CSRGraph. Nodes come off the queue in the order they were added, so the result list
+    is the queue itself: head is the next node to process."""
+    offsets, targets = graph.offsets, graph.targets
+    visited: bytearray = bytearray(graph.num_nodes)
+    visited[start] = 1
+    result: list[int] = [start]
+    head: int = 0
+    while head < len(result):
+        current_node: int = result[head]
+        head += 1
+        for neighbor in targets[offsets[current_node]:offsets[current_node + 1]]:
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                result.append(neighbor)
+    return result
+
+def bfs_levels(graph: dict[int, list[int]] | CSRGraph, 
                start: int = 0) -> list[list[int]]:
     """Performs level-order traversal of graph, grouping nodes by their distance from start.
     
@@ -41,8 +67,8 @@ def bfs_levels(graph: dict[int, list[int]],
     level 2 contains nodes that are two edges away, and so on.
 
     Args:
-        graph (dict[int, list[int]]): Graph represented as adjacency list where
-            key is node and value is list of its neighbors
+        graph (dict[int, list[int]] | CSRGraph): Graph represented as adjacency list where
+            key is node and value is list of its neighbors, or as CSR
         start (int, optional): Starting node for traversal. Defaults to 0.
 
     Returns:
@@ -57,6 +83,9 @@ def bfs_levels(graph: dict[int, list[int]],
     Time Complexity: O(V + E) where V is number of vertices and E is number of edges
     Space Complexity: O(V) for queue and visited set
     """
+    if isinstance(graph, CSRGraph):
+        return _bfs_levels_csr(graph, start)
+    
     Q: deque[int] = deque([start])
     discovered: set[int] = {start}
     result: list[list[int]] = []
@@ -80,6 +109,24 @@ def bfs_levels(graph: dict[int, list[int]],
     
     return result
 
+def _bfs_levels_csr(graph: CSRGraph, start: int) -> list[list[int]]:
+    """bfs_levels over a CSRGraph, the next level is built while scanning the current one"""
+    offsets, targets = graph.offsets, graph.targets
+    discovered: bytearray = bytearray(graph.num_nodes)
+    discovered[start] = 1
+    current_level: list[int] = [start]
+    result: list[list[int]] = []
+    while current_level:
+        result.append(current_level)
+        next_level: list[int] = []
+        for current_node in current_level:
+            for neighbor in targets[offsets[current_node]:offsets[current_node + 1]]:
+                if not discovered[neighbor]:
+                    discovered[neighbor] = 1
+                    next_level.append(neighbor)
+        current_level = next_level
+    return result
+
 def bfs_shortest_distance_on_grid(grid: list[list[int]], 
                                   start: tuple[int, int],
                                   end: tuple[int, int]) -> int:
@@ -162,5 +209,213 @@ def bfs_shortest_distance_on_grid(grid: list[list[int]],
         return -1
     else:
         return dist[end[0]][end[1]]
-        
-        
\ No newline at end of file
+
+
+@dataclass
+class PathResult:
+    distance: int                 # number of edges on a shortest path, -1 if target can't be reached
+    path: Optional[list[Any]]     # source ... target, only filled when asked for (and reachable)
+    visited: int                  # nodes discovered by the search, to compare how much of the graph it explored
+
+
+def bfs_shortest_path(graph: dict[int, list[int]] | CSRGraph, source: int, target: int,
+                      bidirectional: bool = True, with_path: bool = False,
+                      reverse: dict[int, list[int]] | None = None) -> PathResult:
+    """Shortest path (fewest edges) from source to target.
+
+    Plain BFS explores every node closer to source than target is: on a graph where the number of nodes within d
+    steps grows like b^d that is ~b^D nodes. Bidirectional BFS grows one ball around source and one around target,
+    always the one with the smaller frontier, and stops when they touch: ~2 * b^(D/2) nodes.
+
+    Why can it stop at the first node found by both? Before the expanded level the two balls (radius k around source,
+    j around target) did not touch, so every path is longer than k + j. The meeting node is at k + 1 from source and
+    at most j from target, so that path has exactly k + 1 + j edges, the shortest possible.
+
+    Args:
+        graph (dict[int, list[int]] | CSRGraph): adjacency list or CSR
+        source (int): start node
+        target (int): node to reach
+        bidirectional (bool): search from both ends. Defaults to True, False runs a plain BFS that stops at target.
+        with_path (bool): also return the nodes of one shortest path. Defaults to False.
+        reverse (dict[int, list[int]] | None): in-neighbors of every node, the backward search walks edges
+            backwards so directed adjacency dicts need it. Defaults to graph itself (undirected).
+            For a CSRGraph the reverse index of the graph is used.
+
+    Returns:
+        PathResult: distance (-1 if unreachable), path if requested, number of visited nodes
+
+    Time Complexity: O(V + E) worst case
+    Space Complexity: O(V)
+    """
+    forward: Callable[[int], Iterable[int]] = graph.__getitem__
+    if not bidirectional:
+        return _bfs_path(source, target, forward, with_path)
+    if isinstance(graph, CSRGraph):
+        backward: Callable[[int], Iterable[int]] = graph.reverse().__getitem__
+    else:
+        backward = (graph if reverse is None else reverse).__getitem__
+    return _bidirectional_bfs_path(source, target, forward, backward, with_path)
+
+def bfs_shortest_path_on_grid(grid: list[list[int]], start: tuple[int, int], end: tuple[int, int],
+                              bidirectional: bool = True, with_path: bool = False) -> PathResult:
+    """bfs_shortest_path on a grid with 0 for valid cell and 1 for blocked cell (same grid as
+    bfs_shortest_distance_on_grid), moving up, down, left and right. The path is a list of (x, y) cells.
+
+    Returns:
+        PathResult: distance (-1 if start or end is blocked or unreachable), path if requested, visited cells
+    """
+    numRows: int = len(grid)
+    numCols: int = len(grid[0])
+    movements: tuple[tuple[int, int], ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+    
+    def is_valid_coordinate(x: int, y: int) -> bool:
+        return 0 <= x < numRows and 0 <= y < numCols and grid[x][y] == 0
+    
+    def neighbors(cell: tuple[int, int]) -> list[tuple[int, int]]:
+        x, y = cell
+        return [(x + dx, y + dy) for dx, dy in movements if is_valid_coordinate(x + dx, y + dy)]
+    
+    if not is_valid_coordinate(*start) or not is_valid_coordinate(*end):
+        return PathResult(-1, None, 0)
+    if not bidirectional:
+        return _bfs_path(start, end, neighbors, with_path)
+    return _bidirectional_bfs_path(start, end, neighbors, neighbors, with_path) # moves are symmetric
+
+def _walk_parents(parent: dict[Hashable, Hashable], node: Hashable) -> list[Any]:
+    """node, parent[node], ... up to the root of the search (the node that is its own parent)"""
+    path: list[Any] = [node]
+    while parent[node] != node:
+        node = parent[node]
+        path.append(node)
+    return path
+
+def _bfs_path(source: Hashable, target: Hashable, neighbors: Callable[[Any], Iterable[Any]],
+              with_path: bool) -> PathResult:
+    """Level by level BFS from source that stops as soon as target is discovered"""
+    parent: dict[Hashable, Hashable] = {source: source} # doubles as the visited set
+    if source == target:
+        return PathResult(0, [source] if with_path else None, 1)
+    frontier: list[Any] = [source]
+    depth: int = 0
+    while frontier:
+        depth += 1
+        next_frontier: list[Any] = []
+        for node in frontier:
+            for neighbor in neighbors(node):
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    if neighbor == target:
+                        path: Optional[list[Any]] = _walk_parents(parent, target)[::-1] if with_path else None
+                        return PathResult(depth, path, len(parent))
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return PathResult(-1, None, len(parent))
+
+def _expand_level(frontier: list[Any], neighbors: Callable[[Any], Iterable[Any]], parent: dict[Hashable, Hashable],
+                  other_parent: dict[Hashable, Hashable]) -> tuple[list[Any], Any]:
+    """Discovers the next level of one side. Returns (next frontier, first node also seen by the other side or None)"""
+    next_frontier: list[Any] = []
+    for node in frontier:
+        for neighbor in neighbors(node):
+            if neighbor not in parent:
+                parent[neighbor] = node
+                if neighbor in other_parent:
+                    return next_frontier, neighbor
+                next_frontier.append(neighbor)
+    return next_frontier, None
+
+def _bidirectional_bfs_path(source: Hashable, target: Hashable, forward: Callable[[Any], Iterable[Any]],
+                            backward: Callable[[Any], Iterable[Any]], with_path: bool) -> PathResult:
+    """Grows the smaller of the two frontiers one whole level at a time until they meet"""
+    if source == target:
+        return PathResult(0, [source] if with_path else None, 1)
+    parent_forward: dict[Hashable, Hashable] = {source: source}
+    parent_backward: dict[Hashable, Hashable] = {target: target} # parent here is the next node towards target
+    frontier_forward: list[Any] = [source]
+    frontier_backward: list[Any] = [target]
+    depth_forward: int = 0
+    depth_backward: int = 0
+    
+    while frontier_forward and frontier_backward:
+        if len(frontier_forward) <= len(frontier_backward):
+            frontier_forward, meet = _expand_level(frontier_forward, forward, parent_forward, parent_backward)
+            depth_forward += 1
+        else:
+            frontier_backward, meet = _expand_level(frontier_backward, backward, parent_backward, parent_forward)
+            depth_backward += 1
+        if meet is not None:
+            path: Optional[list[Any]] = None
+            if with_path:
+                path = _walk_parents(parent_forward, meet)[::-1] + _walk_parents(parent_backward, meet)[1:]
+            # the meeting node is counted by both sides
+            return PathResult(depth_forward + depth_backward, path, len(parent_forward) + len(parent_backward) - 1)
+    # one side ran out of nodes without meeting the other, so they are in different components
+    return PathResult(-1, None, len(parent_forward) + len(parent_backward))
+
+
+def multi_source_bfs(graph: dict[int, list[int]] | CSRGraph,
+                     sources: Iterable[int]) -> tuple[dict[int, int], dict[int, int]] | tuple[array, array]:
+    """Distance from every node to its NEAREST source, and which source that is, in one BFS.
+    The queue starts with all sources at distance 0, so every node is reached first from the closest one,
+    in O(V + E) total instead of O(k * (V + E)) for k separate searches. Ties go to the source listed first.
+
+    Example:
+        >>> graph = {0: [1], 1: [0, 2], 2: [1, 3], 3: [2, 4], 4: [3]}
+        >>> multi_source_bfs(graph, [0, 4])
+        ({0: 0, 4: 0, 1: 1, 3: 1, 2: 2}, {0: 0, 4: 4, 1: 0, 3: 4, 2: 0})
+
+    Args:
+        graph (dict[int, list[int]] | CSRGraph): adjacency list or CSR
+        sources (Iterable[int]): nodes to start from
+
+    Returns:
+        (distance, label): label[node] is the nearest source. For an adjacency dict both are dicts holding only the
+        reachable nodes; for a CSRGraph both are array('q') indexed by node with -1 for unreachable nodes.
+
+    Time Complexity: O(V + E)
+    Space Complexity: O(V)
+    """
+    if isinstance(graph, CSRGraph):
+        return _multi_source_bfs_csr(graph, sources)
+    
+    distance: dict[int, int] = {}
+    label: dict[int, int] = {}
+    Q: deque[int] = deque()
+    for source in sources:
+        if source not in distance:
+            distance[source] = 0
+            label[source] = source
+            Q.append(source)
+    
+    while Q:
+        current_node: int = Q.popleft()
+        for neighbor in graph[current_node]:
+            if neighbor not in distance:
+                distance[neighbor] = distance[current_node] + 1
+                label[neighbor] = label[current_node] # inherited from whichever source got here first
+                Q.append(neighbor)
+    return distance, label
+
+def _multi_source_bfs_csr(graph: CSRGraph, sources: Iterable[int]) -> tuple[array, array]:
+    """multi_source_bfs over a CSRGraph, distance doubles as the visited marks (-1 = not seen yet)"""
+    offsets, targets = graph.offsets, graph.targets
+    distance: array = array('q', [-1]) * graph.num_nodes
+    label: array = array('q', [-1]) * graph.num_nodes
+    queue: list[int] = []
+    for source in sources:
+        if distance[source] == -1:
+            distance[source] = 0
+            label[source] = source
+            queue.append(source)
+    
+    head: int = 0
+    while head < len(queue):
+        current_node: int = queue[head]
+        head += 1
+        next_distance: int = distance[current_node] + 1
+        for neighbor in targets[offsets[current_node]:offsets[current_node + 1]]:
+            if distance[neighbor] == -1:
+                distance[neighbor] = next_distance
+                label[neighbor] = label[current_node]
+                queue.append(neighbor)
+    return distance, label
@@ -1,12 +1,23 @@
 from utils.timing_utils import measure_time
-from typing import TypedDict
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from typing import Any, TypedDict
+
+try:
+    import numpy as np # optional, only used when NumPy arrays are passed to binary_search_many
+except ImportError:
+    np = None
 
 '''
 Problem: Given SORTED array of numbers, find query number with fewest comparisons. Output the index of query.
 If no number found, return -1.
 
 Note: if the requirement was to return the index of first or last occurance (in case of repeating numbers) then 
-we wull have to edit the standard implementation.
+we wull have to edit the standard implementation. That is what lower_bound / upper_bound / equal_range below do.
+
+Every search takes an optional key function, the array is searched by key(element) without building a projected
+list (e.g. key=lambda row: row.timestamp). The array must be sorted by that key.
 '''
 
 
@@ -16,7 +27,7 @@ def linear_search(arr: list[int], query: int) -> int:
             return index
     return -1
 
-def binary_search(arr: list[int], query: int) -> int:
+def binary_search(arr: list[int], query: int, key: Callable[[Any], Any] | None = None) -> int:
     # empty array -> return -1 right away (small obvious optimization)
     if len(arr) == 0:
         return -1
@@ -26,15 +37,202 @@ def binary_search(arr: list[int], query: int) -> int:
     
     while left <= right:
         mid: int = (left + right) // 2
-        if arr[mid] == query:
+        value: Any = arr[mid] if key is None else key(arr[mid])
+        if value == query:
             return mid
-        elif arr[mid] > query:
+        elif value > query:
             right = mid - 1
         else:
             left = mid + 1
     # if we havent returned index so far then no match was found
     return -1
 
+def lower_bound(arr: Sequence[Any], query: Any, lo: int = 0, hi: int | None = None,
+                key: Callable[[Any], Any] | None = None) -> int:
+    """
+    Returns the first index i in [lo, hi) with arr[i] >= query, or hi if there is none.
+    If query is in arr this is the index of its FIRST occurrence.
+    Invariant: everything before lo is < query and everything from hi on is >= query, so the loop only
+    needs one comparison per step and ends when the two meet. O(log(hi - lo))
+    """
+    if hi is None:
+        hi = len(arr)
+    while lo < hi:
+        mid: int = (lo + hi) // 2
+        value: Any = arr[mid] if key is None else key(arr[mid])
+        if value < query:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def upper_bound(arr: Sequence[Any], query: Any, lo: int = 0, hi: int | None = None,
+                key: Callable[[Any], Any] | None = None) -> int:
+    """
+    Returns the first index i in [lo, hi) with arr[i] > query, or hi if there is none.
+    If query is in arr this is one past its LAST occurrence. O(log(hi - lo))
+    """
+    if hi is None:
+        hi = len(arr)
+    while lo < hi:
+        mid: int = (lo + hi) // 2
+        value: Any = arr[mid] if key is None else key(arr[mid])
+        if value <= query:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def equal_range(arr: Sequence[Any], query: Any, key: Callable[[Any], Any] | None = None) -> tuple[int, int]:
+    """
+    Returns (first, last + 1): arr[first:last + 1] are exactly the elements equal to query.
+    Both are the insertion point when query is missing, so the count is always end - start. O(log n)
+    """
+    start: int = lower_bound(arr, query, key=key)
+    # every match is at or after start, so the second search only looks at the rest
+    return start, upper_bound(arr, query, lo=start, key=key)
+
+def exponential_search(arr: Sequence[Any], query: Any, start: int = 0,
+                       key: Callable[[Any], Any] | None = None) -> int:
+    """
+    Galloping search: same answer as lower_bound(arr, query) but starts at a hint instead of the middle.
+    Probes start + 1, start + 2, start + 4, ... (or backwards if the answer is before start) until it passes
+    query, then binary searches the last gap. O(log d) where d is the distance from start to the answer,
+    instead of O(log n). Useful for a cursor that moves a little between lookups (pass the previous answer as start).
+
+    len(arr) is never called, so arr can be a sequence of unknown length: probing past the end (IndexError)
+    just ends the forward gallop.
+
+    Returns:
+        int: the first index i with arr[i] >= query (the length of arr if there is none)
+    """
+    def _at(index: int) -> Any:
+        return arr[index] if key is None else key(arr[index])
+    
+    try:
+        forward: bool = _at(start) < query
+    except IndexError:
+        forward = False # start is past the end, the answer is at or before it
+    
+    if forward:
+        # gallop forward: the answer is in (lo, hi], arr[lo] < query is known
+        lo: int = start
+        step: int = 1
+        while True:
+            hi: int = start + step
+            try:
+                if not _at(hi) < query:
+                    break
+            except IndexError:
+                break
+            lo = hi
+            step *= 2
+        # the last probe either failed or went past the end, the answer is in (lo, hi]
+        return _bounded_lower_bound(_at, query, lo + 1, hi)
+    
+    # gallop backward: arr[start] >= query (or start is past the end), the answer is in [lo, hi]
+    hi = start
+    step = 1
+    while True:
+        lo = start - step
+        if lo <= 0:
+            lo = 0
+            break
+        try:
+            smaller: bool = _at(lo) < query
+        except IndexError:
+            smaller = False # still past the end of a sequence of unknown length
+        if smaller:
+            lo += 1 # arr[lo] is too small, so the answer is after it
+            break
+        hi = lo
+        step *= 2
+    return _bounded_lower_bound(_at, query, lo, hi)
+
+def _bounded_lower_bound(at: Callable[[int], Any], query: Any, lo: int, hi: int) -> int:
+    """lower_bound over [lo, hi) where the answer is known to be <= hi. Probes can still raise IndexError past
+    the end of a sequence of unknown length, that counts as >= query"""
+    while lo < hi:
+        mid: int = (lo + hi) // 2
+        try:
+            smaller: bool = at(mid) < query
+        except IndexError:
+            smaller = False
+        if smaller:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def binary_search_many(arr: Sequence[int], queries: Sequence[int], strategy: str = "auto") -> Any:
+    """
+    Answers many queries against the same SORTED array in one call, instead of one binary_search call per query.
+    With repeated numbers the index of the FIRST occurrence is returned.
+
+    Strategies:
+        "numpy":  vectorized searchsorted over the whole batch, needs NumPy. O(m log n) but in C
+        "merge":  sorts the queries, then walks arr and the sorted queries together like the merge step of
+                  merge sort. O(n + m log m), wins when m log n is bigger than n
+        "bounds": one C bisect per query, but the lower search bound is reused from the previous query when the
+                  queries come in ascending order, so every search only looks at arr[previous answer:].
+                  O(m log n) worst case
+        "auto":   "numpy" when arr or queries is a NumPy array, "merge" for big batches, "bounds" otherwise
+
+    Args:
+        arr (Sequence[int]): sorted list, array or NumPy array
+        queries (Sequence[int]): numbers to look up, in any order
+        strategy (str): one of the above. Defaults to "auto".
+
+    Raises:
+        ValueError: unknown strategy, or "numpy" without NumPy installed
+
+    Returns:
+        array('q') (or a NumPy int64 array for "numpy"): result[i] is the index of queries[i] in arr, -1 if missing
+    """
+    n: int = len(arr)
+    m: int = len(queries)
+    if strategy == "auto":
+        if np is not None and (isinstance(arr, np.ndarray) or isinstance(queries, np.ndarray)):
+            strategy = "numpy"
+        else:
+            strategy = "merge" if m * max(n, 1).bit_length() > n else "bounds"
+    
+    if strategy == "numpy":
+        if np is None:
+            raise ValueError("The numpy strategy needs NumPy installed")
+        if n == 0:
+            return np.full(m, -1, dtype=np.int64)
+        haystack = np.asarray(arr)
+        needles = np.asarray(queries)
+        positions = np.searchsorted(haystack, needles, side="left")
+        clipped = np.minimum(positions, n - 1) # positions == n means bigger than everything
+        found = (positions < n) & (haystack[clipped] == needles)
+        return np.where(found, positions, -1).astype(np.int64)
+    
+    result: array = array('q', [-1]) * m
+    if strategy == "merge":
+        order: list[int] = sorted(range(m), key=queries.__getitem__) # query positions by ascending value
+        i: int = 0
+        for q in order:
+            query: int = queries[q]
+            while i < n and arr[i] < query: # i only moves forward, so the whole walk over arr is O(n)
+                i += 1
+            if i < n and arr[i] == query:
+                result[q] = i
+        return result
+    if strategy == "bounds":
+        lo: int = 0
+        previous: Any = queries[0] if m > 0 else None
+        for q, query in enumerate(queries):
+            if query < previous:
+                lo = 0 # queries went down, the old bound is no longer valid
+            lo = bisect_left(arr, query, lo)
+            if lo < n and arr[lo] == query:
+                result[q] = lo
+            previous = query
+        return result
+    raise ValueError(f"Unknown strategy {strategy!r}, use 'auto', 'numpy', 'merge' or 'bounds'")
+
 class Test(TypedDict):
     input: list[int]
     query: int
@@ -48,6 +246,20 @@ tests: list[Test] = [
     {'input': [], 'query': 5, 'output': -1}
 ]
 
+class RangeTest(TypedDict):
+    input: list[int]
+    query: int
+    output: tuple[int, int] # (lower bound, upper bound)
+
+# Test cases with repeating numbers for lower_bound / upper_bound / equal_range / exponential_search
+range_tests: list[RangeTest] = [
+    {'input': [1, 2, 2, 2, 3], 'query': 2, 'output': (1, 4)},
+    {'input': [1, 2, 2, 2, 3], 'query': 0, 'output': (0, 0)},
+    {'input': [1, 2, 2, 2, 3], 'query': 9, 'output': (5, 5)},
+    {'input': [5, 5, 5], 'query': 5, 'output': (0, 3)},
+    {'input': [], 'query': 5, 'output': (0, 0)}
+]
+
 def run_tests(test_arr: list[Test]) -> None:
     """
     Runs binary search and linear search tests on a list of test cases.
@@ -89,7 +301,40 @@ def run_tests(test_arr: list[Test]) -> None:
             print(f"Linear Search test {index} failed ❌")
             print(f"input = {input}, query = {query}, expected output = {expected_out}")
             print()
+    
+    print()
+    # third, run the batched search with both pure Python strategies
+    for strategy in ("merge", "bounds"):
+        for index, test in enumerate(test_arr):
+            bm_out: array = binary_search_many(test['input'], [test['query']], strategy)
             
-# Run tests
-run_tests(tests)
+            if bm_out[0] == test['output']:
+                print(f"Batched Search ({strategy}) test {index} passed ✅")
+            else:
+                print(f"Batched Search ({strategy}) test {index} failed ❌")
+                print(f"input = {test['input']}, query = {test['query']}, expected output = {test['output']}")
+                print()
+
+def run_range_tests(test_arr: list[RangeTest]) -> None:
+    """Runs equal_range, and exponential_search from every start position, on a list of test cases"""
+    for index, test in enumerate(test_arr):
+        input: list[int] = test['input']
+        query: int = test['query']
+        expected_out: tuple[int, int] = test['output']
+        
+        er_out: tuple[int, int] = equal_range(input, query)
+        es_outs: set[int] = {exponential_search(input, query, start) for start in range(len(input) + 1)}
+        
+        if er_out == expected_out and es_outs == {expected_out[0]}:
+            print(f"Equal Range test {index} passed ✅")
+        else:
+            print(f"Equal Range test {index} failed ❌")
+            print(f"input = {input}, query = {query}, expected output = {expected_out}")
+            print()
+
+if __name__ == "__main__":
+    # Run tests
+    run_tests(tests)
+    print()
+    run_range_tests(range_tests)
         
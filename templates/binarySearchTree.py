@@ -1,25 +1,52 @@
 from dataclasses import dataclass, field
 from typing import Optional
 from collections import deque
+from collections.abc import Iterable, Iterator
 
 @dataclass
 class BSTNode:
     value: int
     right: Optional['BSTNode'] = field(default=None)
     left: Optional['BSTNode'] = field(default=None)
+    height: int = field(default=1) # number of nodes on the longest path down to a leaf (leaf = 1)
+    size: int = field(default=1) # number of nodes in the subtree rooted here (order statistics)
+    total: int = field(default=0) # sum of the values in the subtree rooted here. Set to value for a new leaf
+    height_balanced: bool = field(default=True) # True if every node in this subtree has children heights within 1
 
 
 class BinarySearchTree:
-    def __init__(self, contents: list[int] | None = None) -> None:
+    def __init__(self, contents: list[int] | None = None, balanced: bool = False, persistent: bool = False) -> None:
+        """
+        Args:
+            contents (list[int] | None): Optional values to insert.
+            balanced (bool): When True the tree is an AVL tree. Every insert and delete rotates nodes on the way
+                             back up so the heights of the two subtrees of ANY node differ by at most 1,
+                             which keeps the height O(log n) even for sorted input. Defaults to False.
+            persistent (bool): When True nodes are never modified once they are part of the tree. insert and delete
+                               copy the O(height) nodes on the path they change (path copying) and link the copies
+                               into a new root, every other node is shared with the previous version.
+                               This is what makes snapshot() O(1). Defaults to False.
+        """
         self.root: Optional[BSTNode] = None
         self.num_nodes: int = 0
+        self.balanced: bool = balanced
+        self.persistent: bool = persistent
+        # cached min and max values so find_min/find_max don't walk a spine. Only meaningful when not empty
+        self._min: int = 0
+        self._max: int = 0
+        # (root, num_nodes, min, max) of the last finished update, replaced with a single assignment in persistent
+        # mode so snapshot() never sees a half done update
+        self._version: tuple[Optional[BSTNode], int, int, int] = (None, 0, 0, 0)
+        # nodes the last insert/delete (or _counted_search) compared val with on its way down, read by utils.instrumentation
+        self.last_path_length: int = 0
         
         if contents is not None:
             for c in contents:
                 self.insert(c)
 
     def insert(self, val: int) -> BSTNode:
-        """Inserts a integer into BST. Increments the num_nodes as well
+        """Inserts a integer into BST. Increments the num_nodes as well.
+        Iterative: walks down remembering the path, attaches the new leaf, then fixes the nodes on the path bottom up.
 
         Args:
             val (int): integer to be inserted
@@ -33,20 +60,47 @@ class BinarySearchTree:
         if val is None:
             raise TypeError("Can not insert None value into Binary Search Tree")
         
-        # we will call this recursive method starting from root
-        def __insert_recursive(curr: Optional['BSTNode'], val: int) -> BSTNode:
-            # Base Case:
-            if curr is None:
-                self.num_nodes += 1
-                return BSTNode(value=val, right=None, left=None)
+        new_node: BSTNode = BSTNode(value=val, right=None, left=None, total=val)
+        self.num_nodes += 1
+        if self.root is None:
+            self.root = new_node
+            self._min = self._max = val
+            self.last_path_length = 0
+            self._publish()
+            return self.root
+        if val < self._min:
+            self._min = val
+        if val > self._max:
+            self._max = val
+        
+        persistent: bool = self.persistent
+        path: list[BSTNode] = [] # every node we pass, their heights may change
+        curr: BSTNode = self.root
+        if persistent:
+            curr = self.root = self._copy_node(curr)
+        while True:
+            path.append(curr)
+            curr.size += 1 # the new node will end up somewhere below curr
+            curr.total += val
             if val >= curr.value:
-                curr.right = __insert_recursive(curr.right, val)
+                if curr.right is None:
+                    curr.right = new_node
+                    break
+                if persistent:
+                    curr.right = self._copy_node(curr.right) # only the copy is modified, older versions keep the original
+                curr = curr.right
             else:
                 # val < curr.value
-                curr.left = __insert_recursive(curr.left, val)
-            return curr
-            
-        self.root = __insert_recursive(self.root, val)
+                if curr.left is None:
+                    curr.left = new_node
+                    break
+                if persistent:
+                    curr.left = self._copy_node(curr.left)
+                curr = curr.left
+        
+        self.last_path_length = len(path)
+        self._retrace(path)
+        self._publish()
         return self.root
             
 
@@ -63,25 +117,37 @@ class BinarySearchTree:
         if val is None:
             raise TypeError("Can not search for None in BST")
         
-        if self.is_empty():
-            return None # there is nothing to search in an empty BST
-        
-        def __search_recursive(curr: Optional['BSTNode']) -> Optional[BSTNode]:
-            if curr is None:
-                return None # couldn't find the desired node
-            elif curr.value == val:
+        curr: Optional['BSTNode'] = self.root # empty tree just skips the loop
+        while curr is not None:
+            if curr.value == val:
                 return curr # return the desired node since we found it
             elif val >= curr.value:
-                return __search_recursive(curr.right) # explore right subtree
+                curr = curr.right # explore right subtree
             else:
-                return __search_recursive(curr.left) # explore left subtree
-        return __search_recursive(self.root)
+                curr = curr.left # explore left subtree
+        return None # couldn't find the desired node
+
+    def _counted_search(self, val: int) -> Optional[BSTNode]:
+        """search that also sets last_path_length. Same walk as search, kept apart because a counter in the loop
+        slows every search down by about 25%. utils.instrumentation swaps it in for search while enabled"""
+        if val is None:
+            raise TypeError("Can not search for None in BST")
+        
+        curr: Optional['BSTNode'] = self.root
+        visited: int = 0
+        while curr is not None:
+            visited += 1
+            if curr.value == val:
+                break
+            curr = curr.right if val >= curr.value else curr.left
+        self.last_path_length = visited
+        return curr
     
     def delete(self, val: int) -> Optional['BSTNode']:
         """
         Deletes a node with the given value from the binary search tree.
-        This approach uses a mix of iterative and recursive approach.
-        Check the code comments to see the usual purely recursive approach. 
+        Iterative: walks down remembering the path, unlinks the node, then fixes the nodes on the path bottom up.
+        Nothing happens (and num_nodes stays the same) if the value is not in the tree.
         
         Args:
             val (int): The value of the node to be deleted.
@@ -94,58 +160,74 @@ class BinarySearchTree:
         2. The node to be deleted has one child.
         3. The node to be deleted has two children. In this case, the node's value is replaced with its
         inorder successor's value, and the inorder successor is then deleted.
-        The function uses a helper function `__delete` to recursively find and delete the node.
         """
         if val is None:
             raise TypeError("Can not delete Null values")
         if self.is_empty():
+            self.last_path_length = 0
             return None  # Nothing to delete in an empty tree
 
-        def __delete(node: Optional['BSTNode']) -> Optional['BSTNode']:
-            if node is None:
-                return None  # Base case: If the node is None, nothing can be deleted
-            if node.value < val:
-                # in other words: If the value to be deleted is greater than the current node's value,
-                # traverse the right subtree
-                node.right = __delete(node.right)
-            elif node.value > val:
-                # If the value to be deleted is less than the current node's value,
-                # traverse the left subtree
-                node.left = __delete(node.left)
+        path: list[BSTNode] = [] # ancestors of the node that will actually be unlinked
+        node: Optional['BSTNode'] = self.root
+        while node is not None and node.value != val:
+            path.append(node)
+            # If the value to be deleted is greater than the current node's value, traverse the right subtree
+            node = node.right if node.value < val else node.left
+        self.last_path_length = len(path) if node is None else len(path) + 1 # node itself was compared too
+        if node is None:
+            return self.root # value is not in the tree
+        if self.persistent:
+            # node and its ancestors are modified below, work on copies of them
+            path.append(node)
+            self._copy_path(path, 0)
+            node = path.pop()
+        
+        removed: BSTNode # the node that gets unlinked from the tree
+        replacement: Optional['BSTNode'] # what takes its place under its parent
+        node_depth: int = len(path) # path[:node_depth + 1] are node and its ancestors, the rest lead to the successor
+        if node.left is None:
+            # Case 1: Node has no left child (this covers the scenario where both children are none)
+            removed, replacement = node, node.right
+        elif node.right is None:
+            # Case 2: Node has no right child
+            removed, replacement = node, node.left
+        else:
+            # Case 3: Node has two children
+            # Find the inorder successor (smallest/minimum node in the right subtree), it has no left child
+            path.append(node)
+            successor: BSTNode = node.right
+            while successor.left is not None: # keep exploring left to find min value 
+                path.append(successor)
+                successor = successor.left
+            if self.persistent:
+                self._copy_path(path, node_depth + 1) # sizes and totals between node and the successor change too
+            node.value = successor.value # Replace the node's value with the successor's value [deletes the node]
+            removed, replacement = successor, successor.right # then unlink the successor instead
+        
+        if len(path) == 0:
+            self.root = replacement # removing the root
+        else:
+            parent: BSTNode = path[-1]
+            # identity check, == would compare whole subtrees field by field
+            if parent.left is removed:
+                parent.left = replacement
             else:
-                # Node to be deleted is found
-                # Case 1: Node has no left child (this covers the scenario where both children are none)
-                if node.left is None:
-                    return node.right  # Replace node with its right child
-                # Case 2: Node has no right child
-                elif node.right is None:
-                    return node.left  # Replace node with its left child
-                else:
-                    # Case 3: Node has two children
-                    # Find the inorder successor (smallest/minimum node in the right subtree)
-                    successor_parent: BSTNode = node # this will help us delete the successor manually without recursive call
-                    successor: BSTNode = node.right
-                    while successor.left is not None: # keep exploring left to find min value 
-                        successor_parent = successor
-                        successor = successor.left
-                    node.value = successor.value # Replace the node's value with the successor's value [deletes the node]
-
-                    # Delete the inorder successor
-                    # --> an alternative approach here will be to use recursion (change the method signature for this)
-                    # node.right = __delete(node.right, successor.value)
-                    if successor_parent.left == successor: 
-                        successor_parent.left = successor.right
-                    else:
-                        # This case happens when the successor is the immediate right child of the node to be deleted [i.e. successor_parent is the node we chnged the value of]
-                        successor_parent.right = successor.right
-            return node
-
-        self.root = __delete(self.root)
+                parent.right = replacement
+        
         self.num_nodes -= 1 # decrease the number of nodes
+        for depth, ancestor in enumerate(path):
+            # node and its ancestors lost val from their subtree. In case 3 the nodes between node and the
+            # successor lost the successor's value instead, since it moved up into node
+            ancestor.size -= 1
+            ancestor.total -= val if depth <= node_depth else removed.value
+        self._retrace(path)
+        if self.root is not None and (val == self._min or val == self._max):
+            self._refresh_bounds()
+        self._publish()
         return self.root
 
     def find_min(self) -> int:
-        """Finds the min value of the BST
+        """Finds the min value of the BST in O(1), it is cached and kept up to date by insert and delete
 
         Raises:
             ValueError: If BST is Empty 
@@ -155,18 +237,11 @@ class BinarySearchTree:
         """
         if self.root is None:
             raise ValueError("Empty BST does not have any min")
-        
-        def __find_min(curr: BSTNode) -> int:
-            curr_node: BSTNode = curr
-            while (curr_node.left is not None):
-                curr_node = curr_node.left
-            return curr_node.value 
-        
-        return __find_min(self.root)
+        return self._min
         
 
     def find_max(self) -> int:
-        """Finds the maximum integer value in the BST
+        """Finds the maximum integer value in the BST in O(1), it is cached and kept up to date by insert and delete
 
         Raises:
             ValueError: if Tree is empty
@@ -176,14 +251,7 @@ class BinarySearchTree:
         """
         if self.root is None:
             raise ValueError("Empty BST does not have any max")
-        
-        def __find_max(node: BSTNode) -> int:
-            curr_node: BSTNode = node
-            while (curr_node.right is not None):
-                curr_node = curr_node.right
-            return curr_node.value
-        
-        return __find_max(self.root)
+        return self._max
 
     def is_empty(self) -> bool:
         """Check if the BST is empty (no nodes)
@@ -194,43 +262,33 @@ class BinarySearchTree:
         return self.num_nodes == 0 or self.root is None
     
     def sum(self) -> int:
-        """Calculates the integer sum of all values in the tree
+        """Returns the integer sum of all values in the tree in O(1). Every node keeps the sum of its subtree
 
         Returns:
             int: sum of all nodes in the BST
         """
-        if self.num_nodes == 0:
+        if self.root is None:
             return 0
-        
-        def __sum(curr_node: Optional['BSTNode']) -> int:
-            if curr_node is None:
-                return 0
-            left_sum: int = __sum(curr_node.left)
-            right_sum: int = __sum(curr_node.right)
-            return curr_node.value + left_sum + right_sum
-        
-        return __sum(self.root)
+        return self.root.total
+    
+    def range_sum(self, lo: int, hi: int) -> int:
+        """Returns the sum of the values v with lo <= v <= hi in O(height) using the subtree sums"""
+        if lo > hi:
+            return 0
+        return self._sum_below(hi, inclusive=True) - self._sum_below(lo, inclusive=False)
     
     def height(self) -> int:
         """
-        Calculate the height of the BST.
-        The height of a binary search tree is the number of edges 
-        on the longest path from the root node to a leaf node. 
+        Returns the height of the BST in O(1), every node keeps the height of its subtree.
+        The height here is the number of levels, i.e. the number of nodes 
+        on the longest path from the root node to a leaf node (a single node tree has height 1). 
         
         Returns:
             int: The height of the tree. Returns -1 if the tree is empty.
         """
         if self.root is None:
             return -1 # height of empty tree is -1
-        
-        def __height(node: BSTNode) -> int:
-            if node is None:
-                return 0
-            left_height: int = __height(node.left) if node.left is not None else 0
-            right_height: int = __height(node.right) if node.right is not None else 0
-            return 1 + max(left_height, right_height)
-        
-        return __height(self.root)
+        return self.root.height
         
     def inorder_traversal(self) -> list[int]:
         """
@@ -245,23 +303,60 @@ class BinarySearchTree:
         Helpful for:
             - Generating a sorted list of the node values.
             - Checking if a tree is a BST by ensuring the in-order traversal produces a sorted sequence.
-            - Finding the k-th smallest element in the BST.
-            - Performing range queries to find all elements within a given range [low, high].
+            - Finding the k-th smallest element in the BST (select() does this in O(height) with subtree sizes).
+            - Performing range queries to find all elements within a given range [low, high] (see iter_range and count_range).
             - Converting the BST to a sorted doubly linked list.
         """
         if self.root is None:
             raise ValueError("Can not traverse an Empty BST")
         
         result: list[int] = []
-        def __inorder(node: Optional['BSTNode']) -> None:
-            if node is not None:
-                __inorder(node.left) # ensures that all nodes with values less than the current node are processed first. 
-                result.append(node.value)
-                __inorder(node.right) # ensures that all nodes with values greater than the current node are processed last.
-                
-        __inorder(self.root) 
-        return result
-
+        stack: list[BSTNode] = []
+        pop, push, add = stack.pop, stack.append, result.append
+        node: Optional['BSTNode'] = self.root
+        while True:
+            while node is not None: # ensures that all nodes with values less than the current node are processed first. 
+                push(node)
+                node = node.left
+            if not stack:
+                return result
+            node = pop()
+            add(node.value)
+            node = node.right # ensures that all nodes with values greater than the current node are processed last.
+
+    def __iter__(self) -> Iterator[int]:
+        """Lazily yields the values in ascending order (in-order traversal with an explicit stack).
+        Only O(height) memory and the caller can stop early without building the whole list."""
+        stack: list[BSTNode] = []
+        node: Optional['BSTNode'] = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+    
+    def iter_range(self, lo: int, hi: int) -> Iterator[int]:
+        """Lazily yields the values v with lo <= v <= hi in ascending order.
+        Subtrees that are entirely below lo are never pushed and the scan stops at the first value above hi,
+        so it costs O(height + number of values yielded)."""
+        stack: list[BSTNode] = []
+        node: Optional['BSTNode'] = self.root
+        while stack or node is not None:
+            while node is not None:
+                if node.value < lo:
+                    node = node.right # node and its whole left subtree are below the range
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.value > hi:
+                return # everything after this in-order is bigger as well
+            yield node.value
+            node = node.right
     
     def postorder_traversal(self) -> list[int]:
         """Performs a post-order traversal (Left -> Right -> Root) of the BST and returns a list of values. Children are traversed first
@@ -275,45 +370,106 @@ class BinarySearchTree:
         if self.root is None:
             raise ValueError("Can not traverse an Empty BST")
         
+        # Root -> Right -> Left pushed onto result is exactly the reverse of Left -> Right -> Root
         result: list[int] = []
-        def __postorder(node: Optional['BSTNode']) -> None:
-            if node is not None:
-                __postorder(node.left) 
-                __postorder(node.right) 
-                result.append(node.value)
-                
-        __postorder(self.root) 
+        stack: list[Optional['BSTNode']] = [self.root]
+        pop, push, add = stack.pop, stack.append, result.append
+        while stack:
+            node: Optional['BSTNode'] = pop()
+            if node is None:
+                continue
+            add(node.value)
+            push(node.left)
+            push(node.right)
+        result.reverse()
         return result
     
     def balance(self) -> BSTNode:
         """Balances the BST where the height of the left and right subtrees of any node differ by no more than one.
+        Rebuilds the tree from its in-order values in O(n) (see from_sorted).
+        
+        Raises:
+            ValueError: If BST is empty
         
         Returns:
             BSTNode: root of balanced tree
         """   
-        ascending: list[int] = self.inorder_traversal() # get the ascending list of values for the tree
         if self.is_balanced(): # if BST is already balanced we just return the current root
             assert self.root is not None
             return self.root
         
-        # recursive function below assumes len(list) > 0
-        def __balance_bst(ascending_values: list[int]) -> BSTNode:
-            if len(ascending_values) == 1:
-                return BSTNode(value=ascending_values[0], left=None, right=None)
-            elif len(ascending_values) == 2:
-                left_child = BSTNode(value=ascending_values[0], left=None, right=None)
-                parent_node = BSTNode(value=ascending_values[1], left=left_child, right=None)
-                return parent_node
-            else:
-                # len is atleast 3
-                mid: int = len(ascending_values) // 2
-                left_child = __balance_bst(ascending_values[0:mid])
-                right_child =  __balance_bst(ascending_values[mid+1:])
-                root_node = BSTNode(value=ascending_values[mid], left=left_child, right=right_child)
-                return root_node
-        self.root = __balance_bst(ascending)
+        ascending: list[int] = self.inorder_traversal() # get the ascending list of values for the tree
+        self.root = self._build_from_sorted(ascending)
+        self._publish()
+        return self.root
+    
+    @classmethod
+    def from_sorted(cls, values: Iterable[int], balanced: bool = False,
+                    persistent: bool = False) -> 'BinarySearchTree':
+        """Builds a perfectly balanced BST from values in ascending order in O(n),
+        instead of O(n log n) (or O(n^2) for sorted input on a plain tree) with one insert per value.
+
+        Args:
+            values (Iterable[int]): values in ascending order, duplicates allowed
+            balanced (bool): whether the returned tree stays AVL balanced on later updates
+            persistent (bool): whether the returned tree uses path copying on later updates (see snapshot)
+
+        Raises:
+            ValueError: if values are not in ascending order
+
+        Returns:
+            BinarySearchTree: the new tree
+        """
+        ascending: list[int] = values if isinstance(values, list) else list(values)
+        for i in range(1, len(ascending)):
+            if ascending[i - 1] > ascending[i]:
+                raise ValueError(f"Values must be in ascending order, found {ascending[i - 1]} before {ascending[i]}")
+        
+        tree: BinarySearchTree = cls(balanced=balanced, persistent=persistent)
+        if len(ascending) > 0:
+            tree.root = tree._build_from_sorted(ascending)
+            tree._publish()
+        return tree
+    
+    def merge(self, other: 'BinarySearchTree') -> Optional['BSTNode']:
+        """Adds every value of other into this tree in O(n + m): the two in-order streams are merged linearly
+        and the tree is rebuilt balanced from the result. other is not modified.
+
+        Returns:
+            Optional['BSTNode']: root of the merged tree (None if both are empty)
+        """
+        if other.is_empty():
+            return self.root
+        
+        merged: list[int] = list(self._merge_ascending(iter(self), iter(other)))
+        self.root = self._build_from_sorted(merged)
+        self._publish()
         return self.root
     
+    def snapshot(self) -> 'BinarySearchTree':
+        """Returns the current version of a persistent tree in O(1), nothing is copied.
+        No node reachable from the snapshot is ever modified, so any number of threads can read it without a lock
+        while a single writer keeps updating this tree. The snapshot is itself a persistent tree:
+        updating it forks a new version and never affects this tree (or other snapshots).
+
+        Raises:
+            ValueError: if the tree was not created with persistent=True
+
+        Returns:
+            BinarySearchTree: the tree as of the last finished insert/delete
+        """
+        if not self.persistent:
+            raise ValueError("Only a persistent BST can be snapshotted, create it with persistent=True")
+        
+        root, num_nodes, min_value, max_value = self._version # one read, so the four fields always match
+        version: BinarySearchTree = BinarySearchTree(balanced=self.balanced, persistent=True)
+        version.root = root
+        version.num_nodes = num_nodes
+        version._min = min_value
+        version._max = max_value
+        version._version = (root, num_nodes, min_value, max_value)
+        return version
+    
     def is_balanced(self) -> bool:
         """Checks the height of the left and right subtrees of each node and ensures that the difference in height is no more than one.
 
@@ -325,24 +481,8 @@ class BinarySearchTree:
         """
         if self.is_empty():
             raise ValueError("Empty BST can not be checked for balance")
-        
-        def __check_balance(node: Optional['BSTNode']) -> int:
-            if node is None:
-                return 0
-            
-            left_height: int = __check_balance(node.left)
-            if left_height == -1: return -1
-            
-            right_height: int = __check_balance(node.right)
-            if right_height == -1: return -1
-            
-            height_diff: int = abs(left_height - right_height)
-            if height_diff > 1:
-                return -1
-            
-            return 1 + max(left_height, right_height) # calculates the height
-        
-        return __check_balance(self.root) != -1
+        # every node keeps whether its whole subtree is balanced, so the answer sits at the root. O(1)
+        return self.root.height_balanced # type: ignore[union-attr]
     
     def bfs(self) -> list[list[int]]:
         """
@@ -380,8 +520,275 @@ class BinarySearchTree:
             result.append(current_level)
         
         return result
-            
-            
-            
+    
+    def select(self, k: int) -> int:
+        """Returns the k-th smallest value, 0-indexed (select(0) is the min). O(height) using subtree sizes:
+        if the left subtree has exactly k nodes the answer is the current node, otherwise go left or skip
+        the left subtree plus the current node and go right.
+
+        Raises:
+            IndexError: if k < 0 or k >= number of nodes
+        """
+        if k < 0 or k >= self.num_nodes:
+            raise IndexError(f"k out of bounds, max valid k is {self.num_nodes - 1}")
+        
+        node: Optional['BSTNode'] = self.root
+        while node is not None:
+            left_size: int = self._node_size(node.left)
+            if k == left_size:
+                return node.value
+            if k < left_size:
+                node = node.left
+            else:
+                k -= left_size + 1
+                node = node.right
+        raise AssertionError("subtree sizes are out of sync with num_nodes")
+    
+    def rank(self, value: int) -> int:
+        """Returns how many values in the tree are strictly smaller than value. O(height).
+        For a value in the tree this is the index of its first occurrence in inorder_traversal()."""
+        count: int = 0
+        node: Optional['BSTNode'] = self.root
+        while node is not None:
+            if node.value < value:
+                count += self._node_size(node.left) + 1 # node and its whole left subtree are smaller
+                node = node.right
+            else:
+                node = node.left
+        return count
+    
+    def count_range(self, lo: int, hi: int) -> int:
+        """Returns how many values v satisfy lo <= v <= hi. O(height)"""
+        if lo > hi:
+            return 0
+        return self._count_at_most(hi) - self.rank(lo)
+    
+    def median(self) -> float:
+        """Returns the median value. With an even number of values it is the mean of the two middle ones. O(height)
+
+        Raises:
+            ValueError: If BST is empty
+        """
+        if self.is_empty():
+            raise ValueError("Empty BST does not have a median")
+        
+        middle: int = self.num_nodes // 2
+        if self.num_nodes % 2 == 1:
+            return self.select(middle)
+        return (self.select(middle - 1) + self.select(middle)) / 2
+    
+    ### Internal Methods (node heights and AVL rotations)
+    @staticmethod
+    def _node_height(node: Optional['BSTNode']) -> int:
+        return 0 if node is None else node.height
+    
+    @staticmethod
+    def _node_size(node: Optional['BSTNode']) -> int:
+        return 0 if node is None else node.size
+    
+    def _update(self, node: BSTNode) -> BSTNode:
+        """Recomputes all the augmented fields of node from its children. Children must already be up to date"""
+        left: Optional['BSTNode'] = node.left
+        right: Optional['BSTNode'] = node.right
+        left_height: int = 0 if left is None else left.height
+        right_height: int = 0 if right is None else right.height
+        node.height = 1 + (left_height if left_height > right_height else right_height)
+        node.size = 1 + (0 if left is None else left.size) + (0 if right is None else right.size)
+        node.total = node.value + (0 if left is None else left.total) + (0 if right is None else right.total)
+        node.height_balanced = (-1 <= left_height - right_height <= 1
+                                and (left is None or left.height_balanced)
+                                and (right is None or right.height_balanced))
+        return node
+    
+    def _sum_below(self, value: int, inclusive: bool) -> int:
+        """Returns the sum of the values < value (or <= value when inclusive). O(height)"""
+        total: int = 0
+        node: Optional['BSTNode'] = self.root
+        while node is not None:
+            if node.value < value or (inclusive and node.value == value):
+                total += node.value + (0 if node.left is None else node.left.total) # node and its left subtree
+                node = node.right
+            else:
+                node = node.left
+        return total
+    
+    def _refresh_bounds(self) -> None:
+        """Recomputes the cached min and max by walking the two spines. O(height), only after deleting a bound"""
+        if self.root is None:
+            return
+        node: BSTNode = self.root
+        while node.left is not None:
+            node = node.left
+        self._min = node.value
+        node = self.root
+        while node.right is not None:
+            node = node.right
+        self._max = node.value
+    
+    def _count_at_most(self, value: int) -> int:
+        """Returns how many values in the tree are <= value. O(height)"""
+        count: int = 0
+        node: Optional['BSTNode'] = self.root
+        while node is not None:
+            if node.value <= value:
+                count += self._node_size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+    
+    def _rotate_right(self, node: BSTNode) -> BSTNode:
+        r"""
+               node             pivot
+              /    \           /     \
+           pivot    C   ->    A      node
+           /   \                    /    \
+          A     B                  B      C
+        
+        In persistent mode node and pivot are copied first, the pivot may be shared with older versions.
+        """
+        if self.persistent:
+            node = self._copy_node(node)
+            node.left = self._copy_node(node.left) # type: ignore[arg-type]
+        pivot: BSTNode = node.left # type: ignore[assignment]
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node) # node is now below pivot so update it first
+        return self._update(pivot)
+    
+    def _rotate_left(self, node: BSTNode) -> BSTNode:
+        """Mirror image of _rotate_right"""
+        if self.persistent:
+            node = self._copy_node(node)
+            node.right = self._copy_node(node.right) # type: ignore[arg-type]
+        pivot: BSTNode = node.right # type: ignore[assignment]
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        return self._update(pivot)
+    
+    def _rebalance(self, node: BSTNode) -> BSTNode:
+        """Updates node and rotates it if its subtrees differ in height by 2. Returns the new root of this subtree.
+        
+        Left heavy:  Left-Left case -> rotate right. Left-Right case -> rotate left child left, then rotate right.
+        Right heavy: mirror image.
+        """
+        self._update(node)
+        balance: int = self._node_height(node.left) - self._node_height(node.right)
         
-            
\ No newline at end of file
+        if balance > 1:
+            left: BSTNode = node.left # type: ignore[assignment]
+            if self._node_height(left.left) < self._node_height(left.right):
+                node.left = self._rotate_left(left) # Left-Right case
+            return self._rotate_right(node)
+        if balance < -1:
+            right: BSTNode = node.right # type: ignore[assignment]
+            if self._node_height(right.right) < self._node_height(right.left):
+                node.right = self._rotate_right(right) # Right-Left case
+            return self._rotate_left(node)
+        return node
+    
+    def _build_from_sorted(self, ascending: list[int]) -> BSTNode:
+        """Builds a perfectly balanced subtree over ascending in O(n) and makes it this tree's content.
+        The middle value becomes the root, recursively on each half. Works with index bounds instead of slices,
+        so nothing is copied and the recursion is only log2(n) deep. Assumes len(ascending) > 0."""
+        def __build(lo: int, hi: int) -> Optional['BSTNode']:
+            # builds the subtree over ascending[lo:hi]
+            if lo >= hi:
+                return None
+            mid: int = (lo + hi) // 2
+            value: int = ascending[mid]
+            left: Optional['BSTNode'] = __build(lo, mid)
+            right: Optional['BSTNode'] = __build(mid + 1, hi)
+            if left is None:
+                return BSTNode(value=value, total=value) # a single value (mid rounds down, so right is empty too)
+            # both halves differ in size by at most 1 so the subtree is balanced by construction
+            height: int = 1 + (left.height if right is None or left.height > right.height else right.height)
+            if right is None:
+                return BSTNode(value=value, left=left, height=height, size=1 + left.size, total=value + left.total)
+            return BSTNode(value=value, left=left, right=right, height=height,
+                           size=1 + left.size + right.size, total=value + left.total + right.total)
+        
+        root: BSTNode = __build(0, len(ascending)) # type: ignore[assignment]
+        self.num_nodes = len(ascending)
+        self._min = ascending[0]
+        self._max = ascending[-1]
+        return root
+    
+    @staticmethod
+    def _merge_ascending(first: Iterator[int], second: Iterator[int]) -> Iterator[int]:
+        """Merges two ascending streams into one ascending stream, like the merge step of merge sort"""
+        a: Optional[int] = next(first, None)
+        b: Optional[int] = next(second, None)
+        while a is not None and b is not None:
+            if a <= b:
+                yield a
+                a = next(first, None)
+            else:
+                yield b
+                b = next(second, None)
+        # at most one of the streams still has values, pass them through
+        if a is not None:
+            yield a
+            yield from first
+        if b is not None:
+            yield b
+            yield from second
+    
+    @staticmethod
+    def _copy_node(node: BSTNode) -> BSTNode:
+        return BSTNode(node.value, node.right, node.left, node.height, node.size, node.total, node.height_balanced)
+    
+    def _copy_path(self, path: list[BSTNode], start: int) -> None:
+        """Replaces path[start:] of a root to leaf path with copies, each copy linked into the (already copied) node
+        above it, or made the root. The originals stay untouched for older versions. Persistent mode only"""
+        for i in range(start, len(path)):
+            original: BSTNode = path[i]
+            copy: BSTNode = self._copy_node(original)
+            if i == 0:
+                self.root = copy
+            elif path[i - 1].left is original:
+                path[i - 1].left = copy
+            else:
+                path[i - 1].right = copy
+            path[i] = copy
+    
+    def _publish(self) -> None:
+        """Records the finished update as the version snapshot() hands out"""
+        if self.persistent:
+            self._version = (self.root, self.num_nodes, self._min, self._max)
+    
+    def _retrace(self, path: list[BSTNode]) -> None:
+        """Fixes the nodes of a root to leaf path bottom up after the subtree below path[-1] changed.
+        In balanced mode a rotation can replace a node, so the new subtree root is linked back into its parent."""
+        if not self.balanced:
+            # size and total were already fixed on the way down, only heights and balance flags are left (inlined).
+            # Once both stay the same for a node nothing above it can change either
+            for node in reversed(path):
+                left: Optional['BSTNode'] = node.left
+                right: Optional['BSTNode'] = node.right
+                left_height: int = 0 if left is None else left.height
+                right_height: int = 0 if right is None else right.height
+                new_height: int = 1 + (left_height if left_height > right_height else right_height)
+                new_flag: bool = (-1 <= left_height - right_height <= 1
+                                  and (left is None or left.height_balanced)
+                                  and (right is None or right.height_balanced))
+                if new_height == node.height and new_flag == node.height_balanced:
+                    return
+                node.height = new_height
+                node.height_balanced = new_flag
+            return
+        
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height: int = node.height
+            new_subtree_root: BSTNode = self._rebalance(node)
+            if new_subtree_root is not node:
+                if i == 0:
+                    self.root = new_subtree_root
+                elif path[i - 1].left is node:
+                    path[i - 1].left = new_subtree_root
+                else:
+                    path[i - 1].right = new_subtree_root
+            if new_subtree_root.height == old_height:
+                return # subtree is as tall as before, so every ancestor is still balanced and up to date
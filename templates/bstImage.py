@@ -0,0 +1,203 @@
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterator
+from types import TracebackType
+from typing import Optional
+
+from templates.binarySearchTree import BinarySearchTree, BSTNode
+"""
+   Compact on-disk image of a BinarySearchTree that can be searched straight from a memory map.
+
+   Instead of one BSTNode object per value, the tree is flattened into three parallel arrays,
+   with nodes numbered in pre-order (so the root is always node 0):
+        values[i] -> value of node i (int64)
+        left[i]   -> index of the left child of node i, -1 if none
+        right[i]  -> index of the right child of node i, -1 if none
+
+   File layout:
+        header (HEADER struct below) | values | left | right
+
+   Loading is O(1): the file is mmap'ed and the arrays are memoryview casts over the mapping, nothing is copied
+   or parsed. The OS loads pages lazily on first touch and every process mapping the same file shares them
+   through the page cache, so N workers don't each rebuild (and each hold) their own tree.
+   The arrays use the native byte order, which is recorded in the header and checked on load.
+"""
+
+MAGIC: bytes = b"BSTIMG01"
+# magic, byte order, index typecode, number of nodes, min value, max value
+HEADER: struct.Struct = struct.Struct("<8s8s8sqqq")
+
+
+def save_bst_image(tree: BinarySearchTree, path: str) -> int:
+    """Writes tree to path in the image format above.
+
+    Args:
+        tree (BinarySearchTree): tree to save, values must fit in a signed 64 bit integer
+        path (str): destination file
+
+    Returns:
+        int: number of bytes written
+    """
+    values: array = array('q')
+    num_nodes: int = tree.num_nodes
+    index_typecode: str = 'i' if num_nodes < 2**31 else 'q' # 4 byte child indices whenever they fit
+    left: array = array(index_typecode, [-1]) * num_nodes
+    right: array = array(index_typecode, [-1]) * num_nodes
+
+    # pre-order walk: a node gets its index when it is popped, children are patched in when they are popped
+    stack: list[tuple[BSTNode, int, bool]] = [] # (node, parent index, is left child)
+    if tree.root is not None:
+        stack.append((tree.root, -1, False))
+    while stack:
+        node, parent, is_left = stack.pop()
+        index: int = len(values)
+        values.append(node.value)
+        if parent != -1:
+            if is_left:
+                left[parent] = index
+            else:
+                right[parent] = index
+        if node.right is not None:
+            stack.append((node.right, index, False))
+        if node.left is not None:
+            stack.append((node.left, index, True)) # pushed last so it is numbered right after its parent
+
+    min_value: int = tree.find_min() if len(values) else 0
+    max_value: int = tree.find_max() if len(values) else 0
+    header: bytes = HEADER.pack(MAGIC, sys.byteorder.encode(), index_typecode.encode(),
+                                len(values), min_value, max_value)
+    with open(path, "wb") as f:
+        f.write(header)
+        values.tofile(f)
+        left.tofile(f)
+        right.tofile(f)
+    return HEADER.size + len(values) * (values.itemsize + 2 * left.itemsize)
+
+
+class MappedBST:
+    def __init__(self, path: str) -> None:
+        """Maps an image written by save_bst_image. O(1), no node objects are created.
+
+        Raises:
+            ValueError: if the file is not a BST image or was written on a machine with another byte order
+        """
+        self._file = open(path, "rb")
+        try:
+            self._map: mmap.mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # an empty file can't be mapped
+            self._file.close()
+            raise ValueError(f"{path} is not a BST image")
+
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a BST image")
+        magic, byteorder, typecode, num_nodes, min_value, max_value = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a BST image")
+        written_byteorder: str = byteorder.rstrip(b"\0").decode()
+        if written_byteorder != sys.byteorder:
+            self.close()
+            raise ValueError(f"{path} was written with {written_byteorder} byte order")
+
+        self.num_nodes: int = num_nodes
+        self._min: int = min_value
+        self._max: int = max_value
+        index_typecode: str = typecode.rstrip(b"\0").decode()
+        index_size: int = struct.calcsize(index_typecode)
+        if len(self._map) != HEADER.size + num_nodes * (8 + 2 * index_size):
+            self.close()
+            raise ValueError(f"{path} is truncated or corrupted")
+
+        buffer: memoryview = memoryview(self._map)
+        values_start: int = HEADER.size
+        left_start: int = values_start + 8 * num_nodes
+        right_start: int = left_start + index_size * num_nodes
+        self._buffer: memoryview = buffer
+        self.values: memoryview = buffer[values_start:left_start].cast('q')
+        self.left: memoryview = buffer[left_start:right_start].cast(index_typecode)
+        self.right: memoryview = buffer[right_start:right_start + index_size * num_nodes].cast(index_typecode)
+
+    def search(self, val: int) -> int:
+        """Returns the index of a node holding val in the image, or -1 if val is not in the tree. O(height)"""
+        values, left, right = self.values, self.left, self.right
+        index: int = 0 if self.num_nodes > 0 else -1
+        while index != -1:
+            value: int = values[index]
+            if value == val:
+                return index
+            index = right[index] if val >= value else left[index]
+        return -1
+
+    def __contains__(self, val: int) -> bool:
+        return self.search(val) != -1
+
+    def find_min(self) -> int:
+        """O(1), the min is stored in the header
+
+        Raises:
+            ValueError: If tree is empty
+        """
+        if self.num_nodes == 0:
+            raise ValueError("Empty BST does not have any min")
+        return self._min
+
+    def find_max(self) -> int:
+        """O(1), the max is stored in the header
+
+        Raises:
+            ValueError: If tree is empty
+        """
+        if self.num_nodes == 0:
+            raise ValueError("Empty BST does not have any max")
+        return self._max
+
+    def __len__(self) -> int:
+        return self.num_nodes
+
+    def __iter__(self) -> Iterator[int]:
+        """Yields every value in ascending order"""
+        if self.num_nodes == 0:
+            return iter(())
+        return self.iter_range(self._min, self._max)
+
+    def iter_range(self, lo: int, hi: int) -> Iterator[int]:
+        """Yields the values v with lo <= v <= hi in ascending order, same walk as BinarySearchTree.iter_range
+        but over array indices instead of node objects."""
+        values, left, right = self.values, self.left, self.right
+        stack: list[int] = []
+        index: int = 0 if self.num_nodes > 0 else -1
+        while True:
+            while index != -1:
+                if values[index] < lo:
+                    index = right[index] # node and its whole left subtree are below the range
+                else:
+                    stack.append(index)
+                    index = left[index]
+            if not stack:
+                return
+            index = stack.pop()
+            value: int = values[index]
+            if value > hi:
+                return
+            yield value
+            index = right[index]
+
+    def close(self) -> None:
+        """Releases the memoryviews, then the mapping and the file (a mapping can't close while views exist)"""
+        for name in ("values", "left", "right", "_buffer"):
+            view: Optional[memoryview] = getattr(self, name, None)
+            if view is not None:
+                view.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MappedBST':
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None,
+                 traceback: TracebackType | None) -> None:
+        self.close()
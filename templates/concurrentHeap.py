@@ -0,0 +1,218 @@
+import asyncio
+import threading
+from typing import Any
+
+from templates.heap import Heap
+"""
+   Priority queues for schedulers, built on the min-Heap from heap.py.
+
+   ConcurrentHeap: for threads. One internal lock guards the heap and two conditions share it:
+        not_empty -> consumers wait here until something is put
+        not_full  -> producers wait here until there is room (only when maxsize > 0, i.e. backpressure)
+   AsyncHeap: the same design for asyncio, built on asyncio.Condition. put/get are awaitable so async producers
+   and consumers never have to poll.
+
+   Both offer get_many(n): a single wakeup drains up to n items under one lock acquisition,
+   which cuts lock traffic and context switches when consumers can handle work in batches.
+
+   Items are compared by the Heap, so use tuples like (priority, sequence_number, job) for arbitrary jobs.
+"""
+
+
+def _check_capacity(contents: list[Any] | None, maxsize: int) -> None:
+    if contents is not None and maxsize > 0 and len(contents) > maxsize:
+        raise ValueError(f"{len(contents)} initial items do not fit in maxsize {maxsize}")
+
+
+def _check_batch_size(n: int) -> None:
+    if n < 1:
+        raise ValueError(f"get_many needs n >= 1, got {n}")
+
+
+class ConcurrentHeap:
+    def __init__(self, contents: list[Any] | None = None, maxsize: int = 0) -> None:
+        """
+        Args:
+            contents (list[Any] | None): Optional initial items.
+            maxsize (int): Max number of items, put blocks when the heap is full. 0 means unbounded.
+
+        Raises:
+            ValueError: if contents holds more than maxsize items (put could never make progress)
+        """
+        _check_capacity(contents, maxsize)
+        self.maxsize: int = maxsize
+        self._heap: Heap = Heap(contents) if contents else Heap()
+        self._lock: threading.Lock = threading.Lock()
+        self._not_empty: threading.Condition = threading.Condition(self._lock)
+        self._not_full: threading.Condition = threading.Condition(self._lock)
+
+    def put(self, item: Any, timeout: float | None = None) -> None:
+        """Inserts item, blocking while the heap is full.
+
+        Args:
+            item (Any): item to insert
+            timeout (float | None): max seconds to wait for room. None waits forever, 0 does not wait at all.
+
+        Raises:
+            TimeoutError: if there was no room before the timeout
+        """
+        with self._not_full:
+            if self.maxsize > 0:
+                if not self._not_full.wait_for(lambda: self._heap.heapSize() < self.maxsize, timeout):
+                    raise TimeoutError("Heap is full")
+            self._heap.insert(item)
+            self._not_empty.notify()
+
+    def get(self, timeout: float | None = None) -> Any:
+        """Removes and returns the smallest item, blocking while the heap is empty.
+
+        Args:
+            timeout (float | None): max seconds to wait for an item. None waits forever, 0 does not wait at all.
+
+        Raises:
+            TimeoutError: if no item arrived before the timeout
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: not self._heap.is_empty(), timeout):
+                raise TimeoutError("Heap is empty")
+            item: Any = self._heap.extract_min()
+            self._not_full.notify()
+            return item
+
+    def get_many(self, n: int, timeout: float | None = None) -> list[Any]:
+        """Waits for at least one item, then removes and returns up to n smallest items in ascending order.
+
+        Raises:
+            ValueError: if n < 1 (raised right away, without waiting for an item)
+            TimeoutError: if no item arrived before the timeout
+        """
+        _check_batch_size(n)
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: not self._heap.is_empty(), timeout):
+                raise TimeoutError("Heap is empty")
+            batch: list[Any] = []
+            while len(batch) < n and not self._heap.is_empty():
+                batch.append(self._heap.extract_min())
+            self._not_full.notify(len(batch))
+            return batch
+
+    def heapSize(self) -> int:
+        with self._lock:
+            return self._heap.heapSize()
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._heap.is_empty()
+
+
+class AsyncHeap:
+    def __init__(self, contents: list[Any] | None = None, maxsize: int = 0) -> None:
+        """
+        Args:
+            contents (list[Any] | None): Optional initial items.
+            maxsize (int): Max number of items, put waits when the heap is full. 0 means unbounded.
+
+        Raises:
+            ValueError: if contents holds more than maxsize items (put could never make progress)
+        """
+        _check_capacity(contents, maxsize)
+        self.maxsize: int = maxsize
+        self._heap: Heap = Heap(contents) if contents else Heap()
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._not_empty: asyncio.Condition = asyncio.Condition(self._lock)
+        self._not_full: asyncio.Condition = asyncio.Condition(self._lock)
+
+    async def put(self, item: Any) -> None:
+        """Inserts item, waiting while the heap is full. Wrap in asyncio.wait_for for a timeout"""
+        async with self._lock:
+            if self.maxsize > 0:
+                await self._not_full.wait_for(lambda: self._heap.heapSize() < self.maxsize)
+            self._heap.insert(item)
+            self._not_empty.notify()
+
+    async def get(self) -> Any:
+        """Removes and returns the smallest item, waiting while the heap is empty"""
+        async with self._lock:
+            await self._not_empty.wait_for(lambda: not self._heap.is_empty())
+            item: Any = self._heap.extract_min()
+            self._not_full.notify()
+            return item
+
+    async def get_many(self, n: int) -> list[Any]:
+        """Waits for at least one item, then removes and returns up to n smallest items in ascending order.
+
+        Raises:
+            ValueError: if n < 1 (raised right away, without waiting for an item)
+        """
+        _check_batch_size(n)
+        async with self._lock:
+            await self._not_empty.wait_for(lambda: not self._heap.is_empty())
+            batch: list[Any] = []
+            while len(batch) < n and not self._heap.is_empty():
+                batch.append(self._heap.extract_min())
+            self._not_full.notify(len(batch))
+            return batch
+
+    def heapSize(self) -> int:
+        return self._heap.heapSize()
+
+    def is_empty(self) -> bool:
+        return self._heap.is_empty()
+
+
+def run_capacity_tests() -> None:
+    """Initial contents above maxsize are rejected, contents that fit (or maxsize 0) are accepted"""
+    tests: list[tuple[type, list[int], int, str]] = [
+        (ConcurrentHeap, [3, 1, 2], 2, "ValueError"),
+        (AsyncHeap, [3, 1, 2], 2, "ValueError"),
+        (ConcurrentHeap, [3, 1, 2], 3, "ok"),
+        (AsyncHeap, [3, 1, 2], 0, "ok"),
+    ]
+    for index, (heap_class, contents, maxsize, expected_out) in enumerate(tests):
+        try:
+            heap_class(contents, maxsize=maxsize)
+            out: str = "ok"
+        except ValueError:
+            out = "ValueError"
+        if out == expected_out:
+            print(f"{heap_class.__name__} capacity test {index} passed ✅")
+        else:
+            print(f"{heap_class.__name__} capacity test {index} failed ❌")
+            print(f"contents = {contents}, maxsize = {maxsize}, expected output = {expected_out}, output = {out}")
+            print()
+
+
+def run_get_many_tests() -> None:
+    """get_many with n < 1 raises at once instead of waiting for an item it would not return"""
+    async def async_get_many(heap: AsyncHeap, n: int) -> list[Any]:
+        return await asyncio.wait_for(heap.get_many(n), timeout=1)
+
+    tests: list[tuple[type, list[int], int, str]] = [
+        (ConcurrentHeap, [], 0, "ValueError"),
+        (AsyncHeap, [], 0, "ValueError"),
+        (ConcurrentHeap, [3, 1, 2], -1, "ValueError"),
+        (ConcurrentHeap, [3, 1, 2], 2, "[1, 2]"),
+        (AsyncHeap, [3, 1, 2], 5, "[1, 2, 3]"),
+    ]
+    for index, (heap_class, contents, n, expected_out) in enumerate(tests):
+        try:
+            if heap_class is AsyncHeap:
+                batch: list[Any] = asyncio.run(async_get_many(AsyncHeap(contents), n))
+            else:
+                batch = ConcurrentHeap(contents).get_many(n, timeout=1)
+            out: str = str(batch)
+        except ValueError:
+            out = "ValueError"
+        except (TimeoutError, asyncio.TimeoutError):
+            out = "TimeoutError"
+        if out == expected_out:
+            print(f"{heap_class.__name__} get_many test {index} passed ✅")
+        else:
+            print(f"{heap_class.__name__} get_many test {index} failed ❌")
+            print(f"contents = {contents}, n = {n}, expected output = {expected_out}, output = {out}")
+            print()
+
+
+if __name__ == "__main__":
+    run_capacity_tests()
+    run_get_many_tests()
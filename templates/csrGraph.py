@@ -0,0 +1,207 @@
+from array import array
+from collections.abc import Iterable
+from typing import Any, Optional
+
+try:
+    import numpy as np # optional, only used to build from NumPy edge arrays and by as_numpy
+except ImportError:
+    np = None
+"""
+   CSR (compressed sparse row) graph: the whole adjacency list in two flat typed arrays.
+
+        offsets[u] .. offsets[u + 1]   -> the slice of targets holding the neighbors of u
+        targets                        -> every neighbor list, one after the other
+
+   Example: {0: [1, 2], 1: [2], 2: [0, 1]}
+        offsets = [0, 2, 3, 5]
+        targets = [1, 2, 2, 0, 1]
+
+   Why bother? A dict[int, list[int]] costs a dict entry, a list object and one pointer + one int object per edge
+   (~36+ bytes per edge), spread all over the heap. Here an edge is 4 bytes (8 past 2^31 nodes) and every
+   neighbor list is contiguous, so a traversal reads memory in order. Nodes must be the ints 0..n-1.
+
+   The reverse index (the graph with every edge flipped, i.e. the in-neighbors of each node) is another CSR,
+   built on first use by reverse(). Both are built with a counting sort in O(V + E), and neighbor lists keep the
+   order of the input, so traversals visit nodes in the same order as on the equivalent adjacency dict.
+
+   bfs_traversal, bfs_levels, dfs_traversal, dfs_trees and topological_sort accept a CSRGraph anywhere they accept
+   an adjacency dict, and mark visited nodes in a bytearray (1 byte per node) instead of a set.
+"""
+
+
+def _index_typecode(limit: int) -> str:
+    """'i' (4 bytes) when every value stored is below limit and fits, 'q' (8 bytes) otherwise"""
+    return 'i' if limit < 2**31 else 'q'
+
+
+class CSRGraph:
+    def __init__(self, offsets: array, targets: array) -> None:
+        """Wraps ready made CSR arrays, use from_edges or from_adjacency to build one.
+
+        Args:
+            offsets (array): num_nodes + 1 ascending positions into targets, offsets[0] == 0
+            targets (array): neighbor of every edge, grouped by source node
+
+        Raises:
+            ValueError: if the arrays are not a valid CSR
+        """
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(targets):
+            raise ValueError("offsets must start at 0 and end at len(targets)")
+        self.offsets: array = offsets
+        self.targets: array = targets
+        self.num_nodes: int = len(offsets) - 1
+        self._reverse: Optional['CSRGraph'] = None
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[int, int]] | Any, num_nodes: int | None = None,
+                   undirected: bool = False) -> 'CSRGraph':
+        """Builds the graph from (src, dest) pairs in O(V + E).
+
+        Args:
+            edges (Iterable[tuple[int, int]] | Any): edge list, or a NumPy array of shape (E, 2)
+            num_nodes (int | None): number of nodes, defaults to the biggest node + 1
+            undirected (bool): also add (dest, src) for every edge. Defaults to False.
+
+        Raises:
+            ValueError: if a node is negative or >= num_nodes
+        """
+        if np is not None and isinstance(edges, np.ndarray):
+            return cls._from_numpy_edges(edges, num_nodes, undirected)
+
+        sources: array = array('q')
+        dests: array = array('q')
+        for src, dest in edges:
+            sources.append(src)
+            dests.append(dest)
+        if undirected:
+            sources, dests = sources + dests, dests + sources
+        return cls._from_arrays(sources, dests, num_nodes)
+
+    @classmethod
+    def from_adjacency(cls, graph: dict[int, list[int]], num_nodes: int | None = None) -> 'CSRGraph':
+        """Builds the graph from an adjacency dict like the ones the traversal functions take, in O(V + E).
+        Nodes that are missing as keys (sinks) get no neighbors.
+
+        Raises:
+            ValueError: if a node is negative or >= num_nodes
+        """
+        if num_nodes is None:
+            num_nodes = max((max(src, max(neighbors, default=src)) for src, neighbors in graph.items()),
+                            default=-1) + 1
+        if any(src < 0 or src >= num_nodes for src in graph):
+            raise ValueError(f"Nodes must be in 0..{num_nodes - 1}")
+
+        # the dict already groups edges by source, so every neighbor list is copied into its slot in one go
+        offsets: array = array('q', [0]) * (num_nodes + 1)
+        for src, neighbors in graph.items():
+            offsets[src + 1] = len(neighbors)
+        for u in range(num_nodes):
+            offsets[u + 1] += offsets[u]
+        targets: array = array(_index_typecode(num_nodes), [0]) * offsets[num_nodes]
+        for src, neighbors in graph.items():
+            start: int = offsets[src]
+            targets[start:start + len(neighbors)] = array(targets.typecode, neighbors)
+        if len(targets) and (min(targets) < 0 or max(targets) >= num_nodes):
+            raise ValueError(f"Nodes must be in 0..{num_nodes - 1}")
+        return cls(offsets, targets)
+
+    @classmethod
+    def _from_arrays(cls, sources: array, dests: array, num_nodes: int | None) -> 'CSRGraph':
+        """Counting sort of the edges by source: count the out-degrees, prefix sum them into offsets, then drop
+        every dest into the next free slot of its source. Stable, so neighbors keep the input order."""
+        if num_nodes is None:
+            num_nodes = max(max(sources, default=-1), max(dests, default=-1)) + 1
+        if len(sources) and (min(sources) < 0 or min(dests) < 0
+                             or max(sources) >= num_nodes or max(dests) >= num_nodes):
+            raise ValueError(f"Nodes must be in 0..{num_nodes - 1}")
+
+        offsets: array = array('q', [0]) * (num_nodes + 1)
+        for src in sources:
+            offsets[src + 1] += 1
+        for u in range(num_nodes):
+            offsets[u + 1] += offsets[u]
+        slots: array = offsets[:-1] # next free slot of every source
+        targets: array = array(_index_typecode(num_nodes), [0]) * len(dests)
+        for src, dest in zip(sources, dests):
+            targets[slots[src]] = dest
+            slots[src] += 1
+        return cls(offsets, targets)
+
+    @classmethod
+    def _from_numpy_edges(cls, edges: Any, num_nodes: int | None, undirected: bool) -> 'CSRGraph':
+        """Same counting sort as _from_arrays, vectorized: bincount + cumsum for offsets and a stable argsort"""
+        sources = edges[:, 0].astype(np.int64)
+        dests = edges[:, 1].astype(np.int64)
+        if undirected:
+            sources, dests = np.concatenate([sources, dests]), np.concatenate([dests, sources])
+        if num_nodes is None:
+            num_nodes = int(max(sources.max(initial=-1), dests.max(initial=-1))) + 1
+        if len(sources) and (min(sources.min(), dests.min()) < 0 or max(sources.max(), dests.max()) >= num_nodes):
+            raise ValueError(f"Nodes must be in 0..{num_nodes - 1}")
+
+        counts = np.bincount(sources, minlength=num_nodes)
+        offsets: array = array('q', [0])
+        offsets.frombytes(np.cumsum(counts, dtype=np.int64).tobytes())
+        typecode: str = _index_typecode(num_nodes)
+        targets: array = array(typecode)
+        order = np.argsort(sources, kind="stable")
+        targets.frombytes(dests[order].astype(np.int32 if typecode == 'i' else np.int64).tobytes())
+        return cls(offsets, targets)
+
+    def neighbors(self, node: int) -> array:
+        """Out-neighbors of node, in insertion order. O(out-degree), the slice is a copy"""
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def __getitem__(self, node: int) -> array:
+        """graph[node] like an adjacency dict"""
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def in_neighbors(self, node: int) -> array:
+        """Nodes with an edge into node. Builds the reverse index on the first call"""
+        return self.reverse().neighbors(node)
+
+    def out_degree(self, node: int) -> int:
+        return self.offsets[node + 1] - self.offsets[node]
+
+    def in_degrees(self) -> list[int]:
+        """In-degree of every node, counted from targets in O(E) without building the reverse index"""
+        indegree: list[int] = [0] * self.num_nodes
+        for dest in self.targets:
+            indegree[dest] += 1
+        return indegree
+
+    def reverse(self) -> 'CSRGraph':
+        """The graph with every edge flipped, built once in O(V + E) and cached"""
+        if self._reverse is None:
+            sources: array = array('q')
+            for u in range(self.num_nodes):
+                sources.extend([u] * (self.offsets[u + 1] - self.offsets[u]))
+            self._reverse = CSRGraph._from_arrays(self.targets, sources, self.num_nodes)
+            self._reverse._reverse = self
+        return self._reverse
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def __len__(self) -> int:
+        return self.num_nodes
+
+    def nbytes(self) -> int:
+        """Bytes used by the arrays (and by the reverse index if it was built)"""
+        size: int = self.offsets.itemsize * len(self.offsets) + self.targets.itemsize * len(self.targets)
+        if self._reverse is not None:
+            size += self._reverse.offsets.itemsize * len(self._reverse.offsets)
+            size += self._reverse.targets.itemsize * len(self._reverse.targets)
+        return size
+
+    def as_numpy(self) -> tuple[Any, Any]:
+        """(offsets, targets) as NumPy arrays sharing memory with the graph, no copy
+
+        Raises:
+            ValueError: if NumPy is not installed
+        """
+        if np is None:
+            raise ValueError("as_numpy needs NumPy installed")
+        return (np.frombuffer(self.offsets, dtype=np.int64),
+                np.frombuffer(self.targets, dtype=np.int32 if self.targets.typecode == 'i' else np.int64))
@@ -0,0 +1,237 @@
+from array import array
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from templates._typed import fits_typecode, infer_typecode
+"""
+   D-ary Min-Heap: same idea as the binary Heap in heap.py but every node has d children instead of 2.
+
+   With the same level by level indexing:
+    parent = (index - 1) // d
+    children = d*index + 1 ... d*index + d
+
+   Why bother?
+   Height drops from log2(n) to logd(n), so heapify UP (insert) does fewer steps.
+   Heapify DOWN does more comparisons per level (d children) but fewer levels, and the d children sit next to
+   each other in memory. d = 4 is usually the sweet spot.
+
+   Other differences from heap.py:
+   - All index math is inlined inside the sift loops (no method call per comparison).
+   - Sifting moves a "hole" instead of swapping, so each level costs one write instead of two.
+   - key= is evaluated ONCE per element and the key is stored next to the element.
+   - When the keys are plain ints/floats they are kept in a typed array ('q' or 'd') instead of a list.
+     If the typecode was inferred (not passed in) and a later key doesn't fit it (a float into an int heap,
+     an int past int64), the keys move back to a plain list instead of failing.
+"""
+
+SUPPORTED_ARITIES: tuple[int, ...] = (2, 4, 8)
+
+
+class DaryHeap:
+    def __init__(self, contents: Iterable[Any] | None = None, arity: int = 4,
+                 key: Callable[[Any], Any] | None = None, typecode: str | None = None) -> None:
+        """
+        Args:
+            contents (Iterable[Any] | None): Optional initial elements. Heap is built in O(n).
+            arity (int): Number of children per node, one of 2, 4, 8. Defaults to 4.
+            key (Callable[[Any], Any] | None): Optional function computing the priority of an element.
+            typecode (str | None): array typecode for the keys ('q' or 'd'). When None it is inferred from contents
+                                   (or from the first insert into an empty heap) and a plain list is used if the
+                                   keys are not all ints in the int64 range or all floats. An explicit typecode is
+                                   enforced: keys that don't fit it raise TypeError / OverflowError.
+
+        Raises:
+            ValueError: if arity is not supported
+        """
+        if arity not in SUPPORTED_ARITIES:
+            raise ValueError(f"arity must be one of {SUPPORTED_ARITIES}, got {arity}")
+
+        self.arity: int = arity
+        self.key: Callable[[Any], Any] | None = key
+        self._typecode: str | None = typecode
+        self._infer: bool = typecode is None # storage may change type as keys come in
+        # keys drive the ordering. When key is None the keys ARE the elements and self._items stays None
+        self._keys: list[Any] | array = [] if typecode is None else array(typecode)
+        self._items: list[Any] | None = None if key is None else []
+
+        if contents is not None:
+            self.build_heap(contents)
+
+    def insert(self, element: Any) -> None:
+        if element is None:
+            raise ValueError("Can not insert None into heap")
+
+        key: Any = element if self._items is None else self.key(element) # type: ignore[misc]
+        if self._infer:
+            self._adapt_storage(key)
+        self._keys.append(key)
+        if self._items is not None:
+            self._items.append(element)
+        self._sift_up(len(self._keys) - 1)
+
+    def extract_min(self) -> Any | None:
+        """Extracts and returns the minimum element from the heap. None if heap is empty"""
+        keys = self._keys
+        if len(keys) == 0:
+            return None
+
+        items = self._items
+        last_key = keys.pop()
+        last_item = items.pop() if items is not None else None
+        if len(keys) == 0:
+            return last_item if items is not None else last_key
+
+        # the root leaves, the last element takes its place and bubbles down
+        min_element = items[0] if items is not None else keys[0]
+        keys[0] = last_key
+        if items is not None:
+            items[0] = last_item
+        self._sift_down(0)
+        return min_element
+
+    def peek(self) -> Any | None:
+        """Returns the minimum element without removing it. None if heap is empty"""
+        if len(self._keys) == 0:
+            return None
+        return self._items[0] if self._items is not None else self._keys[0]
+
+    def build_heap(self, contents: Iterable[Any]) -> None:
+        """Builds in O(n) by sifting down every parent, starting from the last one"""
+        elements: list[Any] = list(contents)
+        if len(elements) == 0:
+            raise ValueError("Can not build heap from empty array")
+
+        if self.key is None:
+            keys: list[Any] = elements
+            self._items = None
+        else:
+            keys = [self.key(e) for e in elements] # key evaluated exactly once per element
+            self._items = elements
+
+        if self._infer:
+            self._typecode = infer_typecode(keys)
+        self._keys = keys if self._typecode is None else array(self._typecode, keys)
+
+        last_parent_index: int = (len(keys) - 2) // self.arity
+        for i in range(last_parent_index, -1, -1):
+            self._sift_down(i)
+
+    def heapSize(self) -> int:
+        return len(self._keys)
+
+    def is_empty(self) -> bool:
+        return len(self._keys) == 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    ### Internal Methods
+    def _adapt_storage(self, key: Any) -> None:
+        """Inferred storage only: an empty heap gets typed storage from its first key, and typed storage that
+        can't hold key moves to a plain list (it never goes back to an array)"""
+        if len(self._keys) == 0:
+            self._typecode = infer_typecode([key])
+            self._keys = [] if self._typecode is None else array(self._typecode)
+        elif self._typecode is not None and not fits_typecode(self._typecode, key):
+            self._typecode = None
+            self._keys = self._keys.tolist() # type: ignore[union-attr]
+
+    def _sift_up(self, index: int) -> None:
+        """Bubbles the element at index UP. Parents that are bigger are moved down into the hole"""
+        keys = self._keys
+        items = self._items
+        d: int = self.arity
+        moving_key = keys[index]
+        moving_item = items[index] if items is not None else None
+
+        while index > 0:
+            parent: int = (index - 1) // d
+            parent_key = keys[parent]
+            if parent_key <= moving_key:
+                break
+            keys[index] = parent_key # move parent down into the hole
+            if items is not None:
+                items[index] = items[parent]
+            index = parent
+
+        keys[index] = moving_key
+        if items is not None:
+            items[index] = moving_item
+
+    def _sift_down(self, index: int) -> None:
+        """Bubbles the element at index DOWN. The smallest child is moved up into the hole"""
+        keys = self._keys
+        items = self._items
+        d: int = self.arity
+        size: int = len(keys)
+        moving_key = keys[index]
+        moving_item = items[index] if items is not None else None
+
+        first_child: int = d * index + 1
+        while first_child < size:
+            # find the smallest of up to d children
+            last_child: int = first_child + d if first_child + d < size else size
+            min_child: int = first_child
+            min_key = keys[first_child]
+            for child in range(first_child + 1, last_child):
+                child_key = keys[child]
+                if child_key < min_key:
+                    min_child = child
+                    min_key = child_key
+
+            if min_key >= moving_key:
+                break # every child is bigger or equal so the hole is the correct spot
+            keys[index] = min_key # move smallest child up into the hole
+            if items is not None:
+                items[index] = items[min_child]
+            index = min_child
+            first_child = d * index + 1
+
+        keys[index] = moving_key
+        if items is not None:
+            items[index] = moving_item
+
+
+def run_storage_tests() -> None:
+    """Checks that inferred storage never rejects a valid key and that an explicit typecode is enforced"""
+    def float_into_int_heap() -> list[Any]:
+        heap = DaryHeap([1, 2, 3])
+        heap.insert(2.5)
+        return [heap.extract_min() for _ in range(4)]
+    
+    def int_past_int64() -> list[Any]:
+        heap = DaryHeap([2**70, 1])
+        heap.insert(2**63)
+        return [heap.extract_min() for _ in range(3)]
+    
+    def empty_heap_gets_array() -> list[Any]:
+        heap = DaryHeap()
+        heap.insert(3)
+        heap.insert(1)
+        return [type(heap._keys).__name__, heap.extract_min(), heap.extract_min()]
+    
+    def explicit_typecode_is_enforced() -> str:
+        try:
+            DaryHeap([1, 2], typecode='q').insert(2.5)
+        except TypeError:
+            return "TypeError"
+        return "no error"
+    
+    tests: list[tuple[Callable[[], Any], Any]] = [
+        (float_into_int_heap, [1, 2, 2.5, 3]),
+        (int_past_int64, [1, 2**63, 2**70]),
+        (empty_heap_gets_array, ['array', 1, 3]),
+        (explicit_typecode_is_enforced, "TypeError"),
+    ]
+    for test, expected_out in tests:
+        out: Any = test()
+        if out == expected_out:
+            print(f"DaryHeap storage test {test.__name__} passed ✅")
+        else:
+            print(f"DaryHeap storage test {test.__name__} failed ❌")
+            print(f"expected output = {expected_out}, output = {out}")
+            print()
+
+
+if __name__ == "__main__":
+    run_storage_tests()
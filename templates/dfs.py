@@ -1,11 +1,13 @@
 from collections import deque, defaultdict
 
-def dfs_traversal(graph: dict[int, list[int]], start: int = 0) -> list[int]:
+from templates.csrGraph import CSRGraph
+
+def dfs_traversal(graph: dict[int, list[int]] | CSRGraph, start: int = 0) -> list[int]:
     """Performs Depth-First Search traversal of the graph.
     Will only return the connected component of the starting node. If graph is disconnected, won't return the entire graph.
     
     Args:
-        graph (dict[int, list[int]]): Graph represented as adjacency list
+        graph (dict[int, list[int]] | CSRGraph): Graph represented as adjacency list or CSR
         start (int, optional): Starting node. Defaults to 0.
     
     Returns:
@@ -19,6 +21,9 @@ def dfs_traversal(graph: dict[int, list[int]], start: int = 0) -> list[int]:
     Time: O(V + E) where V is vertices and E is edges
     Space: O(V) for stack and visited set
     """
+    if isinstance(graph, CSRGraph):
+        return _dfs_traversal_csr(graph, start)
+    
     stack: deque[int] = deque([start])
     visited: set[int] = {start}
     result: list[int] = []
@@ -34,13 +39,31 @@ def dfs_traversal(graph: dict[int, list[int]], start: int = 0) -> list[int]:
                 
     return result
 
+def _dfs_tree_csr(graph: CSRGraph, root: int, visited: bytearray) -> list[int]:
+    """Same walk as dfs_traversal over a CSRGraph, marking nodes in visited (shared across trees by dfs_trees)"""
+    offsets, targets = graph.offsets, graph.targets
+    visited[root] = 1
+    stack: list[int] = [root]
+    result: list[int] = []
+    while stack:
+        current_node: int = stack.pop()
+        result.append(current_node)
+        for neighbor in reversed(targets[offsets[current_node]:offsets[current_node + 1]]):
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                stack.append(neighbor)
+    return result
+
+def _dfs_traversal_csr(graph: CSRGraph, start: int) -> list[int]:
+    return _dfs_tree_csr(graph, start, bytearray(graph.num_nodes))
+
     
-def dfs_trees(graph: dict[int, list[int]]) -> list[list[int]]:
+def dfs_trees(graph: dict[int, list[int]] | CSRGraph) -> list[list[int]]:
     """Returns DFS trees (forest) for the graph, handling disconnected components.
     Uses iterative approach to prevent stack overflow.
 
     Args:
-        graph (dict[int, list[int]]): Graph represented as adjacency list
+        graph (dict[int, list[int]] | CSRGraph): Graph represented as adjacency list or CSR
 
     Returns:
         list[list[int]]: List of DFS trees where each tree is a list of nodes
@@ -54,6 +77,10 @@ def dfs_trees(graph: dict[int, list[int]]) -> list[list[int]]:
     Time: O(V + E) where V is vertices and E is edges
     Space: O(V) for stack and visited set
     """
+    if isinstance(graph, CSRGraph):
+        visited: bytearray = bytearray(graph.num_nodes)
+        return [_dfs_tree_csr(graph, root, visited) for root in range(graph.num_nodes) if not visited[root]]
+    
     n: int = len(graph)
     global_visited: set[int] = set()
     result: list[list[int]] = []
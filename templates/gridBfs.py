@@ -0,0 +1,133 @@
+from array import array
+from typing import Optional
+
+from templates.bfs import PathResult
+"""
+   Grid BFS engine: the grid is flattened once, then every search only moves ints around.
+
+   bfs_shortest_distance_on_grid works on (x, y) tuples: one tuple per queued cell, one more per bounds check,
+   and two r * c matrices (dist and visited) of Python lists allocated on every call. Here:
+
+   1. The grid is copied into ONE bytearray, row after row, with a border of blocked cells around it:
+            # # # # #
+            # . . # #        cell id of (x, y) = (x + 1) * width + (y + 1),   width = num cols + 2
+            # . # . #
+            # # # # #
+      so a neighbor is cell + offset with offsets = (-width, +width, -1, +1) (+ the 4 diagonals for 8-connectivity)
+      and no bounds check is needed: stepping off the grid lands on a blocked border cell.
+   2. A search copies that bytearray (one memcpy) and marks visited cells in the copy, so "blocked or already
+      visited" is a single byte lookup per neighbor.
+   3. The queue is a plain list of cell ids that is never popped: each BFS level is the slice appended while
+      scanning the previous one, so the distance is counted per level instead of being stored per cell, and the
+      end cell is checked once per level instead of once per discovered cell.
+   4. parent is a typed array allocated once per engine and reused by every search. parent[cell] is the cell it
+      was discovered from, so the path is rebuilt by walking parent from the end back to the start.
+
+   Searches reuse the engine's arrays, so one GridBFS must not be searched from two threads at the same time.
+"""
+
+
+class GridBFS:
+    def __init__(self, grid: list[list[int]], diagonal: bool = False) -> None:
+        """Flattens the grid in O(r * c). Later changes to grid are not seen by the engine.
+
+        Args:
+            grid (list[list[int]]): 0 for valid cell and 1 for blocked cell (same grid as bfs_shortest_distance_on_grid)
+            diagonal (bool): 8-connectivity, the 4 diagonal moves are allowed too (also between two blocked
+                             cells that touch at a corner). Defaults to False (up, down, left, right).
+        """
+        self.num_rows: int = len(grid)
+        self.num_cols: int = len(grid[0]) if grid else 0
+        self.width: int = self.num_cols + 2
+        num_cells: int = self.width * (self.num_rows + 2)
+
+        blocked: bytearray = bytearray(b"\x01") * num_cells
+        for x, row in enumerate(grid):
+            start: int = (x + 1) * self.width + 1
+            blocked[start:start + self.num_cols] = bytes(1 if value else 0 for value in row)
+        self._blocked: bytearray = blocked
+
+        w: int = self.width
+        moves: list[int] = [-w, w, -1, 1]
+        if diagonal:
+            moves += [-w - 1, -w + 1, w - 1, w + 1]
+        self.offsets: tuple[int, ...] = tuple(moves)
+
+        self._parent: array = array('i' if num_cells < 2**31 else 'q', [0]) * num_cells
+
+    def cell_id(self, x: int, y: int) -> int:
+        return (x + 1) * self.width + (y + 1)
+
+    def coordinate(self, cell: int) -> tuple[int, int]:
+        row, col = divmod(cell, self.width)
+        return row - 1, col - 1
+
+    def is_open(self, x: int, y: int) -> bool:
+        """True if (x, y) is inside the grid and not blocked"""
+        return 0 <= x < self.num_rows and 0 <= y < self.num_cols and not self._blocked[self.cell_id(x, y)]
+
+    def shortest_path(self, start: tuple[int, int], end: tuple[int, int], with_path: bool = False) -> PathResult:
+        """BFS from start that stops as soon as end is discovered.
+
+        Args:
+            start (tuple[int, int]): starting (x, y) coordinate
+            end (tuple[int, int]): ending (x, y) coordinate
+            with_path (bool): also return the (x, y) cells of one shortest path. Defaults to False.
+
+        Returns:
+            PathResult: distance (-1 if start or end is blocked or unreachable), path if requested, visited cells
+
+        Time Complexity: O(r * c)
+        Space Complexity: O(r * c), allocated once per engine except for the copy of the blocked cells
+        """
+        if not self.is_open(*start) or not self.is_open(*end):
+            return PathResult(-1, None, 0)
+        source: int = self.cell_id(*start)
+        target: int = self.cell_id(*end)
+        if source == target:
+            return PathResult(0, [start] if with_path else None, 1)
+
+        seen: bytearray = self._blocked[:] # 1 = blocked or visited
+        parent, offsets = self._parent, self.offsets
+        seen[source] = 1
+        queue: list[int] = [source]
+        append = queue.append
+        level_start: int = 0
+        level_end: int = 1 # queue[level_start:level_end] is the current level
+        depth: int = 0
+
+        while level_start < level_end:
+            depth += 1 # distance of the cells discovered from the current level
+            for cell in queue[level_start:level_end]:
+                for offset in offsets:
+                    neighbor: int = cell + offset
+                    if not seen[neighbor]:
+                        seen[neighbor] = 1
+                        parent[neighbor] = cell
+                        append(neighbor)
+            if seen[target]:
+                return PathResult(depth, self._path(source, target) if with_path else None, len(queue))
+            level_start, level_end = level_end, len(queue)
+        return PathResult(-1, None, len(queue))
+
+    def distance(self, start: tuple[int, int], end: tuple[int, int]) -> int:
+        """Same answer as bfs_shortest_distance_on_grid(grid, start, end)"""
+        return self.shortest_path(start, end).distance
+
+    def _path(self, source: int, target: int) -> list[tuple[int, int]]:
+        """Walks parent from target back to source, returns the coordinates from source to target"""
+        path: list[tuple[int, int]] = []
+        cell: int = target
+        while cell != source:
+            path.append(self.coordinate(cell))
+            cell = self._parent[cell]
+        path.append(self.coordinate(source))
+        path.reverse()
+        return path
+
+
+def grid_shortest_path(grid: list[list[int]], start: tuple[int, int], end: tuple[int, int],
+                       diagonal: bool = False) -> Optional[list[tuple[int, int]]]:
+    """One-off search: the cells of a shortest path from start to end, None if there is none.
+    Build a GridBFS once instead when searching the same grid many times."""
+    return GridBFS(grid, diagonal).shortest_path(start, end, with_path=True).path
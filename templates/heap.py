@@ -1,4 +1,4 @@
-from math import floor
+from collections.abc import Hashable, Iterable
 """
    Min-Heap: In a min-heap, for any given node I, the value of I is less than or equal to the values of its children. 
    The minimum element is at the root. 
@@ -15,7 +15,7 @@ from math import floor
      1     2
     / |   / \
    3  4  5   6
-    parent = floor((index - 1) / 2)
+    parent = (index - 1) // 2
     left_child = 2*index + 1
     right_child = 2*index + 2 
    
@@ -82,13 +82,67 @@ class Heap:
                 # children are greater or equal so we can't bubble down anymore (current value is smaller so can't go down)
                 break 
     
-    def build_heap(self, contents: list[int]) -> list[int]:
-        """Builds in O(n) because we don't run heapify on the leaves"""
+    def build_heap(self, contents: list[int], in_place: bool = False) -> list[int]:
+        """Builds in O(n) because we don't run heapify on the leaves.
+        With in_place=True the given list itself becomes the heap storage (no copy), so the caller must not use it afterwards."""
         if len(contents) == 0:
             raise ValueError("Can not build heap from empty array")
         
-        self.heap = contents[:] # copy over the contents to heap for now
+        self.heap = contents if in_place else contents[:] # copy over the contents to heap unless asked not to
+        self._heapify_all()
+            
+        return self.heap
+    
+    def pushpop(self, element: int) -> int:
+        """Inserts element then extracts the min, in a single heapify down (instead of one up and one down).
+        If element is smaller than everything in the heap it is returned right away and the heap is untouched."""
+        if element is None:
+            raise ValueError("Can not insert None into heap")
+        
+        if self.heapSize() == 0 or element <= self.heap[0]:
+            return element
+        
+        smallest: int = self.heap[0]
+        self.heap[0] = element # new element takes the root spot and bubbles down
+        self._heapify_down(0)
+        return smallest
+    
+    def replace(self, element: int) -> int | None:
+        """Extracts the min then inserts element, in a single heapify down. Unlike pushpop the returned value
+        can be bigger than element. Returns None (and just inserts) if the heap is empty."""
+        if element is None:
+            raise ValueError("Can not insert None into heap")
+        
+        if self.heapSize() == 0:
+            self.insert(element)
+            return None
+        
+        smallest: int = self.heap[0]
+        self.heap[0] = element
+        self._heapify_down(0)
+        return smallest
+    
+    def insert_many(self, elements: Iterable[int]) -> None:
+        """Inserts every element. When the batch is large compared to the heap (more than 4x) we append everything
+        and re-heapify the whole array in O(n + k) instead of heapifying up k times in O(k log(n + k)).
+        For small batches one by one wins because a random element only bubbles up ~1-2 levels on average."""
+        batch: list[int] = list(elements)
+        if any(element is None for element in batch):
+            raise ValueError("Can not insert None into heap")
         
+        if len(batch) > 4 * self.heapSize():
+            self.heap.extend(batch)
+            self._heapify_all()
+        else:
+            for element in batch:
+                self.insert(element)
+    
+    def merge(self, other_heap: 'Heap') -> None:
+        """Moves a copy of all elements of other_heap into this heap. other_heap is not modified"""
+        self.insert_many(other_heap.heap)
+    
+    def _heapify_all(self) -> None:
+        """Restores the heap property over the whole array by heapifying down every parent"""
         # calculate the last parent which is half way through - 1 for the index
         lastParentIndex: int = self.heapSize() // 2 - 1
         
@@ -96,8 +150,6 @@ class Heap:
         for i in range(lastParentIndex, -1, -1):
             self._heapify_down(i)
             
-        return self.heap
-            
     ### Define helper methods
     def getParent(self, index: int) -> int:
         if not self._hasParent(index) and not self._isValidIndex(index):
@@ -131,7 +183,7 @@ class Heap:
         return 2 * index + 2
     
     def _getParentIndex(self, index: int) -> int:
-        return floor((index - 1) / 2)
+        return (index - 1) // 2 # integer floor division, no float round trip
     
     def _hasParent(self, index: int) -> bool:
         # parent index has to be greater than 0
@@ -151,4 +203,234 @@ class Heap:
     def _swap(self, index1: int, index2: int) -> None:
         """Swaps the content of two indices inside the heap"""
         self.heap[index1], self.heap[index2] = self.heap[index2], self.heap[index1] 
-        
\ No newline at end of file
+        
+
+class IndexedHeap(Heap):
+    """
+    Min-Heap that also remembers WHERE every item lives inside the array.
+    
+    Each element gets a handle (any hashable, defaults to the element itself). Next to the array of priorities
+    we keep a parallel array of handles and a position map {handle: index}. _swap keeps all three in sync, so
+    _heapify_up and _heapify_down from Heap work unchanged.
+    
+    Why? Without the position map changing a priority means pushing a duplicate and skipping stale
+    entries later (heap grows with garbage). With it we can jump straight to the slot and sift from there.
+        insert / extract_min / decrease_key / increase_key / remove -> O(log n)
+        contains / priority lookup -> O(1)
+    """
+    def __init__(self, contents: dict[Hashable, int] | None = None) -> None:
+        self._handles: list[Hashable] = [] # handle stored at each heap slot (parallel to self.heap)
+        self._position: dict[Hashable, int] = {} # handle -> index inside self.heap
+        super().__init__()
+        
+        if contents is not None:
+            self.build_heap(contents)
+    
+    def insert(self, element: int, handle: Hashable | None = None) -> None:
+        """Inserts element with the given handle. If no handle is given the element is its own handle
+
+        Raises:
+            ValueError: if element is None or the handle is already in the heap
+        """
+        if element is None:
+            raise ValueError("Can not insert None into heap")
+        if handle is None:
+            handle = element
+        if handle in self._position:
+            raise ValueError(f"Handle {handle!r} is already in the heap, use update() to change its priority")
+        
+        self.heap.append(element)
+        self._handles.append(handle)
+        self._position[handle] = self.heapSize() - 1
+        self._heapify_up(self.heapSize() - 1)
+    
+    def extract_min(self) -> int | None:
+        """Extracts and returns the minimum element (priority) from the heap"""
+        item = self.extract_min_item()
+        return None if item is None else item[1]
+    
+    def extract_min_item(self) -> tuple[Hashable, int] | None:
+        """Extracts the minimum and returns it as (handle, priority). None if heap is empty"""
+        if self.heapSize() == 0:
+            return None
+        handle: Hashable = self._handles[0]
+        return handle, self._remove_at(0)
+    
+    def peek_min_item(self) -> tuple[Hashable, int] | None:
+        """Returns (handle, priority) of the minimum without removing it. None if heap is empty"""
+        if self.heapSize() == 0:
+            return None
+        return self._handles[0], self.heap[0]
+    
+    def contains(self, handle: Hashable) -> bool:
+        return handle in self._position
+    
+    def __contains__(self, handle: Hashable) -> bool:
+        return handle in self._position
+    
+    def priority(self, handle: Hashable) -> int:
+        """Returns the current priority of the handle. Raises KeyError if handle is not in the heap"""
+        return self.heap[self._position[handle]]
+    
+    def decrease_key(self, handle: Hashable, new_priority: int) -> None:
+        """Lowers the priority of handle. Smaller value can only move UP so we only heapify up
+
+        Raises:
+            KeyError: if handle is not in the heap
+            ValueError: if new_priority is bigger than the current priority
+        """
+        index: int = self._position[handle]
+        if new_priority > self.heap[index]:
+            raise ValueError(f"New priority {new_priority} is bigger than current priority {self.heap[index]}")
+        self.heap[index] = new_priority
+        self._heapify_up(index)
+    
+    def increase_key(self, handle: Hashable, new_priority: int) -> None:
+        """Raises the priority of handle. Bigger value can only move DOWN so we only heapify down
+
+        Raises:
+            KeyError: if handle is not in the heap
+            ValueError: if new_priority is smaller than the current priority
+        """
+        index: int = self._position[handle]
+        if new_priority < self.heap[index]:
+            raise ValueError(f"New priority {new_priority} is smaller than current priority {self.heap[index]}")
+        self.heap[index] = new_priority
+        self._heapify_down(index)
+    
+    def update(self, handle: Hashable, new_priority: int) -> None:
+        """Sets the priority of handle to new_priority whichever direction it moves. Inserts the handle if missing"""
+        if handle not in self._position:
+            self.insert(new_priority, handle)
+        elif new_priority < self.heap[self._position[handle]]:
+            self.decrease_key(handle, new_priority)
+        else:
+            self.increase_key(handle, new_priority)
+    
+    def remove(self, handle: Hashable) -> int:
+        """Removes handle from anywhere in the heap and returns its priority
+
+        Raises:
+            KeyError: if handle is not in the heap
+        """
+        return self._remove_at(self._position[handle])
+    
+    def build_heap(self, contents: dict[Hashable, int] | list[int], in_place: bool = False) -> list[int]:
+        """Builds in O(n) from a {handle: priority} mapping, or like Heap.build_heap from a list of priorities
+        that are their own handles (same default as insert). in_place only applies to a list.
+
+        Raises:
+            ValueError: if contents is empty, or a list holds the same priority twice (handles must be unique)
+        """
+        if isinstance(contents, dict):
+            handles: list[Hashable] = list(contents.keys())
+            priorities: list[int] = list(contents.values())
+            in_place = True # the values list is ours, no need to copy it again
+        else:
+            handles = list(contents)
+            priorities = contents
+        if len(handles) == 0:
+            raise ValueError("Can not build heap from empty array")
+        position: dict[Hashable, int] = {handle: index for index, handle in enumerate(handles)}
+        if len(position) != len(handles):
+            raise ValueError("Priorities are their own handles when building from a list, so they must be unique")
+        
+        # handles first, the heapify in Heap.build_heap swaps through _swap and keeps them in sync
+        self._handles = handles
+        self._position = position
+        return super().build_heap(priorities, in_place=in_place)
+    
+    # The bulk shortcuts of Heap write straight into self.heap and would leave the handles out of sync,
+    # so they fall back to the handle aware operations here.
+    def pushpop(self, element: int, handle: Hashable | None = None) -> int:
+        """Heap.pushpop with a handle for element (defaults to element itself, like insert)
+
+        Raises:
+            ValueError: if element is None or the handle is already in the heap
+        """
+        if element is None:
+            raise ValueError("Can not insert None into heap")
+        if self.heapSize() == 0 or element <= self.heap[0]:
+            return element
+        self.insert(element, handle)
+        return self.extract_min() # type: ignore[return-value]
+    
+    def replace(self, element: int, handle: Hashable | None = None) -> int | None:
+        """Heap.replace with a handle for element (defaults to element itself, like insert).
+        The handle is checked before the min is extracted, so a rejected call leaves the heap unchanged.
+
+        Raises:
+            ValueError: if element is None or the handle is already in the heap (other than at the min)
+        """
+        if element is None:
+            raise ValueError("Can not insert None into heap")
+        if handle is None:
+            handle = element
+        if handle in self._position and self._position[handle] != 0:
+            raise ValueError(f"Handle {handle!r} is already in the heap, use update() to change its priority")
+        smallest: int | None = self.extract_min()
+        self.insert(element, handle)
+        return smallest
+    
+    def insert_many(self, elements: Iterable[int]) -> None:
+        for element in elements:
+            self.insert(element)
+    
+    def merge(self, other_heap: Heap) -> None:
+        """Inserts all (handle, priority) pairs of other_heap. Handles must not already be in this heap"""
+        if isinstance(other_heap, IndexedHeap):
+            for handle, priority in zip(other_heap._handles, other_heap.heap):
+                self.insert(priority, handle)
+        else:
+            self.insert_many(other_heap.heap)
+    
+    def _remove_at(self, index: int) -> int:
+        """Removes the element at index by moving the last element into its place and sifting it"""
+        removed_priority: int = self.heap[index]
+        last_index: int = self.heapSize() - 1
+        
+        # step 1: move the element to remove to the end
+        self._swap(index, last_index)
+        # step 2: delete it from all three structures
+        self.heap.pop()
+        del self._position[self._handles.pop()]
+        # step 3: the moved element may be smaller than its new parent or bigger than its new children
+        if index < last_index:
+            self._heapify_up(index)
+            self._heapify_down(index)
+        
+        return removed_priority
+    
+    def _swap(self, index1: int, index2: int) -> None:
+        """Swaps two slots and keeps the handles and position map in sync"""
+        super()._swap(index1, index2)
+        handles: list[Hashable] = self._handles
+        handles[index1], handles[index2] = handles[index2], handles[index1]
+        self._position[handles[index1]] = index1
+        self._position[handles[index2]] = index2
+
+
+def nlargest(iterable: Iterable[int], k: int) -> list[int]:
+    """Returns the k largest elements in descending order. Streams the iterable through a min-heap
+    that never holds more than k elements, so memory is O(k) and time is O(n log k)."""
+    if k <= 0:
+        return []
+    
+    heap: Heap = Heap()
+    for element in iterable:
+        if heap.heapSize() < k:
+            heap.insert(element)
+        else:
+            heap.pushpop(element) # drops the smallest of (element, current k largest)
+    
+    result: list[int] = []
+    while not heap.is_empty():
+        result.append(heap.extract_min()) # type: ignore[arg-type]
+    result.reverse()
+    return result
+
+
+def nsmallest(iterable: Iterable[int], k: int) -> list[int]:
+    """Returns the k smallest elements in ascending order using O(k) memory.
+    Heap is a min-heap so we keep the NEGATED values, making the root the largest of the current k smallest."""
+    return [-element for element in nlargest((-element for element in iterable), k)]
@@ -75,9 +75,12 @@ class LinkedList:
         """Returns the head of the list. Helpful for Queue implementation
 
         Returns:
-            Any: Value at the head (front) of the linkedlist
+            Any: Value at the head (front) of the linkedlist, None if the list is empty
         """
-        return self._head.value
+        # the head is the node after the dummy, the dummy itself always holds None
+        if self._head.next is None:
+            return None
+        return self._head.next.value
     
     def remove_head(self) -> None:
         """Removes the head of the list. Throws assertion error if list is empty
@@ -0,0 +1,156 @@
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from types import TracebackType
+from typing import Any
+
+from templates._typed import infer_typecode
+"""
+   Binary search over a sorted file of fixed-width records, straight from a memory map.
+
+   The file is an optional header followed by n records of the same size, sorted by key:
+        header (header_size bytes) | record 0 | record 1 | ... | record n - 1
+   A record is described by a struct format (e.g. "<qd8s" = int64 key, double, 8 bytes of payload) and the key
+   is read with its own struct format at key_offset bytes into the record. Record i starts at
+        header_size + i * record_size
+   so the searches below are the ones from binarySearch.py with arr[mid] replaced by one struct.unpack_from
+   on the mapping. Nothing is read into a list and nothing is copied, the OS pages the file in on demand.
+
+   Sparse index (optional): the key of every k-th record is kept in memory. A lookup first bisects that small
+   array (no disk access), which leaves a single block of k records to search in the file. A cold lookup then
+   touches ~1 page instead of the ~log2(n) pages scattered over the whole file by a plain binary search.
+"""
+
+
+def write_records(path: str, records: Iterable[tuple[Any, ...]], record_format: str, header: bytes = b"") -> int:
+    """Writes records (already sorted by key) in the layout above. Returns the number of records written"""
+    packer: struct.Struct = struct.Struct(record_format)
+    count: int = 0
+    with open(path, "wb") as f:
+        f.write(header)
+        for record in records:
+            f.write(packer.pack(*record))
+            count += 1
+    return count
+
+
+class MappedRecords:
+    def __init__(self, path: str, record_format: str, key_format: str = "<q", key_offset: int = 0,
+                 header_size: int = 0, sparse_every: int = 0) -> None:
+        """Maps a sorted record file. O(1) without a sparse index, O(n / sparse_every) with one.
+
+        Args:
+            path (str): file to map
+            record_format (str): struct format of a whole record, defines the record size
+            key_format (str): struct format of the key inside a record. Defaults to "<q" (little endian int64).
+            key_offset (int): byte offset of the key inside a record. Defaults to 0.
+            header_size (int): bytes to skip at the start of the file. Defaults to 0.
+            sparse_every (int): keep the key of every k-th record in memory, 0 for no sparse index. Defaults to 0.
+
+        Raises:
+            ValueError: if the key does not fit in a record or the file is not a whole number of records
+        """
+        self._record: struct.Struct = struct.Struct(record_format)
+        self._key: struct.Struct = struct.Struct(key_format)
+        record_size: int = self._record.size
+        if key_offset < 0 or key_offset + self._key.size > record_size:
+            raise ValueError(f"A {self._key.size} byte key at offset {key_offset} does not fit in a "
+                             f"{record_size} byte record")
+
+        self._file = open(path, "rb")
+        file_size: int = os.fstat(self._file.fileno()).st_size
+        if file_size < header_size or (file_size - header_size) % record_size != 0:
+            self._file.close()
+            raise ValueError(f"{path} is not a whole number of {record_size} byte records")
+        # an empty file can't be mapped, it just has no records
+        self._map: mmap.mmap | None = (mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                                       if file_size > 0 else None)
+        self._n: int = (file_size - header_size) // record_size
+        self._record_size: int = record_size
+        self._header_size: int = header_size
+        self._key_start: int = header_size + key_offset # byte offset of the key of record 0
+
+        self.sparse_every: int = sparse_every
+        self._sparse: list[Any] | array | None = None
+        if sparse_every > 0:
+            keys: list[Any] = [self.key_at(i) for i in range(0, self._n, sparse_every)]
+            typecode: str | None = infer_typecode(keys)
+            self._sparse = keys if typecode is None else array(typecode, keys)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def key_at(self, index: int) -> Any:
+        """Returns the key of record index, read from the mapping"""
+        return self._key.unpack_from(self._map, self._key_start + index * self._record_size)[0] # type: ignore[arg-type]
+
+    def record(self, index: int) -> tuple[Any, ...]:
+        """Returns record index unpacked with record_format"""
+        if not 0 <= index < self._n:
+            raise IndexError(f"record index {index} out of range")
+        return self._record.unpack_from(self._map, self._header_size + index * self._record_size) # type: ignore[arg-type]
+
+    def lower_bound(self, query: Any) -> int:
+        """Returns the index of the first record with key >= query, len(self) if there is none. O(log n)"""
+        lo, hi = self._block(query, bisect_left)
+        unpack, buffer, start, size = self._key.unpack_from, self._map, self._key_start, self._record_size
+        while lo < hi:
+            mid: int = (lo + hi) // 2
+            if unpack(buffer, start + mid * size)[0] < query:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def upper_bound(self, query: Any) -> int:
+        """Returns the index of the first record with key > query, len(self) if there is none. O(log n)"""
+        lo, hi = self._block(query, bisect_right)
+        unpack, buffer, start, size = self._key.unpack_from, self._map, self._key_start, self._record_size
+        while lo < hi:
+            mid: int = (lo + hi) // 2
+            if unpack(buffer, start + mid * size)[0] <= query:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def binary_search(self, query: Any) -> int:
+        """Returns the index of the first record with key == query, -1 if there is none. O(log n)"""
+        index: int = self.lower_bound(query)
+        if index < self._n and self.key_at(index) == query:
+            return index
+        return -1
+
+    def range(self, lo: Any, hi: Any) -> Iterator[tuple[Any, ...]]:
+        """Lazily yields the records with lo <= key <= hi in file order. O(log n + number of records yielded)"""
+        index: int = self.lower_bound(lo)
+        while index < self._n and self.key_at(index) <= hi:
+            yield self.record(index)
+            index += 1
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MappedRecords':
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None,
+                 traceback: TracebackType | None) -> None:
+        self.close()
+
+    ### Internal Methods
+    def _block(self, query: Any, bisect: Any) -> tuple[int, int]:
+        """Narrows a search to [lo, hi) with the sparse index (the whole file without one). The answer is <= hi.
+        bisect is bisect_left for lower_bound and bisect_right for upper_bound"""
+        if self._sparse is None:
+            return 0, self._n
+        every: int = self.sparse_every
+        j: int = bisect(self._sparse, query) # block j - 1 starts before the answer, block j starts at or after it
+        lo: int = 0 if j == 0 else (j - 1) * every + 1
+        hi: int = min(j * every, self._n)
+        return lo, hi
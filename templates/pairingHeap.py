@@ -0,0 +1,114 @@
+from collections.abc import Iterable
+from typing import Optional
+"""
+   Pairing Heap: a heap-ordered multiway tree (every node is <= all of its children) kept as pointers, not an array.
+
+   Each node stores its value, its FIRST child and its next sibling (left-child right-sibling representation):
+        1                 1
+      / | \\             /
+     4  2  7    ==>    4 -> 2 -> 7     (-> is the sibling pointer)
+        |                   |
+        5                   5
+
+   meld(a, b): the root with the bigger value becomes the first child of the other root. O(1)
+   insert: meld with a single node heap. O(1)
+   extract_min: remove the root, then combine its children with the two pass pairing below. amortized O(log n)
+        pass 1 (left to right): meld children in pairs (1st with 2nd, 3rd with 4th, ...)
+        pass 2 (right to left): meld the pairs back into one tree
+
+   Compared to the array Heap, merging two heaps of size n and m is O(1) instead of O(n + m).
+"""
+
+
+class PairingNode:
+    __slots__ = ("value", "child", "sibling") # no per node __dict__, saves memory for millions of nodes
+
+    def __init__(self, value: int) -> None:
+        self.value: int = value
+        self.child: Optional['PairingNode'] = None
+        self.sibling: Optional['PairingNode'] = None
+
+
+def _meld_nodes(a: PairingNode, b: PairingNode) -> PairingNode:
+    """Links two roots. The bigger root becomes the first child of the smaller root, returns the new root"""
+    if b.value < a.value:
+        a, b = b, a
+    b.sibling = a.child
+    a.child = b
+    return a
+
+
+class PairingHeap:
+    def __init__(self, contents: Iterable[int] | None = None) -> None:
+        self.root: Optional[PairingNode] = None
+        self.size: int = 0
+
+        if contents is not None:
+            for c in contents:
+                self.insert(c)
+
+    def insert(self, element: int) -> None:
+        if element is None:
+            raise ValueError("Can not insert None into heap")
+
+        node = PairingNode(element)
+        self.root = node if self.root is None else _meld_nodes(self.root, node)
+        self.size += 1
+
+    def get_min(self) -> int | None:
+        """Returns the minimum element without removing it. None if heap is empty"""
+        return None if self.root is None else self.root.value
+
+    def extract_min(self) -> int | None:
+        """Extracts and returns the minimum element from the heap. None if heap is empty"""
+        if self.root is None:
+            return None
+
+        min_value: int = self.root.value
+        self.root = self._merge_pairs(self.root.child)
+        self.size -= 1
+        return min_value
+
+    def meld(self, other: 'PairingHeap') -> None:
+        """Moves every element of other into this heap in O(1). other is left empty"""
+        if other is self or other.root is None:
+            return
+        self.root = other.root if self.root is None else _meld_nodes(self.root, other.root)
+        self.size += other.size
+        other.root = None
+        other.size = 0
+
+    def heapSize(self) -> int:
+        return self.size
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    ### Internal Methods
+    def _merge_pairs(self, first: Optional[PairingNode]) -> Optional[PairingNode]:
+        """Two pass pairing of a sibling list. Iterative so long child lists can't hit the recursion limit"""
+        if first is None:
+            return None
+
+        # pass 1: meld siblings in pairs left to right
+        pairs: list[PairingNode] = []
+        while first is not None:
+            second: Optional[PairingNode] = first.sibling
+            if second is None:
+                first.sibling = None
+                pairs.append(first)
+                break
+            next_first: Optional[PairingNode] = second.sibling
+            first.sibling = None
+            second.sibling = None
+            pairs.append(_meld_nodes(first, second))
+            first = next_first
+
+        # pass 2: meld the pairs right to left into a single tree
+        root: PairingNode = pairs.pop()
+        while pairs:
+            root = _meld_nodes(pairs.pop(), root)
+        return root
@@ -1,5 +1,5 @@
 from typing import Any
-from linkedList import LinkedList
+from templates.linkedList import LinkedList
 
 class Queue:
     def __init__(self, contents: list[Any] | None = None) -> None:
@@ -12,11 +12,13 @@ class Queue:
         assert item is not None, "Can not enqueue Null item into the Queue"
         self.queue.append(item)
     
-    def peek (self) -> Any:
-        self.queue.get_head()
+    def peek(self) -> Any:
+        return self.queue.get_head()
     
     def is_empty(self) -> bool:
         return self.queue.get_size() == 0
     
     def dequeue(self) -> Any:
-        self.queue.remove_head()
\ No newline at end of file
+        item: Any = self.queue.get_head()
+        self.queue.remove_head()
+        return item
@@ -0,0 +1,101 @@
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+from templates._typed import infer_typecode
+"""
+   Static search index over a sorted list, stored in Eytzinger (BFS) order.
+
+   A sorted array is the in-order traversal of a balanced BST. Eytzinger order stores that same BST level by level,
+   like the array Heap, 1-indexed (slot 0 is unused):
+        children of k = 2k and 2k + 1,   root = 1
+
+        sorted: 1 2 3 4 5 6 7                 4
+        index:  _ 4 2 6 1 3 5 7    <==      /   \\
+                                           2     6
+                                          / \\   / \\
+                                         1   3 5   7
+
+   Why bother? The classic halving loop jumps between far apart parts of the array on every step.
+   Here the first levels of the search are the first slots of the array (always hot in cache), and the two
+   candidates for the next step are neighbours (2k, 2k + 1), so every step is one predictable memory access.
+   The descent has no if/else either, the comparison result is added to the index:
+        k = 2k + (data[k] < query)
+   After falling off the bottom, the answer is the last node where we went LEFT: strip the trailing 1 bits of k
+   (the right turns at the end) and one more bit for that left turn.
+
+   Values are kept in a typed array ('q' for ints within int64, 'd' for floats) when possible, otherwise in a plain
+   list, next to an array mapping every slot back to its position in the original sorted list.
+
+   What it buys in CPython (benchmarks/sortedIndex.py, random int lookups): about the same speed as binary_search at
+   n = 10^3, 1.2x faster at 10^5 and 1.7x at 10^6, where the cache effects start to show through the interpreter
+   overhead. It is still 1.6-4x SLOWER than bisect.bisect_left at every size, since bisect runs its loop in C.
+   Use bisect for plain sorted lists; this is the layout to port when the loop itself is compiled.
+"""
+
+
+class SortedIndex:
+    def __init__(self, values: Iterable[Any]) -> None:
+        """Builds the index in O(n). The index is read only.
+
+        Args:
+            values (Iterable[Any]): values in ascending order, duplicates allowed
+
+        Raises:
+            ValueError: if values are not in ascending order
+        """
+        ascending: list[Any] = values if isinstance(values, list) else list(values)
+        for i in range(1, len(ascending)):
+            if ascending[i - 1] > ascending[i]:
+                raise ValueError(f"Values must be in ascending order, found {ascending[i - 1]} before {ascending[i]}")
+
+        n: int = len(ascending)
+        typecode: str | None = infer_typecode(ascending)
+        self._n: int = n
+        # slot 0 is padding so the children of k are exactly 2k and 2k + 1
+        self._data: list[Any] | array = [None] * (n + 1) if typecode is None else array(typecode, [0]) * (n + 1)
+        self._positions: array = array('q', [-1]) * (n + 1) # Eytzinger slot -> index in ascending
+
+        # in-order walk of the implicit tree hands out the sorted values in order
+        data, positions = self._data, self._positions
+        i: int = 0
+        stack: list[int] = []
+        k: int = 1
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            data[k] = ascending[i]
+            positions[k] = i
+            i += 1
+            k = 2 * k + 1
+
+    def lower_bound(self, query: Any) -> int:
+        """Returns the position in the sorted values of the first value >= query, len(self) if there is none.
+        O(log n)"""
+        data = self._data
+        n: int = self._n
+        k: int = 1
+        while k <= n:
+            k = 2 * k + (data[k] < query)
+        k >>= (~k & (k + 1)).bit_length() # drops the trailing right turns and the last left turn
+        return self._positions[k] if k != 0 else n
+
+    def find(self, query: Any) -> int:
+        """Returns the position of the first occurrence of query in the sorted values, -1 if it is missing. O(log n)"""
+        data = self._data
+        n: int = self._n
+        k: int = 1
+        while k <= n:
+            k = 2 * k + (data[k] < query)
+        k >>= (~k & (k + 1)).bit_length()
+        if k == 0 or data[k] != query:
+            return -1
+        return self._positions[k]
+
+    def __contains__(self, query: Any) -> bool:
+        return self.find(query) != -1
+
+    def __len__(self) -> int:
+        return self._n
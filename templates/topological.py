@@ -1,5 +1,7 @@
 from collections import defaultdict, deque
 
+from templates.csrGraph import CSRGraph
+
 
 def convert_edgeList_to_adjList(edgeList: list[tuple[int, int]]) -> dict[int, list[int]]:
     """Convert any edge list represnetation to adjList in O(E) time
@@ -55,7 +57,9 @@ def calculate_indegree_from_adjList(adj_list: dict[int, list[int]]) -> list[int]
     Returns:
         list[int]: indegree of each list
     """
-    indegree: list[int] = [0 for _ in range(len(adj_list))]
+    # nodes that only appear as neighbors (sinks of an edge list) may not be keys, so size by the biggest node
+    n: int = max((max(src, max(values, default=src)) for src, values in adj_list.items()), default=-1) + 1
+    indegree: list[int] = [0 for _ in range(n)]
     for values in adj_list.values():
         for v in values:
             indegree[v] += 1
@@ -68,14 +72,14 @@ We maintain the indegree of each node (initially O(n) to find all in-degrees but
 Each time we remove a node from the graph, we decrement the indegree of all of its outneighbors. 
 If the indegree of any of these nodes becomes 0, then we add it to our list.
 '''
-def topological_sort(graph: dict[int, list[int]] | list[tuple[int, int]]) -> list[int]:
+def topological_sort(graph: dict[int, list[int]] | list[tuple[int, int]] | CSRGraph) -> list[int]:
     """Finding topological ordering of the given graph.
     Input examples:
     adj_list =  {0: [1], 1: [2, 3], 2: [], 3: [2, 4], 4: []}
     edge list =  [(0, 1), (1, 2), (1, 3), (3, 2), (3, 4)]
 
     Args:
-        graph (dict[int, list[int]] | list[tuple[int, int]]): either adjacency list or edge list
+        graph (dict[int, list[int]] | list[tuple[int, int]] | CSRGraph): adjacency list, edge list or CSR
 
     Returns:
         list[int]: topological ordering - dependency perserving ordering of the vertices
@@ -90,6 +94,9 @@ def topological_sort(graph: dict[int, list[int]] | list[tuple[int, int]]) -> lis
         5. For each neighbor of the node, decrement its indegree by 1. If the neighbor's indegree is now 0, add it to the queue.
     Return the topological order.
     '''
+    if isinstance(graph, CSRGraph):
+        return _topological_sort_csr(graph)
+    
     topoOrder: list[int] = []
     
     # if input is edgelist convert to adjacency list
@@ -113,8 +120,23 @@ def topological_sort(graph: dict[int, list[int]] | list[tuple[int, int]]) -> lis
         # for each neighbor of this node decrement indegree by 1
         for neighbor in graph[sourceNode]:
             indegree[neighbor] -= 1
-            if indegree == 0:
-                # if indegree has become 1 then add to Queue
+            if indegree[neighbor] == 0:
+                # if indegree has become 0 then add to Queue
                 Q.append(neighbor)
     
-    return topoOrder
\ No newline at end of file
+    return topoOrder
+
+def _topological_sort_csr(graph: CSRGraph) -> list[int]:
+    """Kahn's algorithm over a CSRGraph. Like in the BFS, the order list doubles as the queue"""
+    offsets, targets = graph.offsets, graph.targets
+    indegree: list[int] = graph.in_degrees()
+    topoOrder: list[int] = [node for node, degree in enumerate(indegree) if degree == 0]
+    head: int = 0
+    while head < len(topoOrder):
+        sourceNode: int = topoOrder[head]
+        head += 1
+        for neighbor in targets[offsets[sourceNode]:offsets[sourceNode + 1]]:
+            indegree[neighbor] -= 1
+            if indegree[neighbor] == 0:
+                topoOrder.append(neighbor)
+    return topoOrder
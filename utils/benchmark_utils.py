@@ -0,0 +1,175 @@
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+import datetime
+import json
+import platform
+import random
+import re
+import sys
+
+from utils.timing_utils import MemoryStats, measure_memory, measure_stats
+"""
+   Benchmark registry, JSON results and regression comparison, built on measure_stats from timing_utils.
+
+   A benchmark is a function (n, rng) -> zero argument callable. Everything before the return is setup and is
+   not timed, only calling the returned callable is:
+
+        @register("heap.build_heap", sizes=(1_000, 100_000))
+        def heap_build(n: int, rng: random.Random) -> Callable[[], Any]:
+            values = [rng.random() for _ in range(n)]
+            return lambda: Heap(values)
+
+   With kind="memory" the callable must build and return a structure holding n items instead. It is run repeat
+   times under measure_memory, the run with the median retained bytes is kept and the primary metric is the
+   structure's retained bytes per element.
+
+   Results file (JSON):
+        {"meta": {...python version, machine, time...},
+         "results": [{"name": ..., "size": ..., "primary": "median_s", "metrics": {"median_s": ..., ...}}, ...]}
+   Every result names its primary metric, the one compare_results checks. Lower is always better.
+"""
+
+DEFAULT_SIZES: tuple[int, ...] = (1_000, 10_000)
+# (n, rng) -> the callable to time
+BenchmarkFactory = Callable[[int, random.Random], Callable[[], Any]]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    make: BenchmarkFactory
+    sizes: tuple[int, ...]
+    complexity: str | None = None # declared growth of ONE call of the timed callable in n, e.g. "O(n log n)"
+    kind: str = "time" # "time" or "memory"
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    size: int
+    primary: str # key of metrics that regressions are judged on
+    metrics: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def value(self) -> float:
+        return self.metrics[self.primary]
+
+
+@dataclass
+class Comparison:
+    name: str
+    size: int
+    metric: str
+    old: float
+    new: float
+
+    @property
+    def ratio(self) -> float:
+        """new / old, above 1 means slower (or bigger)"""
+        return self.new / self.old if self.old > 0 else float("inf")
+
+
+REGISTRY: dict[str, Benchmark] = {}
+
+
+def register(name: str, sizes: Iterable[int] = DEFAULT_SIZES, complexity: str | None = None,
+             kind: str = "time") -> Callable[[BenchmarkFactory], BenchmarkFactory]:
+    """Decorator adding a benchmark to REGISTRY under name, run once for every size.
+    complexity is checked by the scaling suite (see scaling_utils)
+
+    Raises:
+        ValueError: if name is already registered or kind is not "time" or "memory"
+    """
+    if kind not in ("time", "memory"):
+        raise ValueError(f"Benchmark kind must be 'time' or 'memory', got {kind!r}")
+
+    def decorator(make: BenchmarkFactory) -> BenchmarkFactory:
+        if name in REGISTRY:
+            raise ValueError(f"Benchmark {name!r} is already registered")
+        REGISTRY[name] = Benchmark(name=name, make=make, sizes=tuple(sizes), complexity=complexity, kind=kind)
+        return make
+    return decorator
+
+
+def select(pattern: str = "") -> list[Benchmark]:
+    """Returns the registered benchmarks whose name matches the regex pattern (all for ""), sorted by name"""
+    regex: re.Pattern[str] = re.compile(pattern)
+    return [REGISTRY[name] for name in sorted(REGISTRY) if regex.search(name)]
+
+
+def run_benchmarks(benchmarks: Iterable[Benchmark], sizes: Iterable[int] | None = None, seed: int = 0,
+                   repeat: int = 7, min_time: float = 0.05, disable_gc: bool = True,
+                   report: Callable[[BenchmarkResult], None] | None = None) -> list[BenchmarkResult]:
+    """Times (or for kind="memory", measures the memory of) every benchmark at every size
+    (its own sizes unless sizes is given).
+
+    Every (benchmark, size) gets its own rng seeded from seed, name and size, so inputs are the same across runs
+    and don't depend on which other benchmarks were selected. report is called after each result.
+    """
+    results: list[BenchmarkResult] = []
+    for benchmark in benchmarks:
+        for n in (tuple(sizes) if sizes is not None else benchmark.sizes):
+            rng: random.Random = random.Random(f"{seed}:{benchmark.name}:{n}")
+            timed: Callable[[], Any] = benchmark.make(n, rng)
+            result: BenchmarkResult
+            if benchmark.kind == "memory":
+                # retained bytes vary between runs (allocator and interned objects), keep the median run like
+                # the timing path does so compare_results doesn't flag the noise
+                runs: list[MemoryStats] = sorted((measure_memory(timed, elements=n) for _ in range(repeat)),
+                                                 key=lambda stats: stats.retained_bytes)
+                memory: MemoryStats = runs[len(runs) // 2]
+                result = BenchmarkResult(name=benchmark.name, size=n, primary="bytes_per_element",
+                                         metrics=memory.as_dict())
+            else:
+                stats = measure_stats(timed, repeat=repeat, min_time=min_time, disable_gc=disable_gc)
+                result = BenchmarkResult(name=benchmark.name, size=n, primary="median_s", metrics=stats.as_dict())
+            results.append(result)
+            if report is not None:
+                report(result)
+    return results
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """One line summary of a timing or memory result"""
+    m: dict[str, float] = result.metrics
+    if result.primary == "bytes_per_element":
+        return (f"{result.name:<45} n={result.size:<10} {m['bytes_per_element']:10.1f} bytes/element  "
+                f"retained={m['retained_bytes']:,.0f} B  peak={m['peak_bytes']:,.0f} B  "
+                f"allocations={m['allocations']:,.0f}")
+    return (f"{result.name:<45} n={result.size:<10} median={m['median_s'] * 1e3:10.4f} ms  "
+            f"min={m['min_s'] * 1e3:10.4f} ms  p95={m['p95_s'] * 1e3:10.4f} ms  "
+            f"stddev={m['stddev_s'] / m['median_s'] * 100 if m['median_s'] else 0:5.1f}%")
+
+
+def save_results(results: Iterable[BenchmarkResult], path: str) -> None:
+    meta: dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+    }
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "results": [asdict(r) for r in results]}, f, indent=2)
+
+
+def load_results(path: str) -> list[BenchmarkResult]:
+    with open(path) as f:
+        return [BenchmarkResult(**r) for r in json.load(f)["results"]]
+
+
+def compare_results(old: Iterable[BenchmarkResult], new: Iterable[BenchmarkResult]) -> list[Comparison]:
+    """Pairs up results with the same name, size and primary metric. Results only in one of the files are skipped"""
+    baseline: dict[tuple[str, int, str], BenchmarkResult] = {(r.name, r.size, r.primary): r for r in old}
+    comparisons: list[Comparison] = []
+    for r in new:
+        before: BenchmarkResult | None = baseline.get((r.name, r.size, r.primary))
+        if before is not None:
+            comparisons.append(Comparison(name=r.name, size=r.size, metric=r.primary, old=before.value, new=r.value))
+    return comparisons
+
+
+def regressions(comparisons: Iterable[Comparison], threshold: float = 0.1) -> list[Comparison]:
+    """Comparisons where the primary metric grew by more than threshold (0.1 = 10% slower or bigger)"""
+    return [c for c in comparisons if c.ratio > 1 + threshold]
@@ -0,0 +1,203 @@
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+import cProfile
+import functools
+import io
+import os
+import pstats
+"""
+   Opt-in operation counters for the templates: swaps, sift depths, node allocations, rotations, pointer hops,
+   BST search path lengths.
+
+   Zero cost when off: nothing in the templates checks a flag. enable() swaps counting wrappers in for the
+   methods listed in _targets() (monkeypatching), disable() puts the original functions back, so a disabled run
+   executes exactly the original code. The one thing the templates keep for it is BinarySearchTree.last_path_length,
+   an int insert and delete store once per call during their own walk (search has a counting twin,
+   _counted_search, that is swapped in instead), so the wrappers never re-walk the tree.
+
+   Turn it on with
+        DSA_INSTRUMENT=1 python -m benchmarks.suite run ...     (enabled when this module is imported)
+   or
+        with instrumented():
+            heap = Heap(values) ...
+        print(format_report())
+
+   measure_time reports the counters per call next to the wall time whenever instrumentation is on, and with
+   DSA_PROFILE=1 it also prints the top functions of one cProfile'd call (profile_call below). The wrappers keep the
+   name of the function they wrap, so profiles show "_swap" rather than "wrapper".
+"""
+
+ENV_VAR: str = "DSA_INSTRUMENT"
+PROFILE_ENV_VAR: str = "DSA_PROFILE"
+
+counters: Counter[str] = Counter() # event name -> count
+histograms: defaultdict[str, Counter[int]] = defaultdict(Counter) # metric name -> {depth: how many times}
+
+_originals: list[tuple[Any, str, Any]] = [] # (owner, attribute, original) of every installed wrapper
+_sift_swaps: list[int] = [] # swap count of every sift in progress (a stack, sifts can nest through subclasses)
+
+
+def is_enabled() -> bool:
+    return len(_originals) > 0
+
+
+def reset() -> None:
+    counters.clear()
+    histograms.clear()
+
+
+def enable() -> None:
+    """Installs the counting wrappers. Does nothing if they are already installed"""
+    if is_enabled():
+        return
+    for owner, name, make_wrapper in _targets():
+        original: Any = owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name)
+        wrapper: Callable[..., Any] = make_wrapper(original)
+        functools.update_wrapper(wrapper, original)
+        # cProfile names functions by their code object, so give the wrapper's code the original's name
+        wrapper.__code__ = wrapper.__code__.replace(co_name=original.__name__)
+        setattr(owner, name, wrapper)
+        _originals.append((owner, name, original))
+
+
+def disable() -> None:
+    """Puts every original function back"""
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+
+
+@contextmanager
+def instrumented(clear: bool = True) -> Iterator[Counter[str]]:
+    """Enables instrumentation inside the with block (clearing old counts unless clear=False) and yields counters.
+    Leaves it enabled on exit if it was already enabled before (e.g. by the environment variable)"""
+    was_enabled: bool = is_enabled()
+    if clear:
+        reset()
+    enable()
+    try:
+        yield counters
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def format_report(per: int = 1) -> str:
+    """Counters (divided by per, e.g. the number of timed calls) and a summary of every histogram"""
+    lines: list[str] = []
+    for name in sorted(counters):
+        lines.append(f"  {name:<40} {counters[name] / per:>14,.1f}")
+    for name in sorted(histograms):
+        histogram: Counter[int] = histograms[name]
+        total: int = sum(histogram.values())
+        mean: float = sum(depth * count for depth, count in histogram.items()) / total
+        spread: str = ", ".join(f"{depth}: {count}" for depth, count in sorted(histogram.items())[:12])
+        more: str = ", ..." if len(histogram) > 12 else ""
+        lines.append(f"  {name:<40} mean {mean:.2f}, max {max(histogram)}  {{{spread}{more}}}")
+    return "\n".join(lines) if lines else "  (no instrumented operations ran)"
+
+
+def profile_call(func: Callable[..., Any], *args: Any, limit: int = 10, **kwargs: Any) -> str:
+    """Runs func once under cProfile and returns the top limit functions by cumulative time as text"""
+    profiler: cProfile.Profile = cProfile.Profile()
+    profiler.runcall(func, *args, **kwargs)
+    output: io.StringIO = io.StringIO()
+    pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(limit)
+    return output.getvalue()
+
+
+### Wrappers
+def _count_calls(event: str) -> Callable[[Any], Callable[..., Any]]:
+    def make(original: Any) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            counters[event] += 1
+            return original(*args, **kwargs)
+        return wrapper
+    return make
+
+
+def _heap_swap(original: Any) -> Callable[..., Any]:
+    def wrapper(self: Any, index1: int, index2: int) -> None:
+        counters["Heap.swaps"] += 1
+        if _sift_swaps:
+            _sift_swaps[-1] += 1
+        original(self, index1, index2)
+    return wrapper
+
+
+def _heap_sift(metric: str) -> Callable[[Any], Callable[..., Any]]:
+    """Records how many levels (swaps) a sift moved the element"""
+    def make(original: Any) -> Callable[..., Any]:
+        def wrapper(self: Any, index: int) -> None:
+            _sift_swaps.append(0)
+            try:
+                original(self, index)
+            finally:
+                histograms[metric][_sift_swaps.pop()] += 1
+        return wrapper
+    return make
+
+
+def _bst_path(metric: str, counted: str | None = None) -> Callable[[Any], Callable[..., Any]]:
+    """Records the number of nodes the operation compared val with (last_path_length, counted by the tree during
+    its own descent, so AVL rotations and duplicates are seen exactly as the operation saw them).
+    counted names a method of the tree to run instead of the original, for operations that only count on request"""
+    def make(original: Any) -> Callable[..., Any]:
+        def wrapper(self: Any, val: int) -> Any:
+            # raises before counting for a None value
+            result: Any = original(self, val) if counted is None else getattr(self, counted)(val)
+            visited: int = self.last_path_length
+            counters["BinarySearchTree.comparisons"] += visited
+            histograms[metric][visited] += 1
+            return result
+        return wrapper
+    return make
+
+
+def _list_hops(structure: str) -> Callable[[Any], Callable[..., Any]]:
+    """get_value_at_index follows index next pointers from the first node"""
+    def make(original: Any) -> Callable[..., Any]:
+        def wrapper(self: Any, index: int) -> Any:
+            node: Any = original(self, index) # raises before counting for a bad index
+            counters[f"{structure}.hops"] += index
+            histograms[f"{structure}.hops_per_lookup"][index] += 1
+            return node
+        return wrapper
+    return make
+
+
+def _targets() -> list[tuple[Any, str, Callable[[Any], Callable[..., Any]]]]:
+    """(owner, attribute, wrapper factory) of everything enable() instruments.
+    Imported here so importing this module alone doesn't load every template"""
+    from templates import pairingHeap
+    from templates.binarySearchTree import BinarySearchTree, BSTNode
+    from templates.daryHeap import DaryHeap
+    from templates.doublyLinkedList import DoublyLinkedList, Node as DoublyNode
+    from templates.heap import Heap
+    from templates.linkedList import LinkedList, Node as ListNode
+
+    return [
+        (Heap, "_swap", _heap_swap), # IndexedHeap._swap calls this through super()
+        (Heap, "_heapify_up", _heap_sift("Heap.sift_up_depth")),
+        (Heap, "_heapify_down", _heap_sift("Heap.sift_down_depth")),
+        (DaryHeap, "_sift_up", _count_calls("DaryHeap.sift_ups")),
+        (DaryHeap, "_sift_down", _count_calls("DaryHeap.sift_downs")),
+        (pairingHeap.PairingNode, "__init__", _count_calls("PairingNode.allocations")),
+        (pairingHeap, "_meld_nodes", _count_calls("PairingHeap.melds")),
+        (BSTNode, "__init__", _count_calls("BSTNode.allocations")),
+        (BinarySearchTree, "_rotate_left", _count_calls("BinarySearchTree.rotations")),
+        (BinarySearchTree, "_rotate_right", _count_calls("BinarySearchTree.rotations")),
+        (BinarySearchTree, "search", _bst_path("BinarySearchTree.search_depth", counted="_counted_search")),
+        (BinarySearchTree, "insert", _bst_path("BinarySearchTree.insert_depth")),
+        (BinarySearchTree, "delete", _bst_path("BinarySearchTree.delete_depth")),
+        (ListNode, "__init__", _count_calls("LinkedList.Node.allocations")),
+        (LinkedList, "get_value_at_index", _list_hops("LinkedList")),
+        (DoublyNode, "__init__", _count_calls("DoublyLinkedList.Node.allocations")),
+        (DoublyLinkedList, "get_value_at_index", _list_hops("DoublyLinkedList")),
+    ]
+
+
+if os.environ.get(ENV_VAR, "") not in ("", "0"):
+    enable()
@@ -0,0 +1,153 @@
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+import csv
+import math
+import random
+
+from utils.benchmark_utils import Benchmark
+from utils.timing_utils import measure_stats
+"""
+   Empirical complexity: time a benchmark at geometrically growing sizes and fit the growth exponent.
+
+   If time ~ c * n^k then log(time) = log(c) + k * log(n), so k is the slope of a least squares line through the
+   points (log n, log time). Log factors show up as a little extra slope (log n alone measures ~0.1 to 0.15 over
+   a 10x size range), which is what the tolerance absorbs. A benchmark fails when
+        measured exponent > declared exponent + tolerance
+"""
+
+# polynomial degree of each declared complexity, log factors are left to the tolerance
+COMPLEXITY_EXPONENTS: dict[str, float] = {
+    "O(1)": 0.0,
+    "O(log n)": 0.0,
+    "O(n)": 1.0,
+    "O(n log n)": 1.0,
+    "O(n^2)": 2.0,
+}
+
+
+@dataclass
+class ScalingResult:
+    name: str
+    complexity: str
+    sizes: list[int]
+    times: list[float] # fastest repeat, seconds per call, at every size
+    exponent: float # fitted log-log slope
+    allowed: float # declared exponent + tolerance
+
+    @property
+    def passed(self) -> bool:
+        return self.exponent <= self.allowed
+
+
+def geometric_sizes(smallest: int, largest: int, factor: float = 2.0) -> list[int]:
+    """smallest, smallest * factor, smallest * factor^2, ... up to largest"""
+    sizes: list[int] = []
+    n: float = smallest
+    while round(n) <= largest:
+        sizes.append(round(n))
+        n *= factor
+    return sizes
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float:
+    """Least squares slope of log(time) against log(size)
+
+    Raises:
+        ValueError: with fewer than 2 distinct sizes
+    """
+    if len(set(sizes)) < 2:
+        raise ValueError("Need at least 2 distinct sizes to fit an exponent")
+    xs: list[float] = [math.log(n) for n in sizes]
+    ys: list[float] = [math.log(t) for t in times]
+    x_mean: float = sum(xs) / len(xs)
+    y_mean: float = sum(ys) / len(ys)
+    covariance: float = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    variance: float = sum((x - x_mean) ** 2 for x in xs)
+    return covariance / variance
+
+
+def run_scaling(benchmarks: Iterable[Benchmark], factor: float = 2.0, max_size: int | None = None,
+                tolerance: float = 0.3, seed: int = 0, repeat: int = 5, min_time: float = 0.02,
+                report: Callable[[ScalingResult], None] | None = None,
+                report_skip: Callable[[str, str], None] | None = None) -> list[ScalingResult]:
+    """Runs every benchmark that declares a complexity from its smallest to its largest registered size
+    (or max_size) in steps of factor, and fits the exponent.
+    A benchmark left with fewer than 2 sizes (max_size below its smallest size times factor) can't be fitted,
+    it is skipped and report_skip gets its name and the reason.
+
+    Raises:
+        ValueError: if a benchmark declares a complexity missing from COMPLEXITY_EXPONENTS
+    """
+    results: list[ScalingResult] = []
+    for benchmark in benchmarks:
+        if benchmark.complexity is None:
+            continue
+        if benchmark.complexity not in COMPLEXITY_EXPONENTS:
+            raise ValueError(f"{benchmark.name} declares unknown complexity {benchmark.complexity!r}, "
+                             f"use one of {', '.join(COMPLEXITY_EXPONENTS)}")
+        largest: int = max_size if max_size is not None else max(benchmark.sizes)
+        sizes: list[int] = geometric_sizes(min(benchmark.sizes), largest, factor)
+        if len(sizes) < 2:
+            if report_skip is not None:
+                report_skip(benchmark.name, f"smallest registered size {min(benchmark.sizes):,} leaves fewer than "
+                                            f"2 sizes up to {largest:,}")
+            continue
+        times: list[float] = []
+        for n in sizes:
+            timed = benchmark.make(n, random.Random(f"{seed}:{benchmark.name}:{n}"))
+            # the fastest repeat is the least disturbed by other processes, so it gives the steadiest fit
+            times.append(measure_stats(timed, repeat=repeat, min_time=min_time).min)
+        result = ScalingResult(name=benchmark.name, complexity=benchmark.complexity, sizes=sizes, times=times,
+                               exponent=fit_exponent(sizes, times),
+                               allowed=COMPLEXITY_EXPONENTS[benchmark.complexity] + tolerance)
+        results.append(result)
+        if report is not None:
+            report(result)
+    return results
+
+
+def format_scaling_result(result: ScalingResult) -> str:
+    status: str = "ok" if result.passed else "FAIL"
+    return (f"{result.name:<45} declared {result.complexity:<11} measured n^{result.exponent:.2f} "
+            f"(allowed n^{result.allowed:.2f}) {status}")
+
+
+def write_scaling_csv(results: Iterable[ScalingResult], path: str) -> None:
+    """One row per (benchmark, size) with the fit repeated on every row, easy to plot or load in a spreadsheet"""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "complexity", "size", "min_s", "exponent", "allowed", "passed"])
+        for r in results:
+            for n, t in zip(r.sizes, r.times):
+                writer.writerow([r.name, r.complexity, n, f"{t:.9g}", f"{r.exponent:.4f}", f"{r.allowed:.2f}", r.passed])
+
+
+def run_scaling_tests() -> None:
+    """A max_size below (or barely above) a benchmark's smallest size skips it instead of failing the whole run"""
+    def make(n: int, rng: random.Random) -> Callable[[], Any]:
+        values: list[int] = list(range(n))
+        return lambda: sum(values)
+
+    tests: list[tuple[tuple[int, ...], int | None, str]] = [
+        ((10_000, 100_000), 2_000, "skipped"), # max_size below the smallest registered size
+        ((1_000, 10_000), 1_500, "skipped"), # a single size fits below max_size
+        ((1_000, 10_000), 4_000, "fitted"),
+        ((1_000, 4_000), None, "fitted"),
+    ]
+    for index, (sizes, max_size, expected_out) in enumerate(tests):
+        benchmark: Benchmark = Benchmark(name=f"test.sum_{index}", make=make, sizes=sizes, complexity="O(n)")
+        skipped: list[str] = []
+        results: list[ScalingResult] = run_scaling([benchmark], max_size=max_size, repeat=1, min_time=0.0,
+                                                   report_skip=lambda name, reason: skipped.append(name))
+        out: str = "skipped" if skipped and not results else "fitted" if results and not skipped else "both"
+        if out == expected_out:
+            print(f"run_scaling test {index} passed ✅")
+        else:
+            print(f"run_scaling test {index} failed ❌")
+            print(f"sizes = {sizes}, max_size = {max_size}, expected output = {expected_out}, output = {out}")
+            print()
+
+
+if __name__ == "__main__":
+    run_scaling_tests()
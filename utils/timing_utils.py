@@ -1,11 +1,21 @@
 from collections.abc import Callable  # since Python 3.9
+from dataclasses import dataclass, field
 from typing import Any  
+import gc
+import math
+import os
+import statistics
 import timeit
+import tracemalloc
+
+from utils import instrumentation
 
 
 def measure_time(func: Callable[..., Any], *args: Any, **kwargs: Any) -> float:
     """Executes a function 5 times and returns its average execution time.
     Also prints the execution statement.
+    When instrumentation is on (see utils/instrumentation.py) the operation counters per call are printed as well,
+    and with DSA_PROFILE=1 the top functions of one extra profiled call.
     
     Args:
         func (Callable[..., Any]): Function to be measured.
@@ -21,8 +31,158 @@ def measure_time(func: Callable[..., Any], *args: Any, **kwargs: Any) -> float:
         return func(*args, **kwargs)
 
     repeat_count: int = 5
+    if instrumentation.is_enabled():
+        instrumentation.reset() # count only the timed calls
     execution_time: float = timeit.timeit(stmt=wrapper, number=repeat_count)
     average_time: float = execution_time / repeat_count
 
     print(f"Ran {func.__name__} for {repeat_count} times. Average Execution time = {average_time} seconds")
+    if instrumentation.is_enabled():
+        print(f"Operation counts per call of {func.__name__}:")
+        print(instrumentation.format_report(per=repeat_count))
+    if os.environ.get(instrumentation.PROFILE_ENV_VAR, "") not in ("", "0"):
+        print(instrumentation.profile_call(func, *args, **kwargs))
     return average_time
+
+
+@dataclass
+class TimingStats:
+    """Seconds per call of every repeat, see measure_stats"""
+    times: list[float]
+    number: int # calls per repeat, each entry of times is the total of one repeat divided by number
+    gc_disabled: bool = field(default=True)
+
+    @property
+    def min(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.times)
+
+    @property
+    def p95(self) -> float:
+        """95th percentile (nearest rank), the slowest repeat once there are fewer than 20"""
+        ordered: list[float] = sorted(self.times)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    @property
+    def stddev(self) -> float:
+        return statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Metrics in seconds, the format benchmark_utils writes to JSON"""
+        return {"min_s": self.min, "median_s": self.median, "mean_s": self.mean, "p95_s": self.p95,
+                "stddev_s": self.stddev, "repeat": len(self.times), "number": self.number}
+
+
+def measure_stats(func: Callable[..., Any], *args: Any, repeat: int = 7, min_time: float = 0.05, warmup: int = 1,
+                  disable_gc: bool = True, **kwargs: Any) -> TimingStats:
+    """measure_time with statistics: warms up, calibrates how many calls one repeat needs, then times repeats.
+
+    1. func is called warmup times untimed (imports, caches, lazy allocations)
+    2. one timed call estimates the cost, number = calls needed so a repeat lasts at least min_time
+       (fast functions are looped so the timer resolution doesn't matter)
+    3. repeat timed repeats of number calls each
+
+    Args:
+        func (Callable[..., Any]): Function to be measured.
+        *args (Any): Positional arguments to pass to the function.
+        repeat (int): number of timed repeats. Defaults to 7.
+        min_time (float): minimum seconds per repeat used for calibration. Defaults to 0.05.
+        warmup (int): untimed calls before measuring. Defaults to 1.
+        disable_gc (bool): keep the garbage collector off while timing (timeit's default). Defaults to True.
+        **kwargs (Any): Keyword arguments to pass to the function.
+
+    Returns:
+        TimingStats: seconds per call of every repeat
+    """
+    def wrapper() -> Any:
+        return func(*args, **kwargs)
+
+    # timeit turns the gc off while timing, the setup statement runs after that and can turn it back on
+    timer: timeit.Timer = timeit.Timer(stmt=wrapper, setup="pass" if disable_gc else "gc.enable()")
+    for _ in range(warmup):
+        wrapper()
+    estimate: float = timer.timeit(number=1)
+    number: int = max(1, math.ceil(min_time / estimate)) if estimate > 0 else 1000
+    times: list[float] = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return TimingStats(times=times, number=number, gc_disabled=disable_gc)
+
+
+@dataclass
+class MemoryStats:
+    """Memory used by one call, see measure_memory"""
+    peak_bytes: int # highest traced memory during the call, above what was traced before it
+    retained_bytes: int # memory still held by the result (and anything else the call kept alive) afterwards
+    allocations: int # memory blocks still allocated afterwards, i.e. objects (and buffers) the call created and kept
+    elements: int | None = field(default=None) # number of items the result holds, for bytes_per_element
+
+    @property
+    def bytes_per_element(self) -> float | None:
+        if not self.elements:
+            return None
+        return self.retained_bytes / self.elements
+
+    def as_dict(self) -> dict[str, float]:
+        """Metrics in bytes, the format benchmark_utils writes to JSON"""
+        metrics: dict[str, float] = {"peak_bytes": self.peak_bytes, "retained_bytes": self.retained_bytes,
+                                     "allocations": self.allocations}
+        if self.bytes_per_element is not None:
+            metrics["bytes_per_element"] = self.bytes_per_element
+            metrics["elements"] = self.elements # type: ignore[assignment]
+        return metrics
+
+
+def measure_memory(func: Callable[..., Any], *args: Any, elements: int | None = None, **kwargs: Any) -> MemoryStats:
+    """Runs func once under tracemalloc and reports its peak and retained memory.
+
+    The return value of func is kept alive until the measurement is done, so for a function that builds a
+    structure, retained_bytes is the size of that structure. Retained bytes and allocation counts come from
+    diffing the snapshots taken before and after the call (tracemalloc's own bookkeeping is filtered out).
+
+    Args:
+        func (Callable[..., Any]): Function to be measured.
+        *args (Any): Positional arguments to pass to the function.
+        elements (int | None): number of items the returned structure holds, to compute bytes_per_element.
+        **kwargs (Any): Keyword arguments to pass to the function.
+
+    Returns:
+        MemoryStats: peak, retained and per element bytes
+    """
+    gc.collect() # garbage from earlier code must not be freed during the call and hide real allocations
+    started: bool = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        before: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+        baseline: int = tracemalloc.get_traced_memory()[0] # includes the snapshot above
+        tracemalloc.reset_peak()
+        result: Any = func(*args, **kwargs)
+        gc.collect() # only count what the result really keeps alive
+        current, peak = tracemalloc.get_traced_memory()
+        after: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+        del result
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    ignore: list[tracemalloc.BaseFilter] = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    changes = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "filename")
+    return MemoryStats(peak_bytes=peak - baseline, retained_bytes=current - baseline,
+                       allocations=sum(change.count_diff for change in changes), elements=elements)
+
+
+def measure_report(func: Callable[..., Any], *args: Any, elements: int | None = None,
+                   **kwargs: Any) -> tuple[float, MemoryStats]:
+    """measure_time and measure_memory together, prints one combined report. Returns (seconds, memory)"""
+    seconds: float = measure_time(func, *args, **kwargs)
+    memory: MemoryStats = measure_memory(func, *args, elements=elements, **kwargs)
+    per_element: str = f", {memory.bytes_per_element:.1f} bytes/element" if memory.bytes_per_element is not None else ""
+    print(f"Memory of {func.__name__}: peak = {memory.peak_bytes:,} bytes, retained = {memory.retained_bytes:,} bytes, "
+          f"allocations = {memory.allocations:,}{per_element}")
+    return seconds, memory